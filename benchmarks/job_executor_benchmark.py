@@ -0,0 +1,97 @@
+"""
+Compares a ThreadPoolJobExecutor against starting a new thread for every job (the worker's old behaviour).
+
+Every mode runs in a fresh process so that the peak RSS of one mode does not leak into the next.
+
+Usage:
+    python -m benchmarks.job_executor_benchmark --jobs 20000 --work-ms 1 --max-workers 100
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict
+
+from benchmarks.utils import peak_rss_kb, run_in_spawned_process
+from pyzeebe.job.job import Job
+from pyzeebe.task.task import Task
+from pyzeebe.worker.job_executor import JobExecutor, ThreadPoolJobExecutor
+
+
+class ThreadPerJobExecutor(JobExecutor):
+    """Starts a new thread for every job, like ZeebeWorker did before job executors existed"""
+
+    def submit(self, task: Task, job: Job) -> Future:
+        future = Future()
+
+        def run():
+            future.set_result(task.handler(job))
+
+        threading.Thread(target=run, name=f"ZeebeWorker-Job-{job.type}").start()
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def create_job(key: int) -> Job:
+    return Job(key=key, _type="benchmark", workflow_instance_key=key, bpmn_process_id="benchmark",
+               workflow_definition_version=1, workflow_key=1, element_id="benchmark", element_instance_key=key,
+               custom_headers={}, worker="benchmark", retries=3, deadline=0, variables={"x": key})
+
+
+def run_mode(mode: str, jobs: int, work_ms: float, max_workers: int) -> Dict:
+    done = threading.Semaphore(0)
+    peak_threads = 0
+
+    def handler(job: Job) -> Job:
+        time.sleep(work_ms / 1000)
+        done.release()
+        return job
+
+    task = Task(task_type="benchmark", task_handler=handler, exception_handler=lambda e, job: None,
+                max_jobs_to_activate=jobs)
+    task.handler = handler
+
+    if mode == "thread-per-job":
+        executor = ThreadPerJobExecutor()
+    else:
+        executor = ThreadPoolJobExecutor(max_workers=max_workers)
+
+    start = time.perf_counter()
+    for key in range(jobs):
+        executor.submit(task, create_job(key))
+        peak_threads = max(peak_threads, threading.active_count())
+    for _ in range(jobs):
+        done.acquire()
+    elapsed = time.perf_counter() - start
+    executor.shutdown(wait=True)
+
+    return {"mode": mode, "jobs": jobs, "work_ms": work_ms, "seconds": elapsed, "jobs_per_sec": jobs / elapsed,
+            "peak_threads": peak_threads, "peak_rss_kb": peak_rss_kb()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20000, help="Number of jobs to run per mode")
+    parser.add_argument("--work-ms", type=float, default=1, help="Time every job spends sleeping (simulated I/O)")
+    parser.add_argument("--max-workers", type=int, default=100, help="Size of the thread pool")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [run_in_spawned_process(run_mode, mode, args.jobs, args.work_ms, args.max_workers)
+               for mode in ("thread-per-job", "thread-pool")]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<16}{'jobs/sec':>12}{'peak threads':>14}{'peak RSS (KB)':>16}")
+    for result in results:
+        print(f"{result['mode']:<16}{result['jobs_per_sec']:>12.0f}{result['peak_threads']:>14}"
+              f"{result['peak_rss_kb']:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures how much memory a worker holds per in-flight job.
+
+Jobs are created from ActivateJobs responses the same way the job adapter does, and kept alive like in-flight jobs.
+Reported per payload size: the bytes allocated per job (measured with tracemalloc) while its variables are untouched
+and after they were read. Every run happens in a fresh process.
+
+Usage:
+    python -m benchmarks.job_memory_benchmark --jobs 20000 --payload-kb 0 1 10 --output results.json
+    python -m benchmarks.job_memory_benchmark --compare results.json  # Compare with the results of an earlier commit
+"""
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from typing import Dict, List
+
+import grpc
+from zeebe_grpc.gateway_pb2 import ActivatedJob
+
+from benchmarks.utils import git_commit, run_in_spawned_process
+from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
+
+
+def create_raw_jobs(jobs: int, payload_kb: int) -> List[ActivatedJob]:
+    payload = "x" * (payload_kb * 1024)
+    raw_jobs = []
+    for key in range(jobs):
+        raw_job = ActivatedJob(key=key, type="benchmark", workflowInstanceKey=key, bpmnProcessId="benchmark",
+                               workflowDefinitionVersion=1, workflowKey=1, elementId="benchmark",
+                               elementInstanceKey=key, customHeaders='{"header": "value"}', worker="benchmark",
+                               retries=3, deadline=0,
+                               variables=json.dumps({"orderId": f"order-{key}", "payload": payload}))
+        # Parsed from bytes like jobs received from zeebe, so no two jobs share a string
+        raw_jobs.append(ActivatedJob.FromString(raw_job.SerializeToString()))
+    return raw_jobs
+
+
+def run_scenario(jobs: int, payload_kb: int) -> Dict:
+    adapter = ZeebeAdapter(channel=grpc.insecure_channel("localhost:1"))
+    raw_jobs = create_raw_jobs(jobs, payload_kb)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    in_flight_jobs = [adapter._create_job_from_raw_job(raw_job) for raw_job in raw_jobs]
+    untouched = tracemalloc.get_traced_memory()[0] - before
+    for job in in_flight_jobs:
+        # Reading them decodes lazily decoded variables and headers
+        _ = job.variables, job.custom_headers
+    decoded = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return {
+        "jobs": jobs,
+        "payload_kb": payload_kb,
+        "bytes_per_untouched_job": untouched / jobs,
+        "bytes_per_decoded_job": decoded / jobs
+    }
+
+
+def print_results(results: List[Dict], baseline: Dict[int, Dict] = None) -> None:
+    header = f"{'payload KB':>10}{'untouched B/job':>17}{'decoded B/job':>15}"
+    if baseline is not None:
+        header += f"{'untouched vs baseline':>23}{'decoded vs baseline':>21}"
+    print(header)
+    for result in results:
+        line = f"{result['payload_kb']:>10}{result['bytes_per_untouched_job']:>17.0f}{result['bytes_per_decoded_job']:>15.0f}"
+        baseline_result = (baseline or {}).get(result["payload_kb"])
+        if baseline_result:
+            untouched_change = result["bytes_per_untouched_job"] / baseline_result["bytes_per_untouched_job"] - 1
+            decoded_change = result["bytes_per_decoded_job"] / baseline_result["bytes_per_decoded_job"] - 1
+            line += f"{untouched_change:>+23.1%}{decoded_change:>+21.1%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20000, help="Number of in-flight jobs per run")
+    parser.add_argument("--payload-kb", type=int, nargs="+", default=[0, 1, 10], help="Sizes of the job variables")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of earlier results to compare with")
+    args = parser.parse_args()
+
+    results = [run_in_spawned_process(run_scenario, args.jobs, payload_kb) for payload_kb in args.payload_kb]
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = {result["payload_kb"]: result for result in json.load(file)["results"]}
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"commit": git_commit(), "python": platform.python_version(), "timestamp": time.time(),
+                       "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
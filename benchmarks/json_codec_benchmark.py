@@ -0,0 +1,118 @@
+"""
+Compares the installed JSON codecs on job variables of realistic shape and size: lists of nested records with strings,
+numbers, booleans and nulls, the way workflow variables usually look.
+
+Reported per codec and payload size: dumps and loads per second, throughput in MB/s and the speedup over the standard
+library's json module.
+
+Usage:
+    python -m benchmarks.json_codec_benchmark --payload-kb 50 100 500 --duration 1 --output results.json
+"""
+import argparse
+import json
+import platform
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.utils import git_commit
+from pyzeebe.grpc_internals.json_codec import JsonCodec, MsgspecJsonCodec, OrjsonCodec, StdlibJsonCodec, UjsonCodec
+
+
+def installed_codecs() -> List[JsonCodec]:
+    codecs = []
+    for codec_class in (StdlibJsonCodec, OrjsonCodec, MsgspecJsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"Skipping {codec_class.__name__}, its library is not installed")
+    return codecs
+
+
+def create_record(index: int, rng: random.Random) -> Dict:
+    return {
+        "id": f"order-{index:08d}",
+        "customer": {"name": f"Customer {rng.randint(0, 10 ** 6)}", "email": f"user{index}@example.com",
+                     "address": {"street": "Hauptstraße 1", "city": "München", "zip": f"{rng.randint(0, 99999):05d}"}},
+        "items": [{"sku": f"SKU-{rng.randint(0, 10 ** 5)}", "quantity": rng.randint(1, 10),
+                   "price": round(rng.uniform(1, 500), 2), "gift": rng.random() < 0.1}
+                  for _ in range(rng.randint(1, 5))],
+        "total": round(rng.uniform(1, 5000), 2),
+        "paid": rng.random() < 0.8,
+        "coupon": None if rng.random() < 0.7 else f"SAVE{rng.randint(5, 50)}",
+        "tags": rng.sample(["express", "fragile", "international", "priority", "return"], 2)
+    }
+
+
+def create_payload(payload_kb: int, seed: int = 0) -> Dict:
+    rng = random.Random(seed)
+    records = []
+    size = 0
+    while size < payload_kb * 1024:
+        record = create_record(len(records), rng)
+        records.append(record)
+        size += len(json.dumps(record))
+    return {"orders": records, "batch_id": "batch-1", "region": "eu"}
+
+
+def measure(operation: Callable[[], Any], duration: float) -> float:
+    """Returns operations per second"""
+    operation()  # Warm up
+    count = 0
+    start = time.perf_counter()
+    while True:
+        operation()
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return count / elapsed
+
+
+def run_benchmark(payload_kbs: List[int], duration: float) -> List[Dict]:
+    codecs = installed_codecs()
+    results = []
+    for payload_kb in payload_kbs:
+        payload = create_payload(payload_kb)
+        encoded = json.dumps(payload)
+        size_mb = len(encoded.encode()) / 1024 / 1024
+        for codec in codecs:
+            assert codec.loads(codec.dumps(payload)) == payload
+            dumps_per_sec = measure(lambda: codec.dumps(payload), duration)
+            loads_per_sec = measure(lambda: codec.loads(encoded), duration)
+            results.append({"codec": codec.name, "payload_kb": payload_kb, "dumps_per_sec": dumps_per_sec,
+                            "loads_per_sec": loads_per_sec, "dumps_mb_per_sec": dumps_per_sec * size_mb,
+                            "loads_mb_per_sec": loads_per_sec * size_mb})
+    return results
+
+
+def print_results(results: List[Dict]) -> None:
+    stdlib = {result["payload_kb"]: result for result in results if result["codec"] == StdlibJsonCodec.name}
+    print(f"{'codec':>8}{'payload KB':>12}{'dumps/sec':>11}{'MB/s':>8}{'speedup':>9}"
+          f"{'loads/sec':>11}{'MB/s':>8}{'speedup':>9}")
+    for result in results:
+        baseline = stdlib[result["payload_kb"]]
+        print(f"{result['codec']:>8}{result['payload_kb']:>12}"
+              f"{result['dumps_per_sec']:>11.0f}{result['dumps_mb_per_sec']:>8.0f}"
+              f"{result['dumps_per_sec'] / baseline['dumps_per_sec']:>8.1f}x"
+              f"{result['loads_per_sec']:>11.0f}{result['loads_mb_per_sec']:>8.0f}"
+              f"{result['loads_per_sec'] / baseline['loads_per_sec']:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payload-kb", type=int, nargs="+", default=[50, 100, 500], help="Sizes of the variables")
+    parser.add_argument("--duration", type=float, default=1, help="Seconds to measure each operation")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.payload_kb, args.duration)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"commit": git_commit(), "python": platform.python_version(), "timestamp": time.time(),
+                       "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
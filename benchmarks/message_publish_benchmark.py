@@ -0,0 +1,123 @@
+"""
+Compares publishing messages one blocking call at a time (ZeebeClient.publish_message) with the windowed bulk
+publisher (ZeebeClient.publish_messages_bulk) against an in-process fake gateway.
+
+The gateway waits --latency-ms per PublishMessage call to stand in for the network and broker round trip, which is
+what the bulk publisher hides by keeping calls in flight. Reported per run: messages/sec and the speedup over the
+sequential path. Every run happens in a fresh process.
+
+Usage:
+    python -m benchmarks.message_publish_benchmark --messages 2000 --latency-ms 1 5 --window 10 100 \\
+        --output results.json
+"""
+import argparse
+import itertools
+import json
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, List
+
+import grpc
+from zeebe_grpc.gateway_pb2 import PublishMessageResponse
+from zeebe_grpc.gateway_pb2_grpc import add_GatewayServicer_to_server
+
+from benchmarks.utils import git_commit, run_in_spawned_process
+from pyzeebe import MessageStatus, ZeebeClient
+from tests.unit.utils.gateway_mock import GatewayMock
+
+SEQUENTIAL = 0
+
+
+class BenchmarkGateway(GatewayMock):
+    """
+    GatewayMock that takes latency seconds per PublishMessage call and counts the published messages
+    """
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.published = 0
+        self._lock = Lock()
+
+    def PublishMessage(self, request, context):
+        time.sleep(self.latency)
+        with self._lock:
+            if request.messageId and request.messageId in self.messages:
+                context.set_code(grpc.StatusCode.ALREADY_EXISTS)
+                return PublishMessageResponse()
+            self.messages[request.messageId] = request.correlationKey
+            self.published += 1
+        return PublishMessageResponse()
+
+
+def create_messages(messages: int) -> List[Dict]:
+    return [{"name": "benchmark", "correlation_key": f"order-{index}", "message_id": f"event-{index}",
+             "variables": {"index": index}}
+            for index in range(messages)]
+
+
+def run_scenario(messages: int, latency_ms: float, window: int) -> Dict:
+    gateway = BenchmarkGateway(latency_ms / 1000)
+    server = grpc.server(ThreadPoolExecutor(max_workers=max(16, window)))
+    add_GatewayServicer_to_server(gateway, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    client = ZeebeClient(hostname="localhost", port=port)
+
+    failed = 0
+    start = time.perf_counter()
+    if window == SEQUENTIAL:
+        for message in create_messages(messages):
+            client.publish_message(**message)
+    else:
+        for result in client.publish_messages_bulk(create_messages(messages), max_in_flight=window):
+            if not result.succeeded or result.result != MessageStatus.Published:
+                failed += 1
+    elapsed = time.perf_counter() - start
+    server.stop(grace=None)
+
+    return {
+        "messages": messages,
+        "latency_ms": latency_ms,
+        "window": window,
+        "published": gateway.published,
+        "failed": failed,
+        "seconds": elapsed,
+        "messages_per_sec": gateway.published / elapsed
+    }
+
+
+def print_results(results: List[Dict]) -> None:
+    sequential = {result["latency_ms"]: result for result in results if result["window"] == SEQUENTIAL}
+    print(f"{'latency ms':>10}{'publisher':>12}{'msgs/sec':>10}{'failed':>8}{'speedup':>9}")
+    for result in results:
+        publisher = "sequential" if result["window"] == SEQUENTIAL else f"bulk {result['window']}"
+        speedup = result["messages_per_sec"] / sequential[result["latency_ms"]]["messages_per_sec"]
+        print(f"{result['latency_ms']:>10}{publisher:>12}{result['messages_per_sec']:>10.0f}{result['failed']:>8}"
+              f"{speedup:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="Number of messages per run")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[1, 5],
+                        help="Milliseconds the gateway takes per PublishMessage call")
+    parser.add_argument("--window", type=int, nargs="+", default=[10, 100],
+                        help="Values of publish_messages_bulk's max_in_flight")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = [run_in_spawned_process(run_scenario, args.messages, latency_ms, window)
+               for latency_ms, window in itertools.product(args.latency_ms, [SEQUENTIAL] + args.window)]
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"commit": git_commit(), "python": platform.python_version(), "timestamp": time.time(),
+                       "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
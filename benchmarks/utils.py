@@ -0,0 +1,56 @@
+import multiprocessing
+import resource
+import subprocess
+import threading
+from typing import Callable, Dict, Optional
+
+
+def run_in_spawned_process(target: Callable[..., Dict], *args) -> Dict:
+    """
+    Run a benchmark in a fresh process, so that the threads and peak RSS of one run don't leak into the next.
+    target has to be a module level function and its result has to be picklable.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_put_result, args=(results, target) + args)
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def _put_result(results: multiprocessing.Queue, target: Callable[..., Dict], *args) -> None:
+    results.put(target(*args))
+
+
+def peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class ThreadCountSampler(object):
+    """Samples the amount of running threads in the background and keeps the peak"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak_threads = threading.active_count()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="ThreadCountSampler")
+
+    def __enter__(self) -> "ThreadCountSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _sample(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.peak_threads = max(self.peak_threads, threading.active_count())
@@ -0,0 +1,200 @@
+"""
+Runs a ZeebeWorker against an in-process fake gateway and measures its hot path: activating, running and completing
+jobs.
+
+For every combination of payload size, task count and concurrency the worker works through a fixed amount of jobs.
+Reported per run: jobs/sec, p50/p99 latency from activation to completion (measured by the gateway), peak threads and
+peak RSS. Every run happens in a fresh process.
+
+Usage:
+    python -m benchmarks.worker_benchmark --jobs 2000 --payload-kb 1 100 --tasks 1 10 --concurrency 10 100 \\
+        --output results.json
+    python -m benchmarks.worker_benchmark --compare results.json  # Compare with the results of an earlier commit
+"""
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from typing import Dict, List
+
+import grpc
+from zeebe_grpc.gateway_pb2 import ActivateJobsResponse, ActivatedJob, CompleteJobResponse
+from zeebe_grpc.gateway_pb2_grpc import add_GatewayServicer_to_server
+
+from benchmarks.utils import ThreadCountSampler, git_commit, peak_rss_kb, run_in_spawned_process
+from pyzeebe import ZeebeWorker
+from pyzeebe.job.job import Job
+from pyzeebe.job.job_status import JobStatus
+from tests.unit.utils.gateway_mock import GatewayMock
+
+
+class BenchmarkGateway(GatewayMock):
+    """
+    GatewayMock that hands out every job only once (at most maxJobsToActivate per request) and records when each job
+    was activated and completed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = Lock()
+        self._pending_jobs: Dict[str, deque] = {}
+        self.activated_at: Dict[int, float] = {}
+        self.completed_at: Dict[int, float] = {}
+        self.all_completed = Event()
+        self._expected_jobs = 0
+
+    def add_jobs(self, jobs: List[Job]) -> None:
+        for job in jobs:
+            self.active_jobs[job.key] = job
+            self._pending_jobs.setdefault(job.type, deque()).append(job)
+        self._expected_jobs += len(jobs)
+
+    def ActivateJobs(self, request, context):
+        with self._lock:
+            pending_jobs = self._pending_jobs.get(request.type, deque())
+            jobs = [pending_jobs.popleft() for _ in range(min(request.maxJobsToActivate, len(pending_jobs)))]
+            now = time.perf_counter()
+            for job in jobs:
+                self.activated_at[job.key] = now
+        yield ActivateJobsResponse(jobs=[self._to_activated_job(job) for job in jobs])
+
+    def CompleteJob(self, request, context):
+        with self._lock:
+            job = self.active_jobs.get(request.jobKey)
+            if job is None or job.status != JobStatus.Running:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                return CompleteJobResponse()
+            job.status = JobStatus.Completed
+            self.completed_at[job.key] = time.perf_counter()
+            if len(self.completed_at) == self._expected_jobs:
+                self.all_completed.set()
+        return CompleteJobResponse()
+
+    @staticmethod
+    def _to_activated_job(job: Job) -> ActivatedJob:
+        return ActivatedJob(key=job.key, type=job.type, workflowInstanceKey=job.workflow_instance_key,
+                            bpmnProcessId=job.bpmn_process_id,
+                            workflowDefinitionVersion=job.workflow_definition_version, workflowKey=job.workflow_key,
+                            elementId=job.element_id, elementInstanceKey=job.element_instance_key,
+                            customHeaders=json.dumps(job.custom_headers), worker=job.worker, retries=job.retries,
+                            deadline=job.deadline, variables=json.dumps(job.variables))
+
+
+def create_jobs(task_types: List[str], jobs: int, payload_kb: int) -> List[Job]:
+    payload = "x" * (payload_kb * 1024)
+    return [Job(key=key, _type=task_types[key % len(task_types)], workflow_instance_key=key,
+                bpmn_process_id="benchmark", workflow_definition_version=1, workflow_key=1, element_id="benchmark",
+                element_instance_key=key, custom_headers={}, worker="benchmark", retries=3, deadline=0,
+                variables={"payload": payload})
+            for key in range(jobs)]
+
+
+def benchmark_task(payload: str) -> Dict:
+    return {"payload_length": len(payload)}
+
+
+def percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def run_scenario(jobs: int, payload_kb: int, tasks: int, concurrency: int, timeout: float) -> Dict:
+    gateway = BenchmarkGateway()
+    task_types = [f"benchmark-{index}" for index in range(tasks)]
+    gateway.add_jobs(create_jobs(task_types, jobs, payload_kb))
+
+    server = grpc.server(ThreadPoolExecutor(max_workers=16),
+                         options=[("grpc.max_send_message_length", -1), ("grpc.max_receive_message_length", -1)])
+    add_GatewayServicer_to_server(gateway, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    worker = ZeebeWorker(hostname="localhost", port=port, max_concurrent_jobs=concurrency, idle_poll_interval=0.01,
+                         max_poll_interval=0.1)
+    for task_type in task_types:
+        worker.task(task_type, max_jobs_to_activate=max(1, concurrency // tasks))(benchmark_task)
+
+    with ThreadCountSampler() as thread_sampler:
+        start = time.perf_counter()
+        worker.work()
+        finished = gateway.all_completed.wait(timeout)
+        elapsed = time.perf_counter() - start
+        worker.stop(wait=True)
+    server.stop(grace=None)
+
+    latencies_ms = [(gateway.completed_at[key] - gateway.activated_at[key]) * 1000 for key in gateway.completed_at]
+    return {
+        "jobs": jobs,
+        "payload_kb": payload_kb,
+        "tasks": tasks,
+        "concurrency": concurrency,
+        "completed_jobs": len(gateway.completed_at),
+        "timed_out": not finished,
+        "seconds": elapsed,
+        "jobs_per_sec": len(gateway.completed_at) / elapsed,
+        "latency_p50_ms": percentile(latencies_ms, 50) if latencies_ms else None,
+        "latency_p99_ms": percentile(latencies_ms, 99) if latencies_ms else None,
+        "latency_mean_ms": statistics.mean(latencies_ms) if latencies_ms else None,
+        "peak_threads": thread_sampler.peak_threads,
+        "peak_rss_kb": peak_rss_kb()
+    }
+
+
+def scenario_key(result: Dict) -> tuple:
+    return result["payload_kb"], result["tasks"], result["concurrency"]
+
+
+def print_results(results: List[Dict], baseline: Dict[tuple, Dict] = None) -> None:
+    header = f"{'payload KB':>10}{'tasks':>7}{'concurrency':>13}{'jobs/sec':>10}{'p50 ms':>9}{'p99 ms':>9}" \
+             f"{'threads':>9}{'RSS KB':>10}"
+    if baseline is not None:
+        header += f"{'vs baseline':>13}"
+    print(header)
+    for result in results:
+        line = f"{result['payload_kb']:>10}{result['tasks']:>7}{result['concurrency']:>13}" \
+               f"{result['jobs_per_sec']:>10.0f}{result['latency_p50_ms'] or 0:>9.1f}" \
+               f"{result['latency_p99_ms'] or 0:>9.1f}{result['peak_threads']:>9}{result['peak_rss_kb']:>10}"
+        if result["timed_out"]:
+            line += " (timed out)"
+        if baseline is not None:
+            baseline_result = baseline.get(scenario_key(result))
+            if baseline_result:
+                change = result["jobs_per_sec"] / baseline_result["jobs_per_sec"] - 1
+                line += f"{change:>+13.1%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=2000, help="Number of jobs per run")
+    parser.add_argument("--payload-kb", type=int, nargs="+", default=[1, 100], help="Sizes of the job variables")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1, 10], help="Numbers of task types")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100],
+                        help="Values of the worker's max_concurrent_jobs")
+    parser.add_argument("--timeout", type=float, default=120, help="Maximum seconds per run")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of earlier results to compare jobs/sec with")
+    args = parser.parse_args()
+
+    results = [run_in_spawned_process(run_scenario, args.jobs, payload_kb, tasks, concurrency, args.timeout)
+               for payload_kb, tasks, concurrency in itertools.product(args.payload_kb, args.tasks, args.concurrency)]
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = {scenario_key(result): result for result in json.load(file)["results"]}
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"commit": git_commit(), "python": platform.python_version(), "timestamp": time.time(),
+                       "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
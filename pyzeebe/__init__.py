@@ -1,12 +1,24 @@
 __version__ = "2.3.1"
 
 from pyzeebe import exceptions
+from pyzeebe.client.async_client import AsyncZeebeClient
+from pyzeebe.client.bulk import BulkResult, MessageStatus
 from pyzeebe.client.client import ZeebeClient
 from pyzeebe.credentials.camunda_cloud_credentials import CamundaCloudCredentials
 from pyzeebe.credentials.oauth_credentials import OAuthCredentials
+from pyzeebe.grpc_internals.json_codec import JsonCodec, MsgspecJsonCodec, OrjsonCodec, StdlibJsonCodec, UjsonCodec, \
+    get_json_codec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
 from pyzeebe.job.job import Job
+from pyzeebe.job.job_context import get_current_job
 from pyzeebe.job.job_status import JobStatus
+from pyzeebe.metrics.metrics import Metrics, PrometheusMetrics
 from pyzeebe.task.exception_handler import ExceptionHandler
 from pyzeebe.task.task_decorator import TaskDecorator
+from pyzeebe.tracing.tracing import OpenTelemetryTracing, Tracing
+from pyzeebe.worker.async_worker import AsyncZeebeWorker
+from pyzeebe.worker.job_executor import JobExecutor, ThreadPoolJobExecutor
+from pyzeebe.worker.job_logger import StructuredLogFormatter
+from pyzeebe.worker.supervisor import ZeebeWorkerSupervisor
 from pyzeebe.worker.task_router import ZeebeTaskRouter
 from pyzeebe.worker.worker import ZeebeWorker
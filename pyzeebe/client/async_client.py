@@ -0,0 +1,184 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import grpc
+
+from pyzeebe.credentials.base_credentials import BaseCredentials
+from pyzeebe.grpc_internals.async_zeebe_adapter import AsyncZeebeAdapter
+from pyzeebe.grpc_internals.json_codec import JsonCodec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+from pyzeebe.metrics.metrics import Metrics
+from pyzeebe.tracing.tracing import Tracing
+
+
+class AsyncZeebeClient(object):
+    """
+    An asyncio version of :py:class:`ZeebeClient`, built on grpc.aio. It has the same methods (as coroutines) and
+    raises the same exceptions.
+
+    All calls share one grpc channel, so many calls can run at the same time without a thread per call. Use the
+    client from one event loop only, the channel is created in the loop of the first call.
+    """
+
+    def __init__(self, hostname: str = None, port: int = None, credentials: BaseCredentials = None,
+                 channel: grpc.aio.Channel = None, secure_connection: bool = False, max_connection_retries: int = 10,
+                 retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None,
+                 json_codec: JsonCodec = None, metrics: Metrics = None, tracing: Tracing = None,
+                 max_concurrent_requests: int = 1000):
+        """
+        Args:
+            hostname (str): Zeebe instance hostname
+            port (int): Port of the zeebe
+            max_connection_retries (int): Amount of connection retries before client gives up on connecting to zeebe. To setup with infinite retries use -1
+            retry_policy (RetryPolicy): Retry policy of calls to zeebe. Default: None (calls are not retried)
+            rate_limits (Dict[str, float]): Maximum calls per second by RPC name, e.g. {"CreateWorkflowInstance": 1000}. Default: None (no limits)
+            json_codec (JsonCodec): Codec of workflow and message variables, e.g. get_json_codec() for the fastest installed one. Default: StdlibJsonCodec
+            metrics (Metrics): Receives the duration and status code of every call to zeebe, e.g. PrometheusMetrics(). Default: None (not measured)
+            tracing (Tracing): Traces every call to zeebe and propagates the trace context to the created workflow instances, e.g. OpenTelemetryTracing(). Default: None (not traced)
+            max_concurrent_requests (int): Maximum calls to zeebe in flight at the same time, further calls wait for a free slot. Default: 1000
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        self.zeebe_adapter = AsyncZeebeAdapter(hostname=hostname, port=port, credentials=credentials,
+                                               channel=channel, secure_connection=secure_connection,
+                                               max_connection_retries=max_connection_retries,
+                                               retry_policy=retry_policy, rate_limits=rate_limits,
+                                               json_codec=json_codec, metrics=metrics, tracing=tracing)
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncZeebeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the grpc channel
+        """
+        await self.zeebe_adapter.close()
+
+    @property
+    def _slots(self) -> asyncio.Semaphore:
+        # Created on first use, so it belongs to the loop the client is used in
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._request_slots
+
+    async def run_workflow(self, bpmn_process_id: str, variables: Dict = None, version: int = -1) -> int:
+        """
+        Run workflow
+
+        Args:
+            bpmn_process_id (str): The unique process id of the workflow.
+            variables (dict): A dictionary containing all the starting variables the workflow needs. Must be JSONable.
+            version (int): The version of the workflow. Default: -1 (latest)
+
+        Returns:
+            int: workflow_instance_key, the unique id of the running workflow generated by Zeebe.
+
+        Raises:
+            WorkflowNotFound: No workflow with bpmn_process_id exists
+            InvalidJSON: variables is not JSONable
+            WorkflowHasNoStartEvent: The specified workflow does not have a start event
+            ZeebeBackPressure: If Zeebe is currently in back pressure (too many requests)
+            ZeebeGatewayUnavailable: If the Zeebe gateway is unavailable
+            ZeebeInternalError: If Zeebe experiences an internal error
+
+        """
+        async with self._slots:
+            return await self.zeebe_adapter.create_workflow_instance(bpmn_process_id=bpmn_process_id,
+                                                                     variables=variables or {}, version=version)
+
+    async def run_workflow_with_result(self, bpmn_process_id: str, variables: Dict = None, version: int = -1,
+                                       timeout: int = 0, variables_to_fetch: List[str] = None) -> Dict:
+        """
+        Run workflow and wait for the result.
+
+        Args:
+            bpmn_process_id (str): The unique process id of the workflow.
+            variables (dict): A dictionary containing all the starting variables the workflow needs. Must be JSONable.
+            version (int): The version of the workflow. Default: -1 (latest)
+            timeout (int): How long to wait until a timeout occurs. Default: 0 (Zeebe default timeout)
+            variables_to_fetch (List[str]): Which variables to get from the finished workflow
+
+        Returns:
+            dict: A dictionary of the end state of the workflow instance
+
+        Raises:
+            WorkflowNotFound: No workflow with bpmn_process_id exists
+            InvalidJSON: variables is not JSONable
+            WorkflowHasNoStartEvent: The specified workflow does not have a start event
+            ZeebeBackPressure: If Zeebe is currently in back pressure (too many requests)
+            ZeebeGatewayUnavailable: If the Zeebe gateway is unavailable
+            ZeebeInternalError: If Zeebe experiences an internal error
+
+        """
+        async with self._slots:
+            return await self.zeebe_adapter.create_workflow_instance_with_result(
+                bpmn_process_id=bpmn_process_id, variables=variables or {}, version=version, timeout=timeout,
+                variables_to_fetch=variables_to_fetch or [])
+
+    async def cancel_workflow_instance(self, workflow_instance_key: int) -> int:
+        """
+        Cancel a running workflow instance
+
+        Args:
+            workflow_instance_key (int): The key of the running workflow to cancel
+
+        Returns:
+            int: The workflow_instance_key
+
+        Raises:
+            WorkflowInstanceNotFound: If no workflow instance with workflow_instance_key exists
+            ZeebeBackPressure: If Zeebe is currently in back pressure (too many requests)
+            ZeebeGatewayUnavailable: If the Zeebe gateway is unavailable
+            ZeebeInternalError: If Zeebe experiences an internal error
+
+        """
+        async with self._slots:
+            await self.zeebe_adapter.cancel_workflow_instance(workflow_instance_key=workflow_instance_key)
+        return workflow_instance_key
+
+    async def deploy_workflow(self, *workflow_file_path: str) -> None:
+        """
+        Deploy one or more workflows
+
+        Args:
+            workflow_file_path (str): The file path to a workflow definition file (bpmn/yaml)
+
+        Raises:
+            WorkflowInvalid: If one of the workflow file definitions is invalid
+            ZeebeBackPressure: If Zeebe is currently in back pressure (too many requests)
+            ZeebeGatewayUnavailable: If the Zeebe gateway is unavailable
+            ZeebeInternalError: If Zeebe experiences an internal error
+
+        """
+        async with self._slots:
+            await self.zeebe_adapter.deploy_workflow(*workflow_file_path)
+
+    async def publish_message(self, name: str, correlation_key: str, variables: Dict = None,
+                              time_to_live_in_milliseconds: int = 60000, message_id: str = None) -> None:
+        """
+        Publish a message
+
+        Args:
+            name (str): The message name
+            correlation_key (str): The correlation key. For more info: https://docs.zeebe.io/glossary.html?highlight=correlation#correlation-key
+            variables (dict): The variables the message should contain.
+            time_to_live_in_milliseconds (int): How long this message should stay active. Default: 60000 ms (60 seconds)
+            message_id (str): A unique message id. Useful for avoiding duplication. If a message with this id is still
+                                active, a MessageAlreadyExists will be raised.
+
+        Raises:
+            MessageAlreadyExist: If a message with message_id already exists
+            ZeebeBackPressure: If Zeebe is currently in back pressure (too many requests)
+            ZeebeGatewayUnavailable: If the Zeebe gateway is unavailable
+            ZeebeInternalError: If Zeebe experiences an internal error
+
+        """
+        async with self._slots:
+            await self.zeebe_adapter.publish_message(name=name, correlation_key=correlation_key,
+                                                     time_to_live_in_milliseconds=time_to_live_in_milliseconds,
+                                                     variables=variables or {}, message_id=message_id)
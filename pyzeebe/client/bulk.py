@@ -0,0 +1,241 @@
+import heapq
+import queue
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from pyzeebe.exceptions import MessageAlreadyExists, ZeebeBackPressure
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+
+
+class MessageStatus(Enum):
+    Published = "Published"
+    # Zeebe already has a message with the same message_id
+    AlreadyExists = "AlreadyExists"
+    # An earlier message of the same bulk call had the same message_id, the message was not sent
+    Duplicate = "Duplicate"
+
+
+class BulkResult(object):
+    """
+    Result of one item of a bulk call
+    """
+    __slots__ = ("index", "item", "result", "exception")
+
+    def __init__(self, index: int, item: Any, result: Any = None, exception: Exception = None):
+        """
+        Args:
+            index (int): Position of the item in the bulk call's input
+            item (Any): The item, e.g. the variables of a workflow instance
+            result (Any): Result of the item's call, e.g. the workflow instance key. None if the call failed
+            exception (Exception): The exception the item's call failed with. None if it succeeded
+        """
+        self.index = index
+        self.item = item
+        self.result = result
+        self.exception = exception
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exception is None
+
+    def __repr__(self) -> str:
+        if self.succeeded:
+            return f"BulkResult(index={self.index}, result={self.result!r})"
+        return f"BulkResult(index={self.index}, exception={self.exception!r})"
+
+
+class BulkWindow(object):
+    """
+    Amount of calls a bulk call keeps in flight, adapted to zeebe's back pressure.
+
+    The window grows by one call per window of successful calls, up to max_size, and halves when zeebe rejects a call
+    because of back pressure (like TCP's congestion window). Rejections of calls that started before the last shrink
+    don't shrink it again, so a burst of rejections halves the window once.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size (int): Maximum amount of calls in flight
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._size = float(max_size)
+        self._shrunk_at = float("-inf")
+
+    @property
+    def size(self) -> int:
+        return int(self._size)
+
+    def grow(self) -> None:
+        self._size = min(self.max_size, self._size + 1 / self._size)
+
+    def shrink(self, call_started_at: float) -> None:
+        """
+        Args:
+            call_started_at (float): time.monotonic() time the rejected call started
+        """
+        if call_started_at >= self._shrunk_at:
+            self._size = max(1.0, self._size / 2)
+            self._shrunk_at = time.monotonic()
+
+
+class RecentKeys(object):
+    """
+    Set of the last max_keys added keys
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._keys: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Returns:
+            bool: False if the key was added before (and not forgotten since)
+        """
+        if key in self._keys:
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+        return True
+
+
+def run_bulk(items: Iterable, start_call: Callable[[Any], Future], max_in_flight: int = 100,
+             ordered: bool = True, retry_policy: RetryPolicy = None,
+             dedupe_key: Callable[[Any], Optional[Hashable]] = None, duplicate_result: Any = None,
+             max_dedupe_keys: int = 100000) -> Iterator[BulkResult]:
+    """
+    Call start_call for every item, keeping up to max_in_flight calls running at once.
+
+    Items are taken from the iterable only when there is room in the window, so generators are consumed lazily.
+    Items rejected because of back pressure shrink the window (see BulkWindow) and are tried again after a backoff,
+    other failures are reported in the item's result.
+
+    Args:
+        items (Iterable): Input of the calls
+        start_call (Callable[[Any], Future]): Starts the call of an item
+        max_in_flight (int): Maximum amount of calls running at once. Default: 100
+        ordered (bool): Yield the results in the order of the items. Otherwise they are yielded as they complete. Default: True
+        retry_policy (RetryPolicy): Retries items rejected because of back pressure. Default: RetryPolicy(max_attempts=10, retryable_exceptions=(ZeebeBackPressure,))
+        dedupe_key (Callable[[Any], Optional[Hashable]]): Key of an item. An item with the same key as one of the last max_dedupe_keys items is not called, its result is duplicate_result. Items with key None are always called. Default: None (no deduplication)
+        duplicate_result (Any): Result of duplicate items. Default: None
+        max_dedupe_keys (int): Amount of recent keys remembered for deduplication. Default: 100000
+
+    Returns:
+        Iterator[BulkResult]: A result per item
+    """
+    window = BulkWindow(max_in_flight)
+    retry_policy = retry_policy or RetryPolicy(max_attempts=10, retryable_exceptions=(ZeebeBackPressure,))
+    done_calls = queue.Queue()
+    items = enumerate(items)
+    items_exhausted = False
+    in_flight = 0
+    # Items taken from the input whose result was not yielded yet
+    outstanding = 0
+    # (ready at, index, item, attempt, first attempt started at) of items waiting for a retry
+    retries: List[Tuple[float, int, Any, int, float]] = []
+    # Results that are waiting for the results of earlier items, if ordered
+    completed_results: Dict[int, BulkResult] = {}
+    next_index = 0
+    recent_keys = RecentKeys(max_dedupe_keys)
+
+    def is_duplicate(item: Any) -> bool:
+        if dedupe_key is None:
+            return False
+        key = dedupe_key(item)
+        return key is not None and not recent_keys.add(key)
+
+    def start(index: int, item: Any, attempt: int, first_started_at: Optional[float], duplicate: bool = False) -> None:
+        started_at = time.monotonic()
+        try:
+            if duplicate:
+                future = Future()
+                future.set_result(duplicate_result)
+            else:
+                future = start_call(item)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        future.add_done_callback(
+            lambda done: done_calls.put((index, item, attempt, first_started_at or started_at, started_at, done)))
+
+    while True:
+        now = time.monotonic()
+        while in_flight < window.size:
+            if retries and retries[0][0] <= now:
+                _, index, item, attempt, first_started_at = heapq.heappop(retries)
+                duplicate = False
+            elif not items_exhausted and outstanding < window.max_size:
+                try:
+                    index, item = next(items)
+                except StopIteration:
+                    items_exhausted = True
+                    continue
+                # Only first attempts are checked, a retried item is not a duplicate of itself
+                attempt, first_started_at, duplicate = 1, None, is_duplicate(item)
+                outstanding += 1
+            else:
+                break
+            in_flight += 1
+            start(index, item, attempt, first_started_at, duplicate)
+
+        if outstanding == 0 and items_exhausted:
+            return
+        # With a full window only a completed call lets the next call start
+        timeout = max(retries[0][0] - now, 0) if retries and in_flight < window.size else None
+        try:
+            index, item, attempt, first_started_at, started_at, future = done_calls.get(timeout=timeout)
+        except queue.Empty:
+            continue
+        in_flight -= 1
+
+        exception = future.exception()
+        if isinstance(exception, ZeebeBackPressure):
+            window.shrink(started_at)
+            delay = retry_policy.get_retry_delay(exception, attempt, time.monotonic() - first_started_at)
+            if delay is not None:
+                heapq.heappush(retries, (time.monotonic() + delay, index, item, attempt + 1, first_started_at))
+                continue
+        elif exception is None:
+            window.grow()
+        result = BulkResult(index, item, future.result() if exception is None else None, exception)
+
+        if not ordered:
+            outstanding -= 1
+            yield result
+            continue
+        completed_results[index] = result
+        while next_index in completed_results:
+            outstanding -= 1
+            yield completed_results.pop(next_index)
+            next_index += 1
+
+
+def to_message_status(future: Future) -> Future:
+    """
+    Returns:
+        Future: Resolves to the MessageStatus of a PublishMessage call's future. MessageAlreadyExists is a status,
+            not an error
+    """
+    status_future = Future()
+
+    def on_done(done: Future) -> None:
+        exception = done.exception()
+        if exception is None:
+            status_future.set_result(MessageStatus.Published)
+        elif isinstance(exception, MessageAlreadyExists):
+            status_future.set_result(MessageStatus.AlreadyExists)
+        else:
+            status_future.set_exception(exception)
+
+    future.add_done_callback(on_done)
+    return status_future
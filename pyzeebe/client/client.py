@@ -1,26 +1,41 @@
-from typing import Dict, List
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
 import grpc
 
+from pyzeebe.client.bulk import BulkResult, MessageStatus, run_bulk, to_message_status
 from pyzeebe.credentials.base_credentials import BaseCredentials
+from pyzeebe.grpc_internals.json_codec import JsonCodec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
+from pyzeebe.metrics.metrics import Metrics
+from pyzeebe.tracing.tracing import Tracing
 
 
 class ZeebeClient(object):
     """A zeebe client that can connect to a zeebe instance and perform actions."""
 
     def __init__(self, hostname: str = None, port: int = None, credentials: BaseCredentials = None,
-                 channel: grpc.Channel = None, secure_connection: bool = False, max_connection_retries: int = 10):
+                 channel: grpc.Channel = None, secure_connection: bool = False, max_connection_retries: int = 10,
+                 retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None,
+                 json_codec: JsonCodec = None, metrics: Metrics = None, tracing: Tracing = None):
         """
         Args:
             hostname (str): Zeebe instance hostname
             port (int): Port of the zeebe
             max_connection_retries (int): Amount of connection retries before client gives up on connecting to zeebe. To setup with infinite retries use -1
+            retry_policy (RetryPolicy): Retry policy of calls to zeebe. Default: None (calls are not retried)
+            rate_limits (Dict[str, float]): Maximum calls per second by RPC name, e.g. {"CompleteJob": 100}. Default: None (no limits)
+            json_codec (JsonCodec): Codec of job variables and headers, e.g. get_json_codec() for the fastest installed one. Default: StdlibJsonCodec
+            metrics (Metrics): Receives the duration and status code of every call to zeebe, e.g. PrometheusMetrics(). Default: None (not measured)
+            tracing (Tracing): Traces every call to zeebe and propagates the trace context to the created workflow instances, e.g. OpenTelemetryTracing(). Default: None (not traced)
         """
 
         self.zeebe_adapter = ZeebeAdapter(hostname=hostname, port=port, credentials=credentials, channel=channel,
                                           secure_connection=secure_connection,
-                                          max_connection_retries=max_connection_retries)
+                                          max_connection_retries=max_connection_retries,
+                                          retry_policy=retry_policy, rate_limits=rate_limits, json_codec=json_codec,
+                                          metrics=metrics, tracing=tracing)
 
     def run_workflow(self, bpmn_process_id: str, variables: Dict = None, version: int = -1) -> int:
         """
@@ -46,6 +61,58 @@ class ZeebeClient(object):
         return self.zeebe_adapter.create_workflow_instance(bpmn_process_id=bpmn_process_id, variables=variables or {},
                                                            version=version)
 
+    def run_workflow_future(self, bpmn_process_id: str, variables: Dict = None, version: int = -1) -> "Future[int]":
+        """
+        Run workflow without waiting for zeebe, see run_workflow
+
+        Returns:
+            Future: Resolves to the workflow_instance_key, or to the exception run_workflow raises
+        """
+        return self.zeebe_adapter.create_workflow_instance_future(bpmn_process_id=bpmn_process_id,
+                                                                  variables=variables or {}, version=version)
+
+    def run_workflows_bulk(self, bpmn_process_id: str, variables: Iterable[Dict], version: int = -1,
+                           max_in_flight: int = 100, ordered: bool = True,
+                           retry_policy: RetryPolicy = None) -> Iterator[BulkResult]:
+        """
+        Run a workflow once per variables dict, keeping up to max_in_flight CreateWorkflowInstance calls running at
+        once instead of waiting for every call
+
+        .. code-block:: python
+
+            results = client.run_workflows_bulk("bpmn_process_id", ({"order": order} for order in orders))
+            for result in results:
+                if not result.succeeded:
+                    logger.error(f"Could not start order {result.item}: {result.exception!r}")
+
+        The variables are taken from the iterable only when there is room for another call, so a generator is not
+        read ahead of the calls. A failed item does not stop the others, its result holds the exception.
+        When zeebe rejects calls because of back pressure the amount of calls in flight is halved, and grows back
+        slowly with successful calls. Rejected items are tried again (with the client's retry policy first, then
+        with retry_policy).
+
+        Args:
+            bpmn_process_id (str): The unique process id of the workflow.
+            variables (Iterable[Dict]): The starting variables of every workflow instance. Must be JSONable.
+            version (int): The version of the workflow. Default: -1 (latest)
+            max_in_flight (int): Maximum amount of calls running at once. Default: 100
+            ordered (bool): Return the results in the order of the variables. Otherwise they are returned as they complete. Default: True
+            retry_policy (RetryPolicy): Retries items rejected because of back pressure. Default: up to 10 attempts
+
+        Returns:
+            Iterator[BulkResult]: A result per variables dict, with the workflow_instance_key as result. The calls
+                only run while the iterator is consumed
+
+        Raises:
+            ValueError: If max_in_flight is smaller than 1
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        return run_bulk(variables,
+                        lambda item: self.zeebe_adapter.create_workflow_instance_future(
+                            bpmn_process_id=bpmn_process_id, variables=item or {}, version=version),
+                        max_in_flight=max_in_flight, ordered=ordered, retry_policy=retry_policy)
+
     def run_workflow_with_result(self, bpmn_process_id: str, variables: Dict = None, version: int = -1,
                                  timeout: int = 0, variables_to_fetch: List[str] = None) -> Dict:
         """
@@ -75,6 +142,19 @@ class ZeebeClient(object):
                                                                        timeout=timeout,
                                                                        variables_to_fetch=variables_to_fetch or [])
 
+    def run_workflow_with_result_future(self, bpmn_process_id: str, variables: Dict = None, version: int = -1,
+                                        timeout: int = 0, variables_to_fetch: List[str] = None) -> "Future[Dict]":
+        """
+        Run workflow and get the result without waiting for zeebe, see run_workflow_with_result
+
+        Returns:
+            Future: Resolves to the end state of the workflow instance, or to the exception run_workflow_with_result
+                raises
+        """
+        return self.zeebe_adapter.create_workflow_instance_with_result_future(
+            bpmn_process_id=bpmn_process_id, variables=variables or {}, version=version, timeout=timeout,
+            variables_to_fetch=variables_to_fetch or [])
+
     def cancel_workflow_instance(self, workflow_instance_key: int) -> int:
         """
         Cancel a running workflow instance
@@ -95,6 +175,16 @@ class ZeebeClient(object):
         self.zeebe_adapter.cancel_workflow_instance(workflow_instance_key=workflow_instance_key)
         return workflow_instance_key
 
+    def cancel_workflow_instance_future(self, workflow_instance_key: int) -> "Future[int]":
+        """
+        Cancel a running workflow instance without waiting for zeebe, see cancel_workflow_instance
+
+        Returns:
+            Future: Resolves to the workflow_instance_key, or to the exception cancel_workflow_instance raises
+        """
+        return _map_result(self.zeebe_adapter.cancel_workflow_instance_future(workflow_instance_key),
+                           lambda _: workflow_instance_key)
+
     def deploy_workflow(self, *workflow_file_path: str) -> None:
         """
         Deploy one or more workflows
@@ -111,6 +201,15 @@ class ZeebeClient(object):
         """
         self.zeebe_adapter.deploy_workflow(*workflow_file_path)
 
+    def deploy_workflow_future(self, *workflow_file_path: str) -> "Future[None]":
+        """
+        Deploy one or more workflows without waiting for zeebe, see deploy_workflow. The files are read right away
+
+        Returns:
+            Future: Resolves to None, or to the exception deploy_workflow raises
+        """
+        return _map_result(self.zeebe_adapter.deploy_workflow_future(*workflow_file_path), lambda _: None)
+
     def publish_message(self, name: str, correlation_key: str, variables: Dict = None,
                         time_to_live_in_milliseconds: int = 60000, message_id: str = None) -> None:
         """
@@ -134,3 +233,75 @@ class ZeebeClient(object):
         self.zeebe_adapter.publish_message(name=name, correlation_key=correlation_key,
                                            time_to_live_in_milliseconds=time_to_live_in_milliseconds,
                                            variables=variables or {}, message_id=message_id)
+
+    def publish_message_future(self, name: str, correlation_key: str, variables: Dict = None,
+                               time_to_live_in_milliseconds: int = 60000, message_id: str = None) -> "Future[None]":
+        """
+        Publish a message without waiting for zeebe, see publish_message
+
+        Returns:
+            Future: Resolves to None, or to the exception publish_message raises
+        """
+        return _map_result(self.zeebe_adapter.publish_message_future(
+            name=name, correlation_key=correlation_key, time_to_live_in_milliseconds=time_to_live_in_milliseconds,
+            variables=variables or {}, message_id=message_id), lambda _: None)
+
+    def publish_messages_bulk(self, messages: Iterable[Dict], max_in_flight: int = 100, ordered: bool = True,
+                              retry_policy: RetryPolicy = None, max_message_ids: int = 100000) -> Iterator[BulkResult]:
+        """
+        Publish many messages, keeping up to max_in_flight PublishMessage calls running at once instead of waiting
+        for every call
+
+        .. code-block:: python
+
+            messages = ({"name": "payment_received", "correlation_key": event.order_id, "message_id": event.id,
+                         "variables": event.data} for event in events)
+            for result in client.publish_messages_bulk(messages):
+                if not result.succeeded:
+                    logger.error(f"Could not publish {result.item}: {result.exception!r}")
+
+        The messages are taken from the iterable only when there is room for another call, so a generator is not
+        read ahead of the calls. A message with the same message_id as one of the last max_message_ids messages is
+        not sent again. A failed message does not stop the others, its result holds the exception.
+        Back pressure is handled like in run_workflows_bulk.
+
+        Args:
+            messages (Iterable[Dict]): The messages, each a dict of publish_message's arguments (name, correlation_key, variables, time_to_live_in_milliseconds, message_id)
+            max_in_flight (int): Maximum amount of calls running at once. Default: 100
+            ordered (bool): Return the results in the order of the messages. Otherwise they are returned as they complete. Default: True
+            retry_policy (RetryPolicy): Retries messages rejected because of back pressure. Default: up to 10 attempts
+            max_message_ids (int): Amount of recent message ids remembered for deduplication. Default: 100000
+
+        Returns:
+            Iterator[BulkResult]: A result per message, with a MessageStatus as result: Published,
+                AlreadyExists (zeebe has a message with this message_id) or Duplicate (not sent). The calls only run
+                while the iterator is consumed
+
+        Raises:
+            ValueError: If max_in_flight is smaller than 1
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        return run_bulk(messages, self._publish_message_future, max_in_flight=max_in_flight, ordered=ordered,
+                        retry_policy=retry_policy, dedupe_key=lambda message: message.get("message_id"),
+                        duplicate_result=MessageStatus.Duplicate, max_dedupe_keys=max_message_ids)
+
+    def _publish_message_future(self, message: Dict) -> "Future[MessageStatus]":
+        return to_message_status(self.zeebe_adapter.publish_message_future(
+            name=message["name"], correlation_key=message["correlation_key"],
+            time_to_live_in_milliseconds=message.get("time_to_live_in_milliseconds", 60000),
+            variables=message.get("variables") or {}, message_id=message.get("message_id")))
+
+
+def _map_result(future: Future, function: Callable[[Any], Any]) -> Future:
+    mapped_future = Future()
+
+    def on_done(done: Future) -> None:
+        exception = done.exception()
+        if exception is not None:
+            mapped_future.set_exception(exception)
+        else:
+            mapped_future.set_result(function(done.result()))
+
+    future.add_done_callback(on_done)
+    return mapped_future
@@ -4,6 +4,8 @@ from pyzeebe.task.task_decorator import TaskDecorator
 
 
 class ZeebeDecoratorBase(object):
+    __slots__ = ("_before", "_after")
+
     def __init__(self, before: List[TaskDecorator] = None, after: List[TaskDecorator] = None):
         self._before: List[TaskDecorator] = before or []
         self._after: List[TaskDecorator] = after or []
@@ -21,5 +21,11 @@ class DuplicateTaskType(PyZeebeException):
         super().__init__(f"Task with type {task_type} already exists")
         self.task_type = task_type
 
+
+class ProcessPoolNotSupported(PyZeebeException):
+    def __init__(self, task_type: str):
+        super().__init__(f"Task {task_type} can't run in a process pool, process pools require python 3.7+")
+        self.task_type = task_type
+
 class MaxConsecutiveTaskThreadError(PyZeebeException):
     pass
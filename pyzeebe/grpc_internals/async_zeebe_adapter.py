@@ -0,0 +1,8 @@
+from pyzeebe.grpc_internals.async_zeebe_job_adapter import AsyncZeebeJobAdapter
+from pyzeebe.grpc_internals.async_zeebe_message_adapter import AsyncZeebeMessageAdapter
+from pyzeebe.grpc_internals.async_zeebe_workflow_adapter import AsyncZeebeWorkflowAdapter
+
+
+# Mixin class
+class AsyncZeebeAdapter(AsyncZeebeWorkflowAdapter, AsyncZeebeJobAdapter, AsyncZeebeMessageAdapter):
+    pass
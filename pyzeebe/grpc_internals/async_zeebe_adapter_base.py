@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+import grpc
+from zeebe_grpc.gateway_pb2_grpc import GatewayStub
+
+from pyzeebe.credentials.base_credentials import BaseCredentials
+from pyzeebe.grpc_internals.json_codec import JsonCodec, StdlibJsonCodec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
+from pyzeebe.metrics.metrics import Metrics
+from pyzeebe.tracing.tracing import Tracing
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZeebeAdapterBase(ZeebeAdapterBase):
+    """
+    Base for adapters built on grpc.aio.
+
+    grpc.aio channels are bound to the event loop they are created in, so unless a channel is given it is created on
+    first use (inside the running loop). grpc.aio channels have no connectivity callbacks, so the connection state is
+    derived from the results of calls instead. The *_future methods of the synchronous adapters are not available,
+    their calls are awaited instead.
+    """
+
+    def __init__(self, hostname: str = None, port: int = None, credentials: BaseCredentials = None,
+                 channel: grpc.aio.Channel = None, secure_connection: bool = False, max_connection_retries: int = -1,
+                 retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None,
+                 json_codec: JsonCodec = None, metrics: Metrics = None, tracing: Tracing = None):
+        if channel:
+            self.connection_uri = None
+        else:
+            self.connection_uri = self._get_connection_uri(hostname, port, credentials)
+        self._channel = channel
+        self._credentials = credentials
+        self._stub = None
+
+        self.secure_connection = secure_connection
+        self.connected = True
+        self.retrying_connection = False
+        self._max_connection_retries = max_connection_retries
+        self._current_connection_retries = 0
+        self._init_call_policies(retry_policy, rate_limits)
+        self.json_codec = json_codec or StdlibJsonCodec()
+        self.metrics = metrics or Metrics()
+        self.tracing = tracing or Tracing()
+
+    @property
+    def _gateway_stub(self) -> GatewayStub:
+        if self._stub is None:
+            if self._channel is None:
+                self._channel = self._create_channel(self.connection_uri, self._credentials, self.secure_connection)
+            self._stub = GatewayStub(self._channel)
+        return self._stub
+
+    @_gateway_stub.setter
+    def _gateway_stub(self, stub: GatewayStub) -> None:
+        self._stub = stub
+
+    @staticmethod
+    def _create_channel(connection_uri: str, credentials: BaseCredentials = None,
+                        secure_connection: bool = False) -> grpc.aio.Channel:
+        if credentials:
+            return grpc.aio.secure_channel(connection_uri, credentials.grpc_credentials)
+        elif secure_connection:
+            return grpc.aio.secure_channel(connection_uri, grpc.ssl_channel_credentials())
+        else:
+            return grpc.aio.insecure_channel(connection_uri)
+
+    def _call_future(self, rpc_name: str, rpc: Callable[[], grpc.Future],
+                     error_handler: Callable[[grpc.RpcError], None],
+                     response_handler: Callable[[Any], Any] = None) -> Future:
+        # grpc.aio calls have no .future(), every *_future method of the synchronous adapters ends up here
+        raise NotImplementedError(f"{rpc_name} can't be called as a concurrent.futures.Future on a grpc.aio adapter, "
+                                  f"await the coroutine method instead")
+
+    def _record_rpc(self, rpc_name: str, started_at: float, exception: Exception = None) -> None:
+        super()._record_rpc(rpc_name, started_at, exception)
+        if exception is None:
+            # A call went through, so the gateway is reachable again
+            self.connected = True
+            self._current_connection_retries = 0
+
+    @staticmethod
+    def is_error_status(rpc_error: grpc.RpcError, status_code: grpc.StatusCode):
+        return rpc_error.code() == status_code
+
+    def _close(self):
+        self.connected = False
+        if self._channel is not None:
+            asyncio.ensure_future(self.close())
+
+    async def close(self) -> None:
+        """
+        Close the grpc channel
+        """
+        if self._channel is None:
+            return
+        try:
+            await self._channel.close()
+        except Exception as e:
+            logger.exception(f"Failed to close channel, {type(e).__name__} exception was raised")
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Dict, List, AsyncGenerator
+
+import grpc
+from zeebe_grpc.gateway_pb2 import ActivateJobsRequest, CompleteJobRequest, CompleteJobResponse, FailJobRequest, \
+    FailJobResponse, ThrowErrorRequest, ThrowErrorResponse
+
+from pyzeebe.exceptions import ActivateJobsRequestInvalid
+from pyzeebe.grpc_internals.async_zeebe_adapter_base import AsyncZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import zeebe_rpc
+from pyzeebe.grpc_internals.zeebe_job_adapter import ZeebeJobAdapter
+from pyzeebe.job.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZeebeJobAdapter(ZeebeJobAdapter, AsyncZeebeAdapterBase):
+    """
+    grpc.aio version of :py:class:`ZeebeJobAdapter`.
+
+    complete_job, fail_job and throw_error schedule the call on the running event loop and return the scheduled
+    asyncio.Task. This way synchronous code running in the loop (exception handlers, decorators) can call
+    job.set_failure_status() etc. without awaiting, while asynchronous code can await the result.
+    """
+
+    @zeebe_rpc("ActivateJobs")
+    async def activate_jobs(self, task_type: str, worker: str, timeout: int, max_jobs_to_activate: int,
+                            variables_to_fetch: List[str], request_timeout: int) -> AsyncGenerator[Job, None]:
+        try:
+            async for response in self._gateway_stub.ActivateJobs(
+                    ActivateJobsRequest(type=task_type, worker=worker, timeout=timeout,
+                                        maxJobsToActivate=max_jobs_to_activate,
+                                        fetchVariable=variables_to_fetch, requestTimeout=request_timeout)):
+                for raw_job in response.jobs:
+                    job = self._create_job_from_raw_job(raw_job)
+                    logger.debug("Got job: %s from zeebe", job)
+                    yield job
+        except grpc.RpcError as rpc_error:
+            if self.is_error_status(rpc_error, grpc.StatusCode.INVALID_ARGUMENT):
+                raise ActivateJobsRequestInvalid(task_type, worker, timeout, max_jobs_to_activate)
+            else:
+                self._common_zeebe_grpc_errors(rpc_error)
+
+    def complete_job(self, job_key: int, variables: Dict) -> "asyncio.Future[CompleteJobResponse]":
+        return asyncio.ensure_future(self._complete_job(job_key, variables))
+
+    @zeebe_rpc("CompleteJob")
+    async def _complete_job(self, job_key: int, variables: Dict) -> CompleteJobResponse:
+        try:
+            return await self._gateway_stub.CompleteJob(
+                CompleteJobRequest(jobKey=job_key, variables=self.json_codec.dumps(variables)))
+        except grpc.RpcError as rpc_error:
+            self._job_status_errors(rpc_error, job_key)
+
+    def fail_job(self, job_key: int, message: str, retries: int = 0) -> "asyncio.Future[FailJobResponse]":
+        return asyncio.ensure_future(self._fail_job(job_key, message, retries))
+
+    @zeebe_rpc("FailJob")
+    async def _fail_job(self, job_key: int, message: str, retries: int = 0) -> FailJobResponse:
+        try:
+            return await self._gateway_stub.FailJob(FailJobRequest(jobKey=job_key, errorMessage=message,
+                                                                   retries=retries))
+        except grpc.RpcError as rpc_error:
+            self._job_status_errors(rpc_error, job_key)
+
+    def throw_error(self, job_key: int, message: str) -> "asyncio.Future[ThrowErrorResponse]":
+        return asyncio.ensure_future(self._throw_error(job_key, message))
+
+    @zeebe_rpc("ThrowError")
+    async def _throw_error(self, job_key: int, message: str) -> ThrowErrorResponse:
+        try:
+            return await self._gateway_stub.ThrowError(ThrowErrorRequest(jobKey=job_key, errorMessage=message))
+        except grpc.RpcError as rpc_error:
+            self._job_status_errors(rpc_error, job_key)
@@ -0,0 +1,25 @@
+from typing import Dict
+
+import grpc
+from zeebe_grpc.gateway_pb2 import PublishMessageRequest, PublishMessageResponse
+
+from pyzeebe.grpc_internals.async_zeebe_adapter_base import AsyncZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import zeebe_rpc
+from pyzeebe.grpc_internals.zeebe_message_adapter import ZeebeMessageAdapter
+
+
+class AsyncZeebeMessageAdapter(ZeebeMessageAdapter, AsyncZeebeAdapterBase):
+    """
+    grpc.aio version of :py:class:`ZeebeMessageAdapter`, with the same errors
+    """
+
+    @zeebe_rpc("PublishMessage")
+    async def publish_message(self, name: str, correlation_key: str, time_to_live_in_milliseconds: int,
+                              variables: Dict, message_id: str = None) -> PublishMessageResponse:
+        try:
+            return await self._gateway_stub.PublishMessage(
+                PublishMessageRequest(name=name, correlationKey=correlation_key, messageId=message_id,
+                                      timeToLive=time_to_live_in_milliseconds,
+                                      variables=self.json_codec.dumps(variables)))
+        except grpc.RpcError as rpc_error:
+            self._publish_message_errors(rpc_error)
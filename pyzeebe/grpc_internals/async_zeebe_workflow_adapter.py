@@ -0,0 +1,54 @@
+from typing import Dict, List
+
+import grpc
+from zeebe_grpc.gateway_pb2 import CreateWorkflowInstanceRequest, CreateWorkflowInstanceWithResultRequest, \
+    CancelWorkflowInstanceRequest, DeployWorkflowRequest, DeployWorkflowResponse
+
+from pyzeebe.grpc_internals.async_zeebe_adapter_base import AsyncZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import zeebe_rpc
+from pyzeebe.grpc_internals.zeebe_workflow_adapter import ZeebeWorkflowAdapter
+
+
+class AsyncZeebeWorkflowAdapter(ZeebeWorkflowAdapter, AsyncZeebeAdapterBase):
+    """
+    grpc.aio version of :py:class:`ZeebeWorkflowAdapter`, with the same errors
+    """
+
+    @zeebe_rpc("CreateWorkflowInstance")
+    async def create_workflow_instance(self, bpmn_process_id: str, version: int, variables: Dict) -> int:
+        try:
+            response = await self._gateway_stub.CreateWorkflowInstance(
+                CreateWorkflowInstanceRequest(bpmnProcessId=bpmn_process_id, version=version,
+                                              variables=self.json_codec.dumps(self.tracing.inject(variables))))
+            return response.workflowInstanceKey
+        except grpc.RpcError as rpc_error:
+            self._create_workflow_errors(rpc_error, bpmn_process_id, version, variables)
+
+    @zeebe_rpc("CreateWorkflowInstanceWithResult")
+    async def create_workflow_instance_with_result(self, bpmn_process_id: str, version: int, variables: Dict,
+                                                   timeout: int, variables_to_fetch: List[str]) -> Dict:
+        try:
+            response = await self._gateway_stub.CreateWorkflowInstanceWithResult(
+                CreateWorkflowInstanceWithResultRequest(
+                    request=CreateWorkflowInstanceRequest(bpmnProcessId=bpmn_process_id, version=version,
+                                                          variables=self.json_codec.dumps(self.tracing.inject(variables))),
+                    requestTimeout=timeout, fetchVariables=variables_to_fetch))
+            return self.json_codec.loads(response.variables)
+        except grpc.RpcError as rpc_error:
+            self._create_workflow_errors(rpc_error, bpmn_process_id, version, variables)
+
+    @zeebe_rpc("CancelWorkflowInstance")
+    async def cancel_workflow_instance(self, workflow_instance_key: int) -> None:
+        try:
+            await self._gateway_stub.CancelWorkflowInstance(
+                CancelWorkflowInstanceRequest(workflowInstanceKey=workflow_instance_key))
+        except grpc.RpcError as rpc_error:
+            self._cancel_workflow_errors(rpc_error, workflow_instance_key)
+
+    @zeebe_rpc("DeployWorkflow")
+    async def deploy_workflow(self, *workflow_file_path: str) -> DeployWorkflowResponse:
+        try:
+            return await self._gateway_stub.DeployWorkflow(
+                DeployWorkflowRequest(workflows=map(self._get_workflow_request_object, workflow_file_path)))
+        except grpc.RpcError as rpc_error:
+            self._deploy_workflow_errors(rpc_error)
@@ -0,0 +1,150 @@
+import heapq
+import itertools
+import logging
+import time
+from threading import Condition, Thread
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledCall(object):
+    """
+    A call scheduled with a JobScheduler
+    """
+    __slots__ = ("when", "callback", "args", "cancelled", "_scheduler")
+
+    def __init__(self, when: float, callback: Callable, args: Tuple, scheduler: "JobScheduler" = None):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._scheduler = scheduler
+
+    def cancel(self) -> None:
+        """
+        Keep the call from running. Does nothing if it already ran.
+        """
+        scheduler = self._scheduler
+        if scheduler:
+            scheduler._cancel(self)
+        else:
+            self.cancelled = True
+
+
+class JobScheduler(object):
+    """
+    Runs timed callbacks on one shared thread instead of a timer thread per call, e.g. for the in-flight jobs of a
+    worker when their deadline passes, or for the delayed retries of an adapter's calls.
+
+    Callbacks run on the scheduler's thread, so they must be quick. The thread is started with the first scheduled
+    call. Cancelled calls stay queued until they are due, unless they make up most of the queue, then the queue is
+    rebuilt without them.
+    """
+
+    def __init__(self, name: str = "JobScheduler"):
+        """
+        Args:
+            name (str): Name of the scheduler's thread. Default: JobScheduler
+        """
+        self.name = name
+        self._calls: List[Tuple[float, int, ScheduledCall]] = []
+        self._counter = itertools.count()
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._cancelled_calls = 0
+        self._stopped = False
+
+    def call_at(self, when: float, callback: Callable, *args: Any) -> ScheduledCall:
+        """
+        Schedule a call
+
+        Args:
+            when (float): time.monotonic() time to run the call at
+            callback (Callable): Function to call
+            args: Arguments to call it with
+
+        Returns:
+            ScheduledCall: Handle to cancel the call with
+        """
+        with self._condition:
+            if self._stopped:
+                return ScheduledCall(when, callback, args)
+            call = ScheduledCall(when, callback, args, self)
+            heapq.heappush(self._calls, (when, next(self._counter), call))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            elif self._calls[0][2] is call:
+                # Runs before everything else, wake the thread up so it waits for the right time
+                self._condition.notify()
+        return call
+
+    def call_later(self, delay: float, callback: Callable, *args: Any) -> ScheduledCall:
+        """
+        Schedule a call in delay seconds, see call_at
+        """
+        return self.call_at(time.monotonic() + delay, callback, *args)
+
+    def stop(self) -> None:
+        """
+        Stop the scheduler's thread. Queued calls are dropped, calls scheduled afterwards never run.
+        """
+        with self._condition:
+            self._stopped = True
+            self._calls = []
+            self._cancelled_calls = 0
+            self._condition.notify()
+
+    def __len__(self) -> int:
+        """Amount of queued calls, including cancelled calls that were not dropped yet"""
+        return len(self._calls)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                call = self._next_due_call()
+                if call is None:
+                    return
+            try:
+                call.callback(*call.args)
+            except Exception as e:
+                logger.warning(f"Scheduled call {call.callback} failed. Error: {e!r}")
+
+    def _next_due_call(self) -> Optional[ScheduledCall]:
+        while not self._stopped:
+            self._drop_cancelled_calls()
+            if not self._calls:
+                self._condition.wait()
+                continue
+            when, _, call = self._calls[0]
+            delay = when - time.monotonic()
+            if delay > 0:
+                self._condition.wait(delay)
+                continue
+            heapq.heappop(self._calls)
+            call._scheduler = None
+            return call
+        return None
+
+    def _drop_cancelled_calls(self) -> None:
+        while self._calls and self._calls[0][2].cancelled:
+            heapq.heappop(self._calls)[2]._scheduler = None
+            self._cancelled_calls -= 1
+
+    def _cancel(self, call: ScheduledCall) -> None:
+        with self._condition:
+            if call.cancelled:
+                return
+            call.cancelled = True
+            if call._scheduler is None:
+                # Not queued anymore
+                return
+            self._cancelled_calls += 1
+            if self._cancelled_calls > 1024 and self._cancelled_calls > len(self._calls) // 2:
+                for _, _, dropped_call in self._calls:
+                    if dropped_call.cancelled:
+                        dropped_call._scheduler = None
+                self._calls = [entry for entry in self._calls if not entry[2].cancelled]
+                heapq.heapify(self._calls)
+                self._cancelled_calls = 0
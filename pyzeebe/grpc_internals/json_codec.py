@@ -0,0 +1,130 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec(ABC):
+    """
+    Encodes and decodes the JSON of job variables, custom headers, message variables and workflow variables.
+    """
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        raise NotImplementedError()
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    Codec built on the standard library's json module. Always available
+    """
+    name = "json"
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec built on orjson (pip install pyzeebe[orjson]).
+
+    Unlike the json module, orjson only accepts string dictionary keys and encodes datetimes and dataclasses itself.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install pyzeebe[orjson]")
+
+    def dumps(self, value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """
+    Codec built on msgspec (pip install pyzeebe[msgspec])
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("MsgspecJsonCodec requires msgspec. Install it with: pip install pyzeebe[msgspec]")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> str:
+        return self._encoder.encode(value).decode()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    Codec built on ujson (pip install pyzeebe[ujson])
+    """
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("UjsonCodec requires ujson. Install it with: pip install pyzeebe[ujson]")
+
+    def dumps(self, value: Any) -> str:
+        return ujson.dumps(value, ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+
+_CODECS = {codec.name: codec for codec in (OrjsonCodec, MsgspecJsonCodec, UjsonCodec, StdlibJsonCodec)}
+
+
+def get_json_codec(name: str = None) -> JsonCodec:
+    """
+    Get a JSON codec by name, or the fastest installed one
+
+    Args:
+        name (str): One of "orjson", "msgspec", "ujson" or "json". Default: None (the first installed of orjson,
+                    msgspec and ujson, falling back to json)
+
+    Returns:
+        JsonCodec: The codec
+
+    Raises:
+        ValueError: If there is no codec with this name
+        ImportError: If the codec's library is not installed
+    """
+    if name is not None:
+        if name not in _CODECS:
+            raise ValueError(f"Unknown JSON codec {name}. Choose one of: {', '.join(_CODECS)}")
+        return _CODECS[name]()
+    for codec in _CODECS.values():
+        try:
+            return codec()
+        except ImportError:
+            continue
@@ -0,0 +1,39 @@
+import time
+from threading import Lock
+
+
+class TokenBucket(object):
+    """
+    Limits the rate of calls: every call takes a token, tokens refill at rate per second up to burst tokens.
+
+    Calls that find the bucket empty still take a token (the bucket goes into debt), and are told how long to wait.
+    This way callers wait their turn in the order they came, both from threads and from an event loop.
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        """
+        Args:
+            rate (float): Tokens added per second
+            burst (float): Maximum amount of tokens in the bucket. Default: rate (at least 1)
+        """
+        self.rate = rate
+        self.burst = burst or max(rate, 1)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token
+
+        Returns:
+            float: Seconds to wait until the token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
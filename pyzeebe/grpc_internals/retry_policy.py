@@ -0,0 +1,57 @@
+import random
+from typing import Optional, Tuple, Type
+
+from pyzeebe.exceptions import ZeebeBackPressure
+
+
+class RetryPolicy(object):
+    """
+    Decides whether a failed call to zeebe is tried again, and how long to wait before trying.
+
+    The wait grows exponentially with every attempt (up to max_backoff) and is shortened by a random jitter, so clients
+    that were pushed back together don't all retry at the same moment.
+
+    By default only back pressure is retried: zeebe rejected the call before handling it, so trying again is safe for
+    every RPC. A call that failed with ZeebeGatewayUnavailable or ZeebeInternalError may have been carried out anyway,
+    retrying it could e.g. create a workflow instance twice. Add them to retryable_exceptions only if the retried
+    calls are idempotent (like CompleteJob) or duplicates don't matter.
+    """
+
+    def __init__(self, max_attempts: int = 5, initial_backoff: float = 0.1, max_backoff: float = 5,
+                 multiplier: float = 2, jitter: float = 0.2, deadline: float = None,
+                 retryable_exceptions: Tuple[Type[Exception], ...] = (ZeebeBackPressure,)):
+        """
+        Args:
+            max_attempts (int): Maximum amount of attempts of a call, including the first one. Default: 5
+            initial_backoff (float): Seconds to wait before the first retry. Default: 0.1
+            max_backoff (float): Maximum seconds to wait between attempts. Default: 5
+            multiplier (float): Factor the wait grows by after every attempt. Default: 2
+            jitter (float): Maximum fraction of the wait that is randomly cut off. Default: 0.2
+            deadline (float): Seconds after the first attempt after which no more retries start. Default: None (no deadline)
+            retryable_exceptions (Tuple[Type[Exception], ...]): Exceptions that are retried, e.g. (ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError). Default: (ZeebeBackPressure,)
+        """
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retryable_exceptions = retryable_exceptions
+
+    def get_retry_delay(self, exception: Exception, attempt: int, elapsed: float) -> Optional[float]:
+        """
+        Args:
+            exception (Exception): The exception the attempt failed with
+            attempt (int): Number of the failed attempt, starting at 1
+            elapsed (float): Seconds since the first attempt started
+
+        Returns:
+            float: Seconds to wait before the next attempt. None if the call should not be retried
+        """
+        if not isinstance(exception, self.retryable_exceptions) or attempt >= self.max_attempts:
+            return None
+        backoff = min(self.initial_backoff * self.multiplier ** (attempt - 1), self.max_backoff)
+        delay = backoff * (1 - random.uniform(0, self.jitter))
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
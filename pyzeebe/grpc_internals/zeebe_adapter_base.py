@@ -1,18 +1,128 @@
+import asyncio
+import functools
+import inspect
 import logging
 import os
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, ContextManager, Dict, Optional
 
 import grpc
 from zeebe_grpc.gateway_pb2_grpc import GatewayStub
 
 from pyzeebe.credentials.base_credentials import BaseCredentials
 from pyzeebe.exceptions import ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError
+from pyzeebe.grpc_internals.job_scheduler import JobScheduler
+from pyzeebe.grpc_internals.rate_limiter import TokenBucket
+from pyzeebe.grpc_internals.json_codec import JsonCodec, StdlibJsonCodec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+from pyzeebe.metrics.metrics import Metrics, get_status_code
+from pyzeebe.tracing.tracing import Tracing
 
 logger = logging.getLogger(__name__)
 
 
+def zeebe_rpc(rpc_name: str) -> Callable:
+    """
+    Apply the adapter's retry policy and rate limit of rpc_name to an adapter method and report every attempt to the
+    adapter's metrics and tracing.
+    Works for plain methods, generators, coroutines and async generators.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        if inspect.isasyncgenfunction(method):
+            async def wrapper(self: "ZeebeAdapterBase", *args, **kwargs):
+                started_at, attempt = time.monotonic(), 1
+                while True:
+                    await self._async_wait(self._reserve_rate_limit(rpc_name))
+                    yielded, attempt_started_at = False, time.monotonic()
+                    try:
+                        with self.tracing.rpc_span(rpc_name, current=False):
+                            async for item in method(self, *args, **kwargs):
+                                yielded = True
+                                yield item
+                    except Exception as e:
+                        self._record_rpc(rpc_name, attempt_started_at, e)
+                        # Items that were already handed out can't be taken back, so a broken stream is not retried
+                        delay = None if yielded else self._get_retry_delay(rpc_name, e, attempt, started_at)
+                        if delay is None:
+                            raise
+                    else:
+                        self._record_rpc(rpc_name, attempt_started_at)
+                        return
+                    await self._async_wait(delay)
+                    attempt += 1
+        elif inspect.iscoroutinefunction(method):
+            async def wrapper(self: "ZeebeAdapterBase", *args, **kwargs):
+                started_at, attempt = time.monotonic(), 1
+                while True:
+                    await self._async_wait(self._reserve_rate_limit(rpc_name))
+                    attempt_started_at = time.monotonic()
+                    try:
+                        with self.tracing.rpc_span(rpc_name):
+                            response = await method(self, *args, **kwargs)
+                    except Exception as e:
+                        self._record_rpc(rpc_name, attempt_started_at, e)
+                        delay = self._get_retry_delay(rpc_name, e, attempt, started_at)
+                        if delay is None:
+                            raise
+                    else:
+                        self._record_rpc(rpc_name, attempt_started_at)
+                        return response
+                    await self._async_wait(delay)
+                    attempt += 1
+        elif inspect.isgeneratorfunction(method):
+            def wrapper(self: "ZeebeAdapterBase", *args, **kwargs):
+                started_at, attempt = time.monotonic(), 1
+                while True:
+                    self._wait(self._reserve_rate_limit(rpc_name))
+                    yielded, attempt_started_at = False, time.monotonic()
+                    try:
+                        with self.tracing.rpc_span(rpc_name, current=False):
+                            for item in method(self, *args, **kwargs):
+                                yielded = True
+                                yield item
+                    except Exception as e:
+                        self._record_rpc(rpc_name, attempt_started_at, e)
+                        # Items that were already handed out can't be taken back, so a broken stream is not retried
+                        delay = None if yielded else self._get_retry_delay(rpc_name, e, attempt, started_at)
+                        if delay is None:
+                            raise
+                    else:
+                        self._record_rpc(rpc_name, attempt_started_at)
+                        return
+                    self._wait(delay)
+                    attempt += 1
+        else:
+            def wrapper(self: "ZeebeAdapterBase", *args, **kwargs):
+                started_at, attempt = time.monotonic(), 1
+                while True:
+                    self._wait(self._reserve_rate_limit(rpc_name))
+                    attempt_started_at = time.monotonic()
+                    try:
+                        with self.tracing.rpc_span(rpc_name):
+                            response = method(self, *args, **kwargs)
+                    except Exception as e:
+                        self._record_rpc(rpc_name, attempt_started_at, e)
+                        delay = self._get_retry_delay(rpc_name, e, attempt, started_at)
+                        if delay is None:
+                            raise
+                    else:
+                        self._record_rpc(rpc_name, attempt_started_at)
+                        return response
+                    self._wait(delay)
+                    attempt += 1
+
+        return functools.wraps(method)(wrapper)
+
+    return decorator
+
+
 class ZeebeAdapterBase(object):
     def __init__(self, hostname: str = None, port: int = None, credentials: BaseCredentials = None,
-                 channel: grpc.Channel = None, secure_connection: bool = False, max_connection_retries: int = -1):
+                 channel: grpc.Channel = None, secure_connection: bool = False, max_connection_retries: int = -1,
+                 retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None,
+                 json_codec: JsonCodec = None, metrics: Metrics = None, tracing: Tracing = None):
         if channel:
             self.connection_uri = None
             self._channel = channel
@@ -27,6 +137,102 @@ class ZeebeAdapterBase(object):
         self._gateway_stub = GatewayStub(self._channel)
         self._max_connection_retries = max_connection_retries
         self._current_connection_retries = 0
+        self._init_call_policies(retry_policy, rate_limits)
+        # Starts the delayed attempts of future calls (rate limit waits and retries)
+        self._scheduler = JobScheduler(f"{self.__class__.__name__}-Scheduler")
+        self.json_codec = json_codec or StdlibJsonCodec()
+        self.metrics = metrics or Metrics()
+        self.tracing = tracing or Tracing()
+
+    def _init_call_policies(self, retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None) -> None:
+        self.retry_policy = retry_policy
+        self._rate_limiters = {rpc_name: TokenBucket(rate) for rpc_name, rate in (rate_limits or {}).items()}
+
+    def _reserve_rate_limit(self, rpc_name: str) -> float:
+        rate_limiter = self._rate_limiters.get(rpc_name)
+        return rate_limiter.reserve() if rate_limiter else 0
+
+    def _record_rpc(self, rpc_name: str, started_at: float, exception: Exception = None) -> None:
+        self.metrics.rpc_finished(rpc_name, get_status_code(exception), time.monotonic() - started_at)
+
+    def _get_retry_delay(self, rpc_name: str, exception: Exception, attempt: int,
+                         started_at: float) -> Optional[float]:
+        if not self.retry_policy:
+            return None
+        delay = self.retry_policy.get_retry_delay(exception, attempt, time.monotonic() - started_at)
+        if delay is not None:
+            logger.warning(f"{rpc_name} failed (attempt {attempt}). Error: {exception!r}. "
+                           f"Retrying in {delay:.2f} seconds")
+        return delay
+
+    def _call_future(self, rpc_name: str, rpc: Callable[[], grpc.Future],
+                     error_handler: Callable[[grpc.RpcError], None],
+                     response_handler: Callable[[Any], Any] = None) -> Future:
+        """
+        Start an RPC without waiting for its response, applying the retry policy and rate limit of rpc_name.
+
+        Args:
+            rpc_name (str): Name of the RPC
+            rpc (Callable[[], grpc.Future]): Starts the call, e.g. lambda: stub.CompleteJob.future(request)
+            error_handler (Callable[[grpc.RpcError], None]): Raises the pyzeebe exception of a grpc error
+            response_handler (Callable[[Any], Any]): Turns the response into the result of the future. Default: None (the response is the result)
+
+        Returns:
+            Future: Resolves to the response, or to the exception the call failed with
+        """
+        future = Future()
+        started_at = time.monotonic()
+
+        def on_done(call: grpc.Future, attempt: int, attempt_started_at: float, span: ContextManager) -> None:
+            try:
+                try:
+                    response = call.result()
+                except grpc.RpcError as rpc_error:
+                    error_handler(rpc_error)
+                    raise
+                if response_handler:
+                    response = response_handler(response)
+            except Exception as e:
+                span.__exit__(type(e), e, e.__traceback__)
+                self._record_rpc(rpc_name, attempt_started_at, e)
+                delay = self._get_retry_delay(rpc_name, e, attempt, started_at)
+                if delay is None:
+                    future.set_exception(e)
+                else:
+                    self._call_later(delay, start, attempt + 1)
+            else:
+                span.__exit__(None, None, None)
+                self._record_rpc(rpc_name, attempt_started_at)
+                future.set_result(response)
+
+        def start(attempt: int) -> None:
+            attempt_started_at = time.monotonic()
+            span = self.tracing.rpc_span(rpc_name, current=False)
+            span.__enter__()
+            try:
+                rpc().add_done_callback(lambda call: on_done(call, attempt, attempt_started_at, span))
+            except Exception as e:
+                span.__exit__(type(e), e, e.__traceback__)
+                future.set_exception(e)
+
+        self._call_later(self._reserve_rate_limit(rpc_name), start, 1)
+        return future
+
+    def _call_later(self, delay: float, fn: Callable, *args) -> None:
+        if delay > 0:
+            self._scheduler.call_later(delay, fn, *args)
+        else:
+            fn(*args)
+
+    @staticmethod
+    def _wait(seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    @staticmethod
+    async def _async_wait(seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
 
     @staticmethod
     def _get_connection_uri(hostname: str = None, port: int = None, credentials: BaseCredentials = None) -> str:
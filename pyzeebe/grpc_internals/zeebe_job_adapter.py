@@ -1,5 +1,5 @@
-import json
 import logging
+from concurrent.futures import Future
 from typing import Dict, List, Generator
 
 import grpc
@@ -7,13 +7,14 @@ from zeebe_grpc.gateway_pb2 import ActivateJobsRequest, CompleteJobRequest, Comp
     FailJobResponse, ThrowErrorRequest, ThrowErrorResponse
 
 from pyzeebe.exceptions import ActivateJobsRequestInvalid, JobAlreadyDeactivated, JobNotFound
-from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase, zeebe_rpc
 from pyzeebe.job.job import Job
 
 logger = logging.getLogger(__name__)
 
 
 class ZeebeJobAdapter(ZeebeAdapterBase):
+    @zeebe_rpc("ActivateJobs")
     def activate_jobs(self, task_type: str, worker: str, timeout: int, max_jobs_to_activate: int,
                       variables_to_fetch: List[str], request_timeout: int) -> Generator[Job, None, None]:
         try:
@@ -23,7 +24,7 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
                                         fetchVariable=variables_to_fetch, requestTimeout=request_timeout)):
                 for raw_job in response.jobs:
                     job = self._create_job_from_raw_job(raw_job)
-                    logger.debug(f"Got job: {job} from zeebe")
+                    logger.debug("Got job: %s from zeebe", job)
                     yield job
         except grpc.RpcError as rpc_error:
             if self.is_error_status(rpc_error, grpc.StatusCode.INVALID_ARGUMENT):
@@ -39,43 +40,60 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
                    workflow_key=response.workflowKey,
                    element_id=response.elementId,
                    element_instance_key=response.elementInstanceKey,
-                   custom_headers=json.loads(response.customHeaders),
+                   custom_headers=response.customHeaders,
                    worker=response.worker,
                    retries=response.retries,
                    deadline=response.deadline,
-                   variables=json.loads(response.variables),
-                   zeebe_adapter=self)
+                   variables=response.variables,
+                   zeebe_adapter=self,
+                   json_codec=self.json_codec)
 
+    @zeebe_rpc("CompleteJob")
     def complete_job(self, job_key: int, variables: Dict) -> CompleteJobResponse:
         try:
-            return self._gateway_stub.CompleteJob(CompleteJobRequest(jobKey=job_key, variables=json.dumps(variables)))
+            return self._gateway_stub.CompleteJob(
+                CompleteJobRequest(jobKey=job_key, variables=self.json_codec.dumps(variables)))
         except grpc.RpcError as rpc_error:
-            if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
-                raise JobNotFound(job_key=job_key)
-            elif self.is_error_status(rpc_error, grpc.StatusCode.FAILED_PRECONDITION):
-                raise JobAlreadyDeactivated(job_key=job_key)
-            else:
-                self._common_zeebe_grpc_errors(rpc_error)
+            self._job_status_errors(rpc_error, job_key)
 
-    def fail_job(self, job_key: int, message: str) -> FailJobResponse:
+    @zeebe_rpc("FailJob")
+    def fail_job(self, job_key: int, message: str, retries: int = 0) -> FailJobResponse:
         try:
-            return self._gateway_stub.FailJob(FailJobRequest(jobKey=job_key, errorMessage=message))
+            return self._gateway_stub.FailJob(FailJobRequest(jobKey=job_key, errorMessage=message, retries=retries))
         except grpc.RpcError as rpc_error:
-            if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
-                raise JobNotFound(job_key=job_key)
-            elif self.is_error_status(rpc_error, grpc.StatusCode.FAILED_PRECONDITION):
-                raise JobAlreadyDeactivated(job_key=job_key)
-            else:
-                self._common_zeebe_grpc_errors(rpc_error)
+            self._job_status_errors(rpc_error, job_key)
 
+    @zeebe_rpc("ThrowError")
     def throw_error(self, job_key: int, message: str) -> ThrowErrorResponse:
         try:
             return self._gateway_stub.ThrowError(
                 ThrowErrorRequest(jobKey=job_key, errorMessage=message))
         except grpc.RpcError as rpc_error:
-            if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
-                raise JobNotFound(job_key=job_key)
-            elif self.is_error_status(rpc_error, grpc.StatusCode.FAILED_PRECONDITION):
-                raise JobAlreadyDeactivated(job_key=job_key)
-            else:
-                self._common_zeebe_grpc_errors(rpc_error)
+            self._job_status_errors(rpc_error, job_key)
+
+    def complete_job_future(self, job_key: int, variables: Dict,
+                            timeout: float = None) -> "Future[CompleteJobResponse]":
+        request = CompleteJobRequest(jobKey=job_key, variables=self.json_codec.dumps(variables))
+        return self._call_future("CompleteJob",
+                                 lambda: self._gateway_stub.CompleteJob.future(request, timeout=timeout),
+                                 lambda rpc_error: self._job_status_errors(rpc_error, job_key))
+
+    def fail_job_future(self, job_key: int, message: str, retries: int = 0,
+                        timeout: float = None) -> "Future[FailJobResponse]":
+        request = FailJobRequest(jobKey=job_key, errorMessage=message, retries=retries)
+        return self._call_future("FailJob", lambda: self._gateway_stub.FailJob.future(request, timeout=timeout),
+                                 lambda rpc_error: self._job_status_errors(rpc_error, job_key))
+
+    def throw_error_future(self, job_key: int, message: str, timeout: float = None) -> "Future[ThrowErrorResponse]":
+        request = ThrowErrorRequest(jobKey=job_key, errorMessage=message)
+        return self._call_future("ThrowError",
+                                 lambda: self._gateway_stub.ThrowError.future(request, timeout=timeout),
+                                 lambda rpc_error: self._job_status_errors(rpc_error, job_key))
+
+    def _job_status_errors(self, rpc_error: grpc.RpcError, job_key: int) -> None:
+        if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
+            raise JobNotFound(job_key=job_key)
+        elif self.is_error_status(rpc_error, grpc.StatusCode.FAILED_PRECONDITION):
+            raise JobAlreadyDeactivated(job_key=job_key)
+        else:
+            self._common_zeebe_grpc_errors(rpc_error)
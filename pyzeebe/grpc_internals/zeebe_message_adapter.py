@@ -1,22 +1,35 @@
-import json
+from concurrent.futures import Future
 from typing import Dict
 
 import grpc
 from zeebe_grpc.gateway_pb2 import PublishMessageRequest, PublishMessageResponse
 
 from pyzeebe.exceptions import MessageAlreadyExists
-from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase, zeebe_rpc
 
 
 class ZeebeMessageAdapter(ZeebeAdapterBase):
+    @zeebe_rpc("PublishMessage")
     def publish_message(self, name: str, correlation_key: str, time_to_live_in_milliseconds: int,
                         variables: Dict, message_id: str = None) -> PublishMessageResponse:
         try:
             return self._gateway_stub.PublishMessage(
                 PublishMessageRequest(name=name, correlationKey=correlation_key, messageId=message_id,
-                                      timeToLive=time_to_live_in_milliseconds, variables=json.dumps(variables)))
+                                      timeToLive=time_to_live_in_milliseconds,
+                                      variables=self.json_codec.dumps(variables)))
         except grpc.RpcError as rpc_error:
-            if self.is_error_status(rpc_error, grpc.StatusCode.ALREADY_EXISTS):
-                raise MessageAlreadyExists()
-            else:
-                self._common_zeebe_grpc_errors(rpc_error)
+            self._publish_message_errors(rpc_error)
+
+    def publish_message_future(self, name: str, correlation_key: str, time_to_live_in_milliseconds: int,
+                               variables: Dict, message_id: str = None) -> "Future[PublishMessageResponse]":
+        request = PublishMessageRequest(name=name, correlationKey=correlation_key, messageId=message_id,
+                                        timeToLive=time_to_live_in_milliseconds,
+                                        variables=self.json_codec.dumps(variables))
+        return self._call_future("PublishMessage", lambda: self._gateway_stub.PublishMessage.future(request),
+                                 self._publish_message_errors)
+
+    def _publish_message_errors(self, rpc_error: grpc.RpcError) -> None:
+        if self.is_error_status(rpc_error, grpc.StatusCode.ALREADY_EXISTS):
+            raise MessageAlreadyExists()
+        else:
+            self._common_zeebe_grpc_errors(rpc_error)
@@ -1,5 +1,5 @@
-import json
 import os
+from concurrent.futures import Future
 from typing import Dict
 
 import grpc
@@ -8,31 +8,54 @@ from zeebe_grpc.gateway_pb2 import CreateWorkflowInstanceRequest, CreateWorkflow
 
 from pyzeebe.exceptions import InvalidJSON, WorkflowNotFound, WorkflowInstanceNotFound, WorkflowHasNoStartEvent, \
     WorkflowInvalid
-from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase, zeebe_rpc
 
 
 class ZeebeWorkflowAdapter(ZeebeAdapterBase):
+    @zeebe_rpc("CreateWorkflowInstance")
     def create_workflow_instance(self, bpmn_process_id: str, version: int, variables: Dict) -> int:
         try:
             response = self._gateway_stub.CreateWorkflowInstance(
                 CreateWorkflowInstanceRequest(bpmnProcessId=bpmn_process_id, version=version,
-                                              variables=json.dumps(variables)))
+                                              variables=self.json_codec.dumps(self.tracing.inject(variables))))
             return response.workflowInstanceKey
         except grpc.RpcError as rpc_error:
             self._create_workflow_errors(rpc_error, bpmn_process_id, version, variables)
 
+    def create_workflow_instance_future(self, bpmn_process_id: str, version: int, variables: Dict) -> "Future[int]":
+        request = CreateWorkflowInstanceRequest(bpmnProcessId=bpmn_process_id, version=version,
+                                                variables=self.json_codec.dumps(self.tracing.inject(variables)))
+        return self._call_future("CreateWorkflowInstance",
+                                 lambda: self._gateway_stub.CreateWorkflowInstance.future(request),
+                                 lambda rpc_error: self._create_workflow_errors(rpc_error, bpmn_process_id, version,
+                                                                                variables),
+                                 lambda response: response.workflowInstanceKey)
+
+    @zeebe_rpc("CreateWorkflowInstanceWithResult")
     def create_workflow_instance_with_result(self, bpmn_process_id: str, version: int, variables: Dict,
                                              timeout: int, variables_to_fetch) -> Dict:
         try:
             response = self._gateway_stub.CreateWorkflowInstanceWithResult(
                 CreateWorkflowInstanceWithResultRequest(
                     request=CreateWorkflowInstanceRequest(bpmnProcessId=bpmn_process_id, version=version,
-                                                          variables=json.dumps(variables)),
+                                                          variables=self.json_codec.dumps(self.tracing.inject(variables))),
                     requestTimeout=timeout, fetchVariables=variables_to_fetch))
-            return json.loads(response.variables)
+            return self.json_codec.loads(response.variables)
         except grpc.RpcError as rpc_error:
             self._create_workflow_errors(rpc_error, bpmn_process_id, version, variables)
 
+    def create_workflow_instance_with_result_future(self, bpmn_process_id: str, version: int, variables: Dict,
+                                                    timeout: int, variables_to_fetch) -> "Future[Dict]":
+        request = CreateWorkflowInstanceWithResultRequest(
+            request=CreateWorkflowInstanceRequest(bpmnProcessId=bpmn_process_id, version=version,
+                                                  variables=self.json_codec.dumps(self.tracing.inject(variables))),
+            requestTimeout=timeout, fetchVariables=variables_to_fetch)
+        return self._call_future("CreateWorkflowInstanceWithResult",
+                                 lambda: self._gateway_stub.CreateWorkflowInstanceWithResult.future(request),
+                                 lambda rpc_error: self._create_workflow_errors(rpc_error, bpmn_process_id, version,
+                                                                                variables),
+                                 lambda response: self.json_codec.loads(response.variables))
+
     def _create_workflow_errors(self, rpc_error: grpc.RpcError, bpmn_process_id: str, version: int,
                                 variables: Dict) -> None:
         if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
@@ -45,25 +68,45 @@ class ZeebeWorkflowAdapter(ZeebeAdapterBase):
         else:
             self._common_zeebe_grpc_errors(rpc_error)
 
+    @zeebe_rpc("CancelWorkflowInstance")
     def cancel_workflow_instance(self, workflow_instance_key: int) -> None:
         try:
             self._gateway_stub.CancelWorkflowInstance(
                 CancelWorkflowInstanceRequest(workflowInstanceKey=workflow_instance_key))
         except grpc.RpcError as rpc_error:
-            if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
-                raise WorkflowInstanceNotFound(workflow_instance_key=workflow_instance_key)
-            else:
-                self._common_zeebe_grpc_errors(rpc_error)
+            self._cancel_workflow_errors(rpc_error, workflow_instance_key)
+
+    def cancel_workflow_instance_future(self, workflow_instance_key: int) -> "Future[None]":
+        request = CancelWorkflowInstanceRequest(workflowInstanceKey=workflow_instance_key)
+        return self._call_future("CancelWorkflowInstance",
+                                 lambda: self._gateway_stub.CancelWorkflowInstance.future(request),
+                                 lambda rpc_error: self._cancel_workflow_errors(rpc_error, workflow_instance_key),
+                                 lambda response: None)
 
+    def _cancel_workflow_errors(self, rpc_error: grpc.RpcError, workflow_instance_key: int) -> None:
+        if self.is_error_status(rpc_error, grpc.StatusCode.NOT_FOUND):
+            raise WorkflowInstanceNotFound(workflow_instance_key=workflow_instance_key)
+        else:
+            self._common_zeebe_grpc_errors(rpc_error)
+
+    @zeebe_rpc("DeployWorkflow")
     def deploy_workflow(self, *workflow_file_path: str) -> DeployWorkflowResponse:
         try:
             return self._gateway_stub.DeployWorkflow(
                 DeployWorkflowRequest(workflows=map(self._get_workflow_request_object, workflow_file_path)))
         except grpc.RpcError as rpc_error:
-            if self.is_error_status(rpc_error, grpc.StatusCode.INVALID_ARGUMENT):
-                raise WorkflowInvalid()
-            else:
-                self._common_zeebe_grpc_errors(rpc_error)
+            self._deploy_workflow_errors(rpc_error)
+
+    def deploy_workflow_future(self, *workflow_file_path: str) -> "Future[DeployWorkflowResponse]":
+        request = DeployWorkflowRequest(workflows=map(self._get_workflow_request_object, workflow_file_path))
+        return self._call_future("DeployWorkflow", lambda: self._gateway_stub.DeployWorkflow.future(request),
+                                 self._deploy_workflow_errors)
+
+    def _deploy_workflow_errors(self, rpc_error: grpc.RpcError) -> None:
+        if self.is_error_status(rpc_error, grpc.StatusCode.INVALID_ARGUMENT):
+            raise WorkflowInvalid()
+        else:
+            self._common_zeebe_grpc_errors(rpc_error)
 
     @staticmethod
     def _get_workflow_request_object(workflow_file_path: str) -> WorkflowRequestObject:
@@ -1,14 +1,26 @@
-from typing import Dict
+import time
+from typing import Dict, Union
 
 from pyzeebe.exceptions import NoZeebeAdapter
+from pyzeebe.grpc_internals.json_codec import JsonCodec
 from pyzeebe.job.job_status import JobStatus
 
 
 class Job(object):
+    __slots__ = ("key", "type", "workflow_instance_key", "bpmn_process_id", "workflow_definition_version",
+                 "workflow_key", "element_id", "element_instance_key", "worker", "retries", "deadline", "status",
+                 "zeebe_adapter", "_json_codec", "_custom_headers", "_raw_custom_headers", "_variables",
+                 "_raw_variables", "_cancelled")
+
     def __init__(self, key: int, _type: str, workflow_instance_key: int, bpmn_process_id: str,
                  workflow_definition_version: int, workflow_key: int, element_id: str, element_instance_key: int,
-                 custom_headers: Dict, worker: str, retries: int, deadline: int, variables: Dict,
-                 status: JobStatus = JobStatus.Running, zeebe_adapter=None):
+                 custom_headers: Union[Dict, str], worker: str, retries: int, deadline: int,
+                 variables: Union[Dict, str], status: JobStatus = JobStatus.Running, zeebe_adapter=None,
+                 json_codec: JsonCodec = None):
+        """
+        If json_codec is given, variables and custom_headers are the JSON documents received from zeebe. They are only
+        decoded (with json_codec) when they are accessed the first time, so jobs that are never looked at are cheap.
+        """
         self.key = key
         self.type = _type
         self.workflow_instance_key = workflow_instance_key
@@ -17,13 +29,73 @@ class Job(object):
         self.workflow_key = workflow_key
         self.element_id = element_id
         self.element_instance_key = element_instance_key
-        self.custom_headers = custom_headers
+        self._json_codec = json_codec
+        self._custom_headers = None
+        self._raw_custom_headers = None
+        self._variables = None
+        self._raw_variables = None
+        if json_codec:
+            self._raw_custom_headers = custom_headers
+            self._raw_variables = variables
+        else:
+            self._custom_headers = custom_headers
+            self._variables = variables
         self.worker = worker
         self.retries = retries
         self.deadline = deadline
-        self.variables = variables
         self.status = status
         self.zeebe_adapter = zeebe_adapter
+        self._cancelled = False
+
+    @property
+    def variables(self) -> Dict:
+        if self._raw_variables is not None:
+            self._variables = self._json_codec.loads(self._raw_variables)
+            self._raw_variables = None
+        return self._variables
+
+    @variables.setter
+    def variables(self, variables: Dict) -> None:
+        self._variables = variables
+        self._raw_variables = None
+
+    @property
+    def custom_headers(self) -> Dict:
+        if self._raw_custom_headers is not None:
+            self._custom_headers = self._json_codec.loads(self._raw_custom_headers)
+            self._raw_custom_headers = None
+        return self._custom_headers
+
+    @custom_headers.setter
+    def custom_headers(self, custom_headers: Dict) -> None:
+        self._custom_headers = custom_headers
+        self._raw_custom_headers = None
+
+    @property
+    def expired(self) -> bool:
+        """Whether the job's deadline passed, zeebe hands expired jobs out again and rejects their completion"""
+        return self.deadline > 0 and self.seconds_until_deadline() <= 0
+
+    def seconds_until_deadline(self) -> float:
+        """
+        Returns:
+            float: Seconds left until the job's deadline (negative if it passed), measured with the local clock
+        """
+        return self.deadline / 1000 - time.time()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the worker asked the job's handler to stop, e.g. because the deadline passed. Long running task
+        functions can check it (see get_current_job) and return early, their result is not sent to zeebe anyway.
+        """
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """
+        Ask the job's handler to stop. The worker won't complete or fail the job afterwards.
+        """
+        self._cancelled = True
 
     def set_success_status(self) -> None:
         """
@@ -38,6 +110,7 @@ class Job(object):
         """
         if self.zeebe_adapter:
             self.zeebe_adapter.complete_job(job_key=self.key, variables=self.variables)
+            self.status = JobStatus.Completed
         else:
             raise NoZeebeAdapter()
 
@@ -58,6 +131,7 @@ class Job(object):
         """
         if self.zeebe_adapter:
             self.zeebe_adapter.fail_job(job_key=self.key, message=message)
+            self.status = JobStatus.Failed
         else:
             raise NoZeebeAdapter()
 
@@ -78,13 +152,13 @@ class Job(object):
         """
         if self.zeebe_adapter:
             self.zeebe_adapter.throw_error(job_key=self.key, message=message)
+            self.status = JobStatus.ErrorThrown
         else:
             raise NoZeebeAdapter()
 
     def __repr__(self):
-        return str({"jobKey": self.key, "taskType": self.type, "workflowInstanceKey": self.workflow_instance_key,
-                    "bpmnProcessId": self.bpmn_process_id,
-                    "workflowDefinitionVersion": self.workflow_definition_version, "workflowKey": self.workflow_key,
-                    "elementId": self.element_id, "elementInstanceKey": self.element_instance_key,
-                    "customHeaders": self.custom_headers, "worker": self.worker, "retries": self.retries,
-                    "deadline": self.deadline, "variables": self.variables})
+        # Leaves out variables and custom headers: they can be large and may not be decoded yet
+        return f"{{'jobKey': {self.key}, 'taskType': {self.type!r}, " \
+               f"'workflowInstanceKey': {self.workflow_instance_key}, 'bpmnProcessId': {self.bpmn_process_id!r}, " \
+               f"'elementId': {self.element_id!r}, 'worker': {self.worker!r}, 'retries': {self.retries}, " \
+               f"'deadline': {self.deadline}}}"
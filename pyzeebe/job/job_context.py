@@ -0,0 +1,38 @@
+from threading import local
+from typing import Optional
+
+from pyzeebe.job.job import Job
+
+_context = local()
+
+
+def get_current_job() -> Optional[Job]:
+    """
+    Get the job the calling thread is working on, so a task function can check whether its job was cancelled:
+
+    .. code-block:: python
+
+        @worker.task("export")
+        def export(rows: list):
+            for row in rows:
+                if get_current_job().cancelled:
+                    return {}
+                write(row)
+            return {}
+
+    Only set in task functions that run on a worker thread (not in async functions or the process pool).
+
+    Returns:
+        Job: The current job. None if the thread is not running a job
+    """
+    return getattr(_context, "job", None)
+
+
+def set_current_job(job: Optional[Job]) -> Optional[Job]:
+    """
+    Returns:
+        Job: The previous job of the thread
+    """
+    previous_job = get_current_job()
+    _context.job = job
+    return previous_job
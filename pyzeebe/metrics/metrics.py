@@ -0,0 +1,154 @@
+from typing import Optional
+
+import grpc
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+JOB_OUTCOMES = ("completed", "failed", "error", "cancelled", "expired")
+
+
+class Metrics(object):
+    """
+    Receives the measurements of workers, clients and their zeebe adapters. This class ignores them, subclass it to
+    record them (see PrometheusMetrics). The methods are called on the hot path, so they must be quick.
+    """
+
+    def jobs_activated(self, task_type: str, count: int, duration: float) -> None:
+        """
+        An ActivateJobs round of a task ended
+
+        Args:
+            task_type (str): Type of the task
+            count (int): Amount of activated jobs
+            duration (float): Seconds the round took
+        """
+
+    def job_queued(self, task_type: str) -> None:
+        """A job was handed to the job executor, it is in flight until job_done"""
+
+    def job_rejected(self, task_type: str) -> None:
+        """The job executor refused a queued job, its handler never starts"""
+
+    def job_started(self, task_type: str) -> None:
+        """A job's handler started"""
+
+    def job_finished(self, task_type: str, outcome: str, duration: float) -> None:
+        """
+        A job's handler finished
+
+        Args:
+            task_type (str): Type of the task
+            outcome (str): One of JOB_OUTCOMES
+            duration (float): Seconds the handler took
+        """
+
+    def job_done(self, task_type: str) -> None:
+        """A job left the worker"""
+
+    def rpc_finished(self, rpc_name: str, status_code: str, duration: float) -> None:
+        """
+        An attempt of a call to zeebe ended
+
+        Args:
+            rpc_name (str): Name of the RPC, e.g. CompleteJob
+            status_code (str): Name of the grpc status code, e.g. OK or RESOURCE_EXHAUSTED (back pressure)
+            duration (float): Seconds the attempt took
+        """
+
+
+class PrometheusMetrics(Metrics):
+    """
+    Records the measurements as prometheus metrics. Requires prometheus_client (pip install pyzeebe[prometheus]).
+
+    Metrics (prefixed with the namespace):
+        jobs_activated_total (task_type), job_activation_seconds (task_type),
+        jobs_finished_total (task_type, outcome), job_duration_seconds (task_type),
+        jobs_queued (task_type), jobs_in_flight (task_type),
+        rpc_duration_seconds (rpc, code), backpressure_total (rpc)
+
+    The metrics are registered when the object is created, so create one per registry and pass it to every worker
+    and client.
+    """
+
+    def __init__(self, registry: "prometheus_client.CollectorRegistry" = None, namespace: str = "pyzeebe"):
+        """
+        Args:
+            registry (prometheus_client.CollectorRegistry): Registry to register the metrics in. Default: prometheus_client.REGISTRY
+            namespace (str): Prefix of the metric names. Default: pyzeebe
+
+        Raises:
+            ImportError: If prometheus_client is not installed
+        """
+        if prometheus_client is None:
+            raise ImportError("PrometheusMetrics requires prometheus_client, install it with: "
+                              "pip install pyzeebe[prometheus]")
+        self.registry = registry or prometheus_client.REGISTRY
+        options = dict(namespace=namespace, registry=self.registry)
+        self._jobs_activated = prometheus_client.Counter("jobs_activated", "Jobs activated",
+                                                         ["task_type"], **options)
+        self._activation_duration = prometheus_client.Histogram("job_activation_seconds",
+                                                                "Duration of ActivateJobs rounds",
+                                                                ["task_type"], **options)
+        self._jobs_finished = prometheus_client.Counter("jobs_finished", "Jobs whose handler finished",
+                                                        ["task_type", "outcome"], **options)
+        self._job_duration = prometheus_client.Histogram("job_duration_seconds", "Duration of job handlers",
+                                                         ["task_type"], **options)
+        self._jobs_queued = prometheus_client.Gauge("jobs_queued", "Jobs waiting for the job executor",
+                                                    ["task_type"], **options)
+        self._jobs_in_flight = prometheus_client.Gauge("jobs_in_flight", "Jobs in the worker", ["task_type"],
+                                                       **options)
+        self._rpc_duration = prometheus_client.Histogram("rpc_duration_seconds", "Duration of calls to zeebe",
+                                                         ["rpc", "code"], **options)
+        self._backpressure = prometheus_client.Counter("backpressure", "Calls rejected by zeebe's back pressure",
+                                                       ["rpc"], **options)
+
+    def start_http_server(self, port: int, addr: str = "0.0.0.0") -> None:
+        """
+        Serve the registry's metrics for scraping on http://addr:port/metrics, from a daemon thread
+        """
+        prometheus_client.start_http_server(port, addr, registry=self.registry)
+
+    def jobs_activated(self, task_type: str, count: int, duration: float) -> None:
+        self._jobs_activated.labels(task_type).inc(count)
+        self._activation_duration.labels(task_type).observe(duration)
+
+    def job_queued(self, task_type: str) -> None:
+        self._jobs_queued.labels(task_type).inc()
+        self._jobs_in_flight.labels(task_type).inc()
+
+    def job_rejected(self, task_type: str) -> None:
+        self._jobs_queued.labels(task_type).dec()
+
+    def job_started(self, task_type: str) -> None:
+        self._jobs_queued.labels(task_type).dec()
+
+    def job_finished(self, task_type: str, outcome: str, duration: float) -> None:
+        self._jobs_finished.labels(task_type, outcome).inc()
+        self._job_duration.labels(task_type).observe(duration)
+
+    def job_done(self, task_type: str) -> None:
+        self._jobs_in_flight.labels(task_type).dec()
+
+    def rpc_finished(self, rpc_name: str, status_code: str, duration: float) -> None:
+        self._rpc_duration.labels(rpc_name, status_code).observe(duration)
+        if status_code == "RESOURCE_EXHAUSTED":
+            self._backpressure.labels(rpc_name).inc()
+
+
+def get_status_code(exception: Optional[BaseException]) -> str:
+    """
+    Returns:
+        str: Name of the grpc status code a call ended with. The adapters raise pyzeebe exceptions while handling the
+            grpc error, so the error is found in the exception's context. UNKNOWN if there is none
+    """
+    if exception is None:
+        return grpc.StatusCode.OK.name
+    while exception is not None:
+        if isinstance(exception, grpc.RpcError):
+            code = exception.code() if callable(getattr(exception, "code", None)) else exception._state.code
+            return code.name
+        exception = exception.__cause__ or exception.__context__
+    return grpc.StatusCode.UNKNOWN.name
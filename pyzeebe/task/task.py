@@ -6,9 +6,12 @@ from pyzeebe.task.exception_handler import ExceptionHandler
 
 
 class Task(ZeebeDecoratorBase):
+    __slots__ = ("type", "inner_function", "exception_handler", "timeout", "max_jobs_to_activate",
+                 "variables_to_fetch", "run_in_process_pool", "handler")
+
     def __init__(self, task_type: str, task_handler: Callable[..., Dict], exception_handler: ExceptionHandler,
                  timeout: int = 10000, max_jobs_to_activate: int = 32, variables_to_fetch: List[str] = None,
-                 before: List = None, after: List = None):
+                 before: List = None, after: List = None, run_in_process_pool: bool = False):
         super().__init__(before=before, after=after)
 
         self.type = task_type
@@ -17,8 +20,9 @@ class Task(ZeebeDecoratorBase):
         self.timeout = timeout
         self.max_jobs_to_activate = max_jobs_to_activate
         self.variables_to_fetch = variables_to_fetch or []
+        self.run_in_process_pool = run_in_process_pool
         self.handler: Callable[[Job], Job] = None
 
     def __repr__(self) -> str:
         return str({"type": self.type, "timeout": self.timeout, "max_jobs_to_activate": self.max_jobs_to_activate,
-                    "variables_to_fetch": self.variables_to_fetch})
+                    "variables_to_fetch": self.variables_to_fetch, "run_in_process_pool": self.run_in_process_pool})
@@ -0,0 +1,129 @@
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Union
+
+from pyzeebe.exceptions import DuplicateTaskType, TaskNotFound
+from pyzeebe.task.task import Task
+
+
+class TaskRegistry(object):
+    """
+    Ordered collection of tasks with unique task types.
+
+    Tasks are kept in a dict keyed by task type, so lookups, duplicate checks and removals don't scan the tasks. The
+    registry also behaves like the list of tasks it replaces: it supports len, iteration (in the order the tasks were
+    added), membership tests (with a task or a task type) and indexing. Positions are computed lazily after a removal.
+    Iterating is safe while other threads add or remove tasks.
+    """
+
+    def __init__(self, tasks: List[Task] = None):
+        self._tasks: Dict[str, Task] = {}
+        self._ordered_tasks: Optional[List[Task]] = None
+        self._indexes: Optional[Dict[str, int]] = None
+        self._lock = Lock()
+        for task in tasks or []:
+            self.append(task)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._get_ordered_tasks())
+
+    def __contains__(self, task: Union[Task, str]) -> bool:
+        if isinstance(task, str):
+            return task in self._tasks
+        return self._tasks.get(task.type) is task
+
+    def __getitem__(self, index: int) -> Task:
+        return self._get_ordered_tasks()[index]
+
+    def __repr__(self) -> str:
+        return repr(self._get_ordered_tasks())
+
+    def append(self, task: Task) -> None:
+        """
+        Add a task after the existing tasks
+
+        Raises:
+            DuplicateTaskType: If a task with the same type exists
+        """
+        with self._lock:
+            if task.type in self._tasks:
+                raise DuplicateTaskType(task.type)
+            if self._ordered_tasks is not None:
+                self._indexes[task.type] = len(self._ordered_tasks)
+                self._ordered_tasks.append(task)
+            self._tasks[task.type] = task
+
+    def get(self, task_type: str) -> Optional[Task]:
+        """
+        Returns:
+            Task: The task of this type. None if there is none
+        """
+        return self._tasks.get(task_type)
+
+    def index(self, task_type: str) -> int:
+        """
+        Returns:
+            int: Position of the task of this type
+
+        Raises:
+            TaskNotFound: If no task with this type exists
+        """
+        with self._lock:
+            self._build_order()
+            try:
+                return self._indexes[task_type]
+            except KeyError:
+                raise TaskNotFound(f"Could not find task {task_type}")
+
+    def remove(self, task_type: str) -> Task:
+        """
+        Remove the task of this type
+
+        Returns:
+            Task: The removed task
+
+        Raises:
+            TaskNotFound: If no task with this type exists
+        """
+        with self._lock:
+            try:
+                task = self._tasks.pop(task_type)
+            except KeyError:
+                raise TaskNotFound(f"Could not find task {task_type}")
+            self._ordered_tasks = None
+            self._indexes = None
+            return task
+
+    def replace(self, task: Task) -> Task:
+        """
+        Replace the task of the same type, keeping its position
+
+        Returns:
+            Task: The replaced task
+
+        Raises:
+            TaskNotFound: If no task with this type exists
+        """
+        with self._lock:
+            if task.type not in self._tasks:
+                raise TaskNotFound(f"Could not find task {task.type}")
+            old_task = self._tasks[task.type]
+            self._tasks[task.type] = task
+            if self._ordered_tasks is not None:
+                self._ordered_tasks[self._indexes[task.type]] = task
+            return old_task
+
+    def _get_ordered_tasks(self) -> List[Task]:
+        ordered_tasks = self._ordered_tasks
+        if ordered_tasks is None:
+            with self._lock:
+                ordered_tasks = self._build_order()
+        return ordered_tasks
+
+    def _build_order(self) -> List[Task]:
+        if self._ordered_tasks is None:
+            self._ordered_tasks = list(self._tasks.values())
+            self._indexes = {task.type: index for index, task in enumerate(self._ordered_tasks)}
+        return self._ordered_tasks
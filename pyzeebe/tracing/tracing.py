@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+from pyzeebe.job.job import Job
+from pyzeebe.metrics.metrics import get_status_code
+
+try:
+    from opentelemetry import context, propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:
+    trace = None
+
+TRACE_CONTEXT_VARIABLE = "pyzeebe_trace_context"
+
+
+class _NoSpan(object):
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracing(object):
+    """
+    Traces the calls to zeebe and the jobs of workers and clients. This class does nothing, see OpenTelemetryTracing.
+
+    The trace context of a workflow instance travels in a workflow variable (context_variable): clients add it to the
+    variables of the instances they create, workers fetch it with the other variables of a job and remove it before
+    the task function gets the variables.
+    """
+
+    #: Name of the workflow variable carrying the trace context. None if the context is not propagated
+    context_variable: Optional[str] = None
+
+    def rpc_span(self, rpc_name: str, current: bool = True) -> ContextManager[None]:
+        """
+        Span of an attempt of a call to zeebe
+
+        Args:
+            rpc_name (str): Name of the RPC, e.g. CompleteJob
+            current (bool): Make the span the current span while the call runs. Spans of streamed calls are not
+                current, because the stream is consumed in between. Default: True
+        """
+        return _NO_SPAN
+
+    def job_span(self, job: Job, timeout: int = None) -> ContextManager[None]:
+        """
+        Span of a job's lifecycle in the worker, child of the trace context found in the job's variables
+
+        Args:
+            job (Job): The job, its trace context variable is removed
+            timeout (int): Timeout of the job's task in milliseconds, used to find out when the job was activated
+        """
+        return _NO_SPAN
+
+    def stage_span(self, stage: str) -> ContextManager[None]:
+        """
+        Span of a stage of the current job, e.g. before decorators or task function
+        """
+        return _NO_SPAN
+
+    def job_finished(self, outcome: str) -> None:
+        """
+        Record how the current job ended
+
+        Args:
+            outcome (str): One of pyzeebe.metrics.metrics.JOB_OUTCOMES
+        """
+
+    def inject(self, variables: Dict) -> Dict:
+        """
+        Returns:
+            Dict: The variables with the current trace context, for a workflow instance that is about to be created
+        """
+        return variables
+
+    def get_variables_to_fetch(self, variables_to_fetch: List[str]) -> List[str]:
+        """
+        Returns:
+            List[str]: The variables to fetch for a task, including the trace context
+        """
+        if variables_to_fetch and self.context_variable:
+            return variables_to_fetch + [self.context_variable]
+        return variables_to_fetch
+
+
+class OpenTelemetryTracing(Tracing):
+    """
+    Records spans with OpenTelemetry. Requires opentelemetry-api (pip install pyzeebe[opentelemetry]) and an
+    OpenTelemetry SDK setup to export the spans.
+
+    Spans:
+        - a CLIENT span per call attempt to zeebe, named after the RPC
+        - a CONSUMER span per job, named after the task type, with child spans for the time the job waited in the worker
+          (activation wait), before decorators, task function, after decorators and complete job
+
+    Job spans are children of the span that created the workflow instance, if the trace context was propagated.
+    """
+
+    def __init__(self, tracer_provider: "trace.TracerProvider" = None, propagate_context: bool = True):
+        """
+        Args:
+            tracer_provider (opentelemetry.trace.TracerProvider): Provider of the tracer. Default: the global provider
+            propagate_context (bool): Propagate the trace context through the TRACE_CONTEXT_VARIABLE workflow variable. Default: True
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        if trace is None:
+            raise ImportError("OpenTelemetryTracing requires opentelemetry-api, install it with: "
+                              "pip install pyzeebe[opentelemetry]")
+        self.tracer = trace.get_tracer("pyzeebe", tracer_provider=tracer_provider)
+        self.context_variable = TRACE_CONTEXT_VARIABLE if propagate_context else None
+
+    @contextmanager
+    def rpc_span(self, rpc_name: str, current: bool = True) -> Iterator[None]:
+        span = self.tracer.start_span(rpc_name, kind=SpanKind.CLIENT,
+                                      attributes={"rpc.system": "grpc", "rpc.service": "gateway_protocol.Gateway",
+                                                  "rpc.method": rpc_name})
+        with self._use_span(span, current):
+            try:
+                yield
+            except Exception as e:
+                span.set_attribute("rpc.grpc.status_code", get_status_code(e))
+                raise
+            span.set_attribute("rpc.grpc.status_code", get_status_code(None))
+
+    @contextmanager
+    def job_span(self, job: Job, timeout: int = None) -> Iterator[None]:
+        parent = self._extract(job)
+        # Zeebe sets the deadline when it activates the job
+        activated_at = (job.deadline - timeout) * 1000000 if job.deadline > 0 and timeout else None
+        span = self.tracer.start_span(job.type, context=parent, kind=SpanKind.CONSUMER, start_time=activated_at,
+                                      attributes={"zeebe.job.key": job.key, "zeebe.job.type": job.type,
+                                                  "zeebe.job.retries": job.retries,
+                                                  "zeebe.workflow_instance.key": job.workflow_instance_key,
+                                                  "zeebe.bpmn_process_id": job.bpmn_process_id,
+                                                  "zeebe.element_id": job.element_id})
+        if activated_at is not None:
+            self.tracer.start_span("activation wait", context=trace.set_span_in_context(span),
+                                   start_time=activated_at).end()
+        with self._use_span(span, current=True):
+            yield
+
+    def stage_span(self, stage: str) -> ContextManager[None]:
+        return self.tracer.start_as_current_span(stage)
+
+    def job_finished(self, outcome: str) -> None:
+        span = trace.get_current_span()
+        span.set_attribute("zeebe.job.outcome", outcome)
+        if outcome != "completed":
+            span.set_status(Status(StatusCode.ERROR, outcome))
+
+    def inject(self, variables: Dict) -> Dict:
+        if not self.context_variable:
+            return variables
+        carrier: Dict[str, str] = {}
+        propagate.inject(carrier)
+        if not carrier:
+            return variables
+        return {**(variables or {}), self.context_variable: carrier}
+
+    def _extract(self, job: Job) -> "context.Context":
+        carrier = job.variables.pop(self.context_variable, None) if self.context_variable else None
+        if not isinstance(carrier, dict):
+            # A new trace, not a child of whatever span is current in the worker
+            return context.Context()
+        return propagate.extract(carrier, context=context.Context())
+
+    @staticmethod
+    @contextmanager
+    def _use_span(span: "trace.Span", current: bool) -> Iterator[None]:
+        token = context.attach(trace.set_span_in_context(span)) if current else None
+        try:
+            yield
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, repr(e)))
+            raise
+        finally:
+            if token is not None:
+                context.detach(token)
+            span.end()
@@ -0,0 +1,340 @@
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from concurrent.futures.process import BrokenProcessPool
+from threading import Event
+from typing import List, Callable, AsyncGenerator, Tuple, Dict, Set, Awaitable
+
+from pyzeebe.credentials.base_credentials import BaseCredentials
+from pyzeebe.exceptions import ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError
+from pyzeebe.grpc_internals.async_zeebe_adapter import AsyncZeebeAdapter
+from pyzeebe.grpc_internals.json_codec import JsonCodec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+from pyzeebe.job.job import Job
+from pyzeebe.job.job_context import set_current_job
+from pyzeebe.job.job_status import JobStatus
+from pyzeebe.metrics.metrics import Metrics
+from pyzeebe.tracing.tracing import Tracing
+from pyzeebe.task.task import Task
+from pyzeebe.task.task_decorator import TaskDecorator
+from pyzeebe.worker.job_logger import JobLogger
+from pyzeebe.worker.zeebe_worker_base import ZeebeWorkerBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZeebeWorker(ZeebeWorkerBase):
+    """
+    A zeebe worker that runs all of its polling and jobs on a single asyncio event loop.
+
+    Task functions may be ``async def`` functions, which run on the loop, or regular functions, which are run on the
+    loop's default executor. Decorators and exception handlers may also be coroutine functions.
+    """
+
+    def __init__(self, name: str = None, request_timeout: int = 0, hostname: str = None, port: int = None,
+                 credentials: BaseCredentials = None, secure_connection: bool = False,
+                 before: List[TaskDecorator] = None, after: List[TaskDecorator] = None,
+                 max_connection_retries: int = 10, max_concurrent_jobs: int = 1000, max_processes: int = None,
+                 idle_poll_interval: float = 0.1, max_poll_interval: float = 5,
+                 retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None,
+                 json_codec: JsonCodec = None, structured_logging: bool = False, enforce_job_deadlines: bool = False,
+                 metrics: Metrics = None, tracing: Tracing = None):
+        """
+        Args:
+            hostname (str): Zeebe instance hostname
+            port (int): Port of the zeebe
+            name (str): Name of zeebe worker
+            request_timeout (int): Longpolling timeout for getting tasks from zeebe. If 0 default value is used
+            before (List[TaskDecorator]): Decorators to be performed before each task
+            after (List[TaskDecorator]): Decorators to be performed after each task
+            max_connection_retries (int): Amount of connection retries before worker gives up on connecting to zeebe. To setup with infinite retries use -1
+            max_concurrent_jobs (int): Maximum amount of jobs the worker will run at the same time across all tasks. Default: 1000
+            max_processes (int): Size of the process pool used by run_in_process_pool tasks. Default: number of CPUs
+            idle_poll_interval (float): Seconds to wait before polling a task again after it returned no jobs. Doubles with every empty poll. Default: 0.1
+            max_poll_interval (float): Maximum seconds to wait between polls of a task. Default: 5
+            retry_policy (RetryPolicy): Retry policy of calls to zeebe. Default: None (calls are not retried)
+            rate_limits (Dict[str, float]): Maximum calls per second by RPC name, e.g. {"CompleteJob": 100}. Default: None (no limits)
+            json_codec (JsonCodec): Codec of job variables and headers, e.g. get_json_codec() for the fastest installed one. Default: StdlibJsonCodec
+            structured_logging (bool): Log jobs with structured fields (job key, task type, timing) instead of their repr. See StructuredLogFormatter. Default: False
+            enforce_job_deadlines (bool): Skip jobs whose deadline passed before they started and cancel jobs that run past it: async task functions are cancelled, others see Job.cancelled. Default: False
+            metrics (Metrics): Receives measurements of jobs (activations, durations, outcomes, in-flight jobs) and calls to zeebe, e.g. PrometheusMetrics(). Default: None (not measured)
+            tracing (Tracing): Traces jobs and calls to zeebe, e.g. OpenTelemetryTracing(). Default: None (not traced)
+        """
+        super().__init__(name, request_timeout, before, after, max_processes, idle_poll_interval, max_poll_interval,
+                         enforce_job_deadlines, metrics, tracing)
+        self.zeebe_adapter = AsyncZeebeAdapter(hostname=hostname, port=port, credentials=credentials,
+                                               secure_connection=secure_connection,
+                                               max_connection_retries=max_connection_retries,
+                                               retry_policy=retry_policy, rate_limits=rate_limits,
+                                               json_codec=json_codec, metrics=metrics, tracing=tracing)
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.stop_event = Event()
+        self._job_logger = JobLogger(logger, structured_logging)
+        self._poller_tasks: Dict[str, asyncio.Future] = {}
+        self._job_tasks: Set[asyncio.Future] = set()
+        self._jobs_semaphore: asyncio.Semaphore = None
+
+    async def work(self) -> None:
+        """
+        Start the worker. The worker will poll zeebe for jobs of each task until stop() is called.
+
+        Raises:
+            ActivateJobsRequestInvalid: If one of the worker's task has invalid types
+
+        """
+        self._jobs_semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        for task in self.tasks:
+            self._poller_tasks[task.type] = asyncio.ensure_future(self._poll_task(task))
+
+        try:
+            await asyncio.gather(*self._poller_tasks.values())
+        except Exception:
+            logger.debug("A task poller failed, stopping worker")
+            self.stop_event.set()
+            raise
+
+    async def stop(self, wait: bool = False) -> None:
+        """
+        Stop the worker. This will emit a signal asking tasks to complete the current task and stop polling for new.
+
+        Args:
+            wait (bool): Wait for all pollers and running jobs to complete
+        """
+        self.stop_event.set()
+        if wait:
+            await asyncio.gather(*self._poller_tasks.values(), return_exceptions=True)
+            await asyncio.gather(*self._job_tasks, return_exceptions=True)
+            self._shutdown_process_pool(wait=True)
+
+    def _should_handle_task(self) -> bool:
+        return not self.stop_event.is_set() and self.zeebe_adapter.connected
+
+    async def _poll_task(self, task: Task) -> None:
+        logger.debug(f"Polling task {task}")
+        task_semaphore = asyncio.Semaphore(task.max_jobs_to_activate)
+        backoff = self._get_poll_backoff(task)
+        while self._should_handle_task():
+            try:
+                if await self._handle_jobs(task, task_semaphore):
+                    backoff.reset()
+                    continue
+                delay = backoff.backoff()
+            except ZeebeBackPressure:
+                delay = backoff.backoff()
+                logger.warning(f"Zeebe is in back pressure, polling task {task.type} again in {delay:.2f} seconds")
+            except (ZeebeGatewayUnavailable, ZeebeInternalError) as e:
+                logger.warning(f"Failed to activate jobs for task {task.type}. Error: {e!r}. Retrying")
+                delay = 0.5
+            await asyncio.sleep(delay)
+        logger.info(f"Poller for task {task.type} ending")
+
+    async def _handle_jobs(self, task: Task, task_semaphore: asyncio.Semaphore) -> int:
+        credits = await self._acquire_credits(task, task_semaphore)
+        activated_jobs = 0
+        activation_started_at = None
+        try:
+            if not self._should_handle_task():
+                return 0
+            activation_started_at = time.monotonic()
+            async for job in self._get_jobs(task, max_jobs_to_activate=credits):
+                activated_jobs += 1
+                await self._jobs_semaphore.acquire()
+                self._job_logger.running(job)
+                self.metrics.job_queued(task.type)
+                job_task = asyncio.ensure_future(self._run_job(task, job, task_semaphore))
+                self._job_tasks.add(job_task)
+                job_task.add_done_callback(self._job_tasks.discard)
+        finally:
+            for _ in range(credits - activated_jobs):
+                task_semaphore.release()
+            if activation_started_at is not None:
+                self.metrics.jobs_activated(task.type, activated_jobs, time.monotonic() - activation_started_at)
+        return activated_jobs
+
+    @staticmethod
+    async def _acquire_credits(task: Task, task_semaphore: asyncio.Semaphore) -> int:
+        await task_semaphore.acquire()
+        credits = 1
+        while credits < task.max_jobs_to_activate and not task_semaphore.locked():
+            await task_semaphore.acquire()
+            credits += 1
+        return credits
+
+    async def _run_job(self, task: Task, job: Job, task_semaphore: asyncio.Semaphore) -> None:
+        try:
+            await task.handler(job)
+        except Exception as e:
+            logger.exception(f"Unhandled error while handling job: {job}. Error: {e}")
+        finally:
+            task_semaphore.release()
+            self._jobs_semaphore.release()
+            self.metrics.job_done(job.type)
+
+    def _get_jobs(self, task: Task, max_jobs_to_activate: int = None) -> AsyncGenerator[Job, None]:
+        logger.debug("Activating jobs for task: %s", task)
+        return self.zeebe_adapter.activate_jobs(task_type=task.type, worker=self.name, timeout=task.timeout,
+                                                max_jobs_to_activate=max_jobs_to_activate or task.max_jobs_to_activate,
+                                                variables_to_fetch=self.tracing.get_variables_to_fetch(
+                                                    task.variables_to_fetch),
+                                                request_timeout=self.request_timeout)
+
+    def _create_task_handler(self, task: Task) -> Callable[[Job], Awaitable[Job]]:
+        before_decorator_runner = self._create_before_decorator_runner(task)
+        after_decorator_runner = self._create_after_decorator_runner(task)
+
+        async def task_handler(job: Job) -> Job:
+            started_at = time.monotonic()
+            self.metrics.job_started(job.type)
+            if self._should_skip_job(job):
+                return job
+            with self.tracing.job_span(job, task.timeout):
+                return await self._handle_job(task, job, before_decorator_runner, after_decorator_runner, started_at)
+
+        return task_handler
+
+    async def _handle_job(self, task: Task, job: Job, before_decorator_runner: Callable[[Job], Awaitable[Job]],
+                          after_decorator_runner: Callable[[Job], Awaitable[Job]], started_at: float) -> Job:
+        status_calls = None
+        if job.zeebe_adapter:
+            status_calls = _JobStatusCalls(job.zeebe_adapter)
+            job.zeebe_adapter = status_calls
+        with self.tracing.stage_span("before decorators"):
+            job = await before_decorator_runner(job)
+        job, task_succeeded = await self._run_task_inner_function(task, job)
+        with self.tracing.stage_span("after decorators"):
+            job = await after_decorator_runner(job)
+        if status_calls:
+            await status_calls.wait(job)
+        duration = time.monotonic() - started_at
+        if job.cancelled:
+            self._count_deadline_stats(job.type, overrun_jobs=1, wasted_seconds=duration)
+        elif task_succeeded and job.status == JobStatus.Running:
+            with self.tracing.stage_span("complete job"):
+                await self._complete_job(job)
+        self._job_finished(job, task_succeeded, duration)
+        return job
+
+    async def _run_task_inner_function(self, task: Task, job: Job) -> Tuple[Job, bool]:
+        try:
+            with self.tracing.stage_span("task function"):
+                job.variables = await self._call_task_function_until_deadline(task, job)
+            return job, True
+        except asyncio.CancelledError:
+            if not job.cancelled:
+                raise
+            return job, False
+        except Exception as e:
+            self._job_logger.failed(job, e)
+            if not job.cancelled:
+                await AsyncZeebeWorker._run_exception_handler(task, e, job)
+            return job, False
+
+    async def _call_task_function_until_deadline(self, task: Task, job: Job) -> Dict:
+        if not self.enforce_job_deadlines or job.deadline <= 0:
+            return await self._call_task_function(task, job)
+
+        call = asyncio.ensure_future(self._call_task_function(task, job))
+        deadline_handle = asyncio.get_event_loop().call_later(job.seconds_until_deadline(),
+                                                              self._cancel_overrunning_call, job, call)
+        try:
+            return await call
+        finally:
+            deadline_handle.cancel()
+
+    def _cancel_overrunning_call(self, job: Job, call: asyncio.Future) -> None:
+        self._cancel_overrunning_job(job)
+        call.cancel()
+
+    async def _call_task_function(self, task: Task, job: Job) -> Dict:
+        variables = job.variables
+        if inspect.iscoroutinefunction(task.inner_function):
+            return await task.inner_function(**variables)
+
+        loop = asyncio.get_event_loop()
+        if not task.run_in_process_pool:
+            return await loop.run_in_executor(None, functools.partial(_run_as_current_job, job, task.inner_function,
+                                                                      variables))
+
+        process_pool = self._get_process_pool()
+        try:
+            return await loop.run_in_executor(process_pool, functools.partial(task.inner_function, **variables))
+        except BrokenProcessPool:
+            self._replace_broken_process_pool(process_pool)
+            raise
+
+    @staticmethod
+    async def _run_exception_handler(task: Task, exception: Exception, job: Job) -> None:
+        try:
+            result = task.exception_handler(exception, job)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Exception handler of task {task.type} failed for job: {job}. Error: {e}")
+
+    async def _complete_job(self, job: Job) -> None:
+        try:
+            self._job_logger.completing(job)
+            await self.zeebe_adapter.complete_job(job_key=job.key, variables=job.variables)
+        except Exception as e:
+            logger.warning(f"Failed to complete job: {job}. Error: {e}")
+
+    @staticmethod
+    def _create_decorator_runner(decorators: List[TaskDecorator]) -> Callable[[Job], Awaitable[Job]]:
+        async def decorator_runner(job: Job) -> Job:
+            for decorator in decorators:
+                job = await AsyncZeebeWorker._run_decorator(decorator, job)
+            return job
+
+        return decorator_runner
+
+    @staticmethod
+    async def _run_decorator(decorator: TaskDecorator, job: Job) -> Job:
+        try:
+            result = decorator(job)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            logger.warning(f"Failed to run decorator {decorator}. Error: {e}")
+            return job
+
+
+class _JobStatusCalls(object):
+    """
+    Takes the place of a job's zeebe_adapter and keeps the calls started by its status methods (e.g. in a sync
+    exception handler, which can't await them), so the worker can wait for them before the job is done
+    """
+
+    def __init__(self, zeebe_adapter: AsyncZeebeAdapter):
+        self.zeebe_adapter = zeebe_adapter
+        self._calls: List[asyncio.Future] = []
+
+    def complete_job(self, job_key: int, variables: Dict) -> asyncio.Future:
+        return self._add(self.zeebe_adapter.complete_job(job_key=job_key, variables=variables))
+
+    def fail_job(self, job_key: int, message: str, retries: int = 0) -> asyncio.Future:
+        return self._add(self.zeebe_adapter.fail_job(job_key=job_key, message=message, retries=retries))
+
+    def throw_error(self, job_key: int, message: str) -> asyncio.Future:
+        return self._add(self.zeebe_adapter.throw_error(job_key=job_key, message=message))
+
+    def _add(self, call: Awaitable) -> asyncio.Future:
+        call = asyncio.ensure_future(call)
+        self._calls.append(call)
+        return call
+
+    async def wait(self, job: Job) -> None:
+        results = await asyncio.gather(*self._calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to update the status of job: {job}. Error: {result!r}")
+
+
+def _run_as_current_job(job: Job, function: Callable[..., Dict], variables: Dict) -> Dict:
+    previous_job = set_current_job(job)
+    try:
+        return function(**variables)
+    finally:
+        set_current_job(previous_job)
@@ -0,0 +1,58 @@
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from pyzeebe.job.job import Job
+from pyzeebe.task.task import Task
+
+logger = logging.getLogger(__name__)
+
+
+class JobExecutor(ABC):
+    """Runs the handlers of activated jobs. Implement this to change how a worker executes its jobs."""
+
+    @abstractmethod
+    def submit(self, task: Task, job: Job) -> Future:
+        """
+        Schedule a job to be handled by its task
+
+        Args:
+            task (Task): The task the job belongs to
+            job (Job): The activated job
+
+        Returns:
+            Future: A future that resolves to the job once the task handler has finished
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting jobs and release the executor's resources
+
+        Args:
+            wait (bool): Wait for all submitted jobs to finish
+        """
+        raise NotImplementedError()
+
+
+class ThreadPoolJobExecutor(JobExecutor):
+    """
+    Runs jobs on a bounded pool of reusable threads. At most max_workers jobs run at once, further jobs are queued.
+    """
+
+    def __init__(self, max_workers: int = 100, thread_name_prefix: str = "ZeebeWorker-Job"):
+        """
+        Args:
+            max_workers (int): Maximum amount of jobs running at the same time across all tasks. Default: 100
+            thread_name_prefix (str): Prefix for the names of the pool's threads
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+    def submit(self, task: Task, job: Job) -> Future:
+        return self._executor.submit(task.handler, job)
+
+    def shutdown(self, wait: bool = True) -> None:
+        logger.debug(f"Shutting down job executor (wait={wait})")
+        self._executor.shutdown(wait=wait)
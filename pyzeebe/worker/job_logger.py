@@ -0,0 +1,68 @@
+import json
+import logging
+from typing import Any, Dict
+
+from pyzeebe.job.job import Job
+
+JOB_LOG_FIELDS = ("event", "job_key", "task_type", "workflow_instance_key", "duration_ms", "succeeded", "error")
+
+
+class JobLogger(object):
+    """
+    Logs what happens to each job (running, failed, expired, completing, finished) at debug level.
+
+    Nothing is formatted unless debug logging is enabled. In structured mode the records carry the fields in
+    JOB_LOG_FIELDS as attributes (job key, task type, timing...) and the message only names the job, so variables and
+    custom headers are never formatted. StructuredLogFormatter writes such records as JSON.
+    """
+
+    def __init__(self, logger: logging.Logger, structured: bool = False):
+        """
+        Args:
+            logger (logging.Logger): Logger to log to
+            structured (bool): Log records with job fields instead of the job's repr. Default: False
+        """
+        self.logger = logger
+        self.structured = structured
+
+    def running(self, job: Job) -> None:
+        self._log(job, "running", "Running job: %s")
+
+    def failed(self, job: Job, error: Exception) -> None:
+        self._log(job, "failed", "Failed job: %s. Error: %s.", error, error=repr(error))
+
+    def expired(self, job: Job) -> None:
+        self._log(job, "expired", "Skipping expired job: %s")
+
+    def completing(self, job: Job) -> None:
+        self._log(job, "completing", "Completing job: %s")
+
+    def finished(self, job: Job, duration: float, succeeded: bool) -> None:
+        self._log(job, "finished", "Finished job: %s in %.3f seconds (succeeded=%s)", duration, succeeded,
+                  duration_ms=round(duration * 1000, 3), succeeded=succeeded)
+
+    def _log(self, job: Job, event: str, message: str, *args: Any, **fields: Any) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if self.structured:
+            fields.update(event=event, job_key=job.key, task_type=job.type,
+                          workflow_instance_key=job.workflow_instance_key)
+            self.logger.debug("Job %s of task %s %s", job.key, job.type, event, extra=fields)
+        else:
+            self.logger.debug(message, job, *args)
+
+
+class StructuredLogFormatter(logging.Formatter):
+    """
+    Formats log records as single line JSON objects, including the job fields of structured job logs
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {"time": record.created, "level": record.levelname, "logger": record.name,
+                                 "message": record.getMessage()}
+        for field in JOB_LOG_FIELDS:
+            if hasattr(record, field):
+                entry[field] = getattr(record, field)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
@@ -0,0 +1,149 @@
+import logging
+import queue
+import time
+from concurrent import futures
+from concurrent.futures import Future
+from threading import BoundedSemaphore, Condition, Lock, Thread
+from typing import Callable, Dict, List, Optional
+
+from pyzeebe.grpc_internals.zeebe_job_adapter import ZeebeJobAdapter
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class JobStatusPipeline(object):
+    """
+    Sends job status updates (CompleteJob, FailJob and ThrowError) in the background.
+
+    complete_job, fail_job and throw_error only queue the update, so the job's thread is free as soon as its handler
+    returns. Sender threads take updates from the queue and start them as grpc futures, keeping up to max_in_flight
+    calls running at once. When the queue is full, queueing blocks until there is room again. Every call has a deadline
+    of request_timeout seconds, so a hanging gateway can't hold an in-flight slot forever.
+
+    The pipeline has the same complete_job, fail_job and throw_error methods as the adapter, so it can take the
+    adapter's place as a job's zeebe_adapter.
+    """
+
+    def __init__(self, zeebe_adapter: ZeebeJobAdapter, sender_threads: int = 2, max_queue_size: int = 1000,
+                 max_in_flight: int = 100, request_timeout: float = 30):
+        """
+        Args:
+            zeebe_adapter (ZeebeJobAdapter): Adapter that sends the updates
+            sender_threads (int): Amount of threads starting calls. Default: 2
+            max_queue_size (int): Maximum amount of queued updates. Default: 1000
+            max_in_flight (int): Maximum amount of calls running at the same time. Default: 100
+            request_timeout (float): Seconds until a call fails with a deadline exceeded error. Default: 30
+        """
+        self.zeebe_adapter = zeebe_adapter
+        self.sender_threads = sender_threads
+        self.request_timeout = request_timeout
+        self._queue = queue.Queue(max_queue_size)
+        self._in_flight_slots = BoundedSemaphore(max_in_flight)
+        self._pending = 0
+        self._pending_condition = Condition()
+        self._threads: List[Thread] = []
+        self._stopped = False
+        # Makes the stopped check and the queueing of an update atomic, so no update is queued after the sentinels
+        self._stop_lock = Lock()
+
+    @property
+    def pending(self) -> int:
+        """Amount of updates that are queued or in flight"""
+        return self._pending
+
+    def start(self) -> None:
+        """
+        Start the sender threads
+        """
+        self._stopped = False
+        for index in range(self.sender_threads):
+            # Daemon threads, so senders that are still waiting for a call when stop's timeout passes don't keep the
+            # process alive
+            thread = Thread(target=self._send_updates, name=f"JobStatusPipeline-Sender-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, wait: bool = True, timeout: float = None) -> bool:
+        """
+        Stop the sender threads once all queued updates are sent. Updates queued after stopping are sent synchronously.
+
+        Args:
+            wait (bool): Wait until all queued and in-flight updates are done
+            timeout (float): Maximum seconds to wait for queued and in-flight updates. Default: None (wait forever)
+
+        Returns:
+            bool: False if the timeout passed with updates still pending
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._stop_lock:
+            if not self._stopped:
+                self._stopped = True
+                for _ in self._threads:
+                    self._queue.put(_STOP)
+        if not wait:
+            return True
+
+        while self._threads:
+            thread = self._threads.pop()
+            thread.join(self._remaining(deadline))
+            if thread.is_alive():
+                self._threads.append(thread)
+                return False
+        with self._pending_condition:
+            return self._pending_condition.wait_for(lambda: self._pending == 0, self._remaining(deadline))
+
+    def complete_job(self, job_key: int, variables: Dict) -> None:
+        self._put("CompleteJob", self.zeebe_adapter.complete_job_future, job_key=job_key, variables=variables)
+
+    def fail_job(self, job_key: int, message: str, retries: int = 0) -> None:
+        self._put("FailJob", self.zeebe_adapter.fail_job_future, job_key=job_key, message=message, retries=retries)
+
+    def throw_error(self, job_key: int, message: str) -> None:
+        self._put("ThrowError", self.zeebe_adapter.throw_error_future, job_key=job_key, message=message)
+
+    def _put(self, rpc_name: str, send: Callable[..., Future], **kwargs) -> None:
+        self._add_pending(1)
+        with self._stop_lock:
+            if not self._stopped:
+                self._queue.put((rpc_name, send, kwargs))
+                return
+        futures.wait([self._send(rpc_name, send, kwargs, holds_in_flight_slot=False)])
+
+    def _send_updates(self) -> None:
+        while True:
+            update = self._queue.get()
+            if update is _STOP:
+                return
+            rpc_name, send, kwargs = update
+            self._in_flight_slots.acquire()
+            self._send(rpc_name, send, kwargs, holds_in_flight_slot=True)
+
+    def _send(self, rpc_name: str, send: Callable[..., Future], kwargs: Dict, holds_in_flight_slot: bool) -> Future:
+        try:
+            future = send(timeout=self.request_timeout, **kwargs)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        future.add_done_callback(lambda done: self._on_update_done(done, rpc_name, kwargs["job_key"],
+                                                                   holds_in_flight_slot))
+        return future
+
+    def _on_update_done(self, future: Future, rpc_name: str, job_key: int, holds_in_flight_slot: bool) -> None:
+        exception = future.exception()
+        if exception:
+            logger.warning(f"{rpc_name} failed for job {job_key}. Error: {exception!r}")
+        if holds_in_flight_slot:
+            self._in_flight_slots.release()
+        self._add_pending(-1)
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def _add_pending(self, amount: int) -> None:
+        with self._pending_condition:
+            self._pending += amount
+            if self._pending == 0:
+                self._pending_condition.notify_all()
@@ -0,0 +1,44 @@
+import random
+
+
+class PollBackoff(object):
+    """
+    Time to wait before polling a task again, after polls that returned no jobs or hit back pressure.
+
+    Every poll without jobs doubles the interval (up to max_interval), the first poll with jobs resets it. The actual
+    wait is shortened by a random jitter, so tasks and workers that backed off together don't poll together again.
+    """
+
+    def __init__(self, initial_interval: float = 0.1, max_interval: float = 5, multiplier: float = 2,
+                 jitter: float = 0.2):
+        """
+        Args:
+            initial_interval (float): Seconds to wait after the first poll without jobs. Default: 0.1
+            max_interval (float): Maximum seconds to wait between polls. Default: 5
+            multiplier (float): Factor the interval grows by after every poll without jobs. Default: 2
+            jitter (float): Maximum fraction of the interval that is randomly cut off each wait. Default: 0.2
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.interval = 0.0
+
+    def backoff(self) -> float:
+        """
+        Grow the interval after a poll without jobs
+
+        Returns:
+            float: Seconds to wait before the next poll
+        """
+        if self.interval:
+            self.interval = min(self.interval * self.multiplier, self.max_interval)
+        else:
+            self.interval = min(self.initial_interval, self.max_interval)
+        return self.interval * (1 - random.uniform(0, self.jitter))
+
+    def reset(self) -> None:
+        """
+        Poll right away again after a poll returned jobs
+        """
+        self.interval = 0.0
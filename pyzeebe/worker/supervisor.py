@@ -0,0 +1,262 @@
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple
+
+from pyzeebe.exceptions import JobAlreadyDeactivated, JobNotFound
+from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
+from pyzeebe.worker.worker import ZeebeWorker
+
+logger = logging.getLogger(__name__)
+
+# A job is only failed if its deadline is further away than this, so the broker's and the supervisor's clocks may
+# differ a bit without failing a job that zeebe already handed out again
+RELEASE_DEADLINE_MARGIN = 1
+
+
+class ZeebeWorkerSupervisor(object):
+    """
+    Runs a ZeebeWorker in several processes and restarts the processes that die.
+
+    Every process calls worker_factory to build its own worker, so each process has its own grpc channel. Stopping the
+    supervisor sends SIGTERM to its processes, which stop their worker with stop(wait=True) so running jobs can finish,
+    or with drain(drain_timeout) if drain_timeout is set.
+
+    Zeebe can't extend the timeout of a running job, so long running tasks need long timeouts, and the jobs of a
+    process that dies are stuck until their timeout passes. With a zeebe_adapter_factory, the processes report their
+    running jobs with every stats report (a heartbeat), and the supervisor fails the jobs of a process that died, so
+    zeebe hands them out again right away. Each of these failures uses up a retry of the job, so a job that keeps
+    killing its process ends in an incident. Jobs activated after the last report still wait for their timeout. Jobs
+    whose timeout passed are skipped: zeebe may have handed them to another worker, and FailJob doesn't check which
+    worker holds a job, so failing them would fail the other worker's job.
+    """
+
+    def __init__(self, worker_factory: Callable[[], ZeebeWorker], processes: int = None,
+                 start_method: str = "spawn", restart_delay: float = 1, stats_interval: float = 5,
+                 shutdown_timeout: float = None, drain_timeout: float = None,
+                 zeebe_adapter_factory: Callable[[], ZeebeAdapter] = None):
+        """
+        Args:
+            worker_factory (Callable[[], ZeebeWorker]): Builds the worker of a process. Has to be picklable (a module level function) unless start_method is fork
+            processes (int): Amount of worker processes. Default: number of CPUs
+            start_method (str): multiprocessing start method. Only use fork if the supervising process has not created any grpc channel. Default: spawn
+            restart_delay (float): Seconds between checks for dead processes. Default: 1
+            stats_interval (float): Seconds between stats reports of the processes. Default: 5
+            shutdown_timeout (float): Seconds to wait for a process to stop before killing it. Default: None (wait forever)
+            drain_timeout (float): Seconds a process waits for its running jobs before failing them, see ZeebeWorker.drain. Should be shorter than shutdown_timeout. Default: None (wait for the jobs)
+            zeebe_adapter_factory (Callable[[], ZeebeAdapter]): Builds the supervisor's connection to zeebe, used to fail the running jobs of processes that died. Can't be used with the fork start method. Default: None (the jobs wait for their timeout)
+
+        Raises:
+            ValueError: If zeebe_adapter_factory is given with the fork start method
+        """
+        if zeebe_adapter_factory and start_method == "fork":
+            raise ValueError("zeebe_adapter_factory can't be used with the fork start method, processes forked after "
+                             "the supervisor created a grpc channel are not safe")
+        self.worker_factory = worker_factory
+        self.processes = processes or os.cpu_count()
+        self.restart_delay = restart_delay
+        self.stats_interval = stats_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.drain_timeout = drain_timeout
+        self.zeebe_adapter_factory = zeebe_adapter_factory
+        self._zeebe_adapter: ZeebeAdapter = None
+        self.restarts = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._stop_event = threading.Event()
+        self._children: Dict[int, multiprocessing.Process] = {}
+        self._stats_connections: Dict[int, Connection] = {}
+        self._child_stats: Dict[int, Dict[str, int]] = {}
+        # (key, retries, deadline) of the running jobs of each process, as of its last report
+        self._child_jobs: Dict[int, List[Tuple[int, int, int]]] = {}
+        self._stats_lock = threading.Lock()
+
+    def run(self) -> None:
+        """
+        Start the worker processes and supervise them until stop() is called or SIGTERM/SIGINT is received
+        """
+        previous_handlers = self._install_signal_handlers()
+        try:
+            for index in range(self.processes):
+                self._start_child(index)
+            while not self._stop_event.is_set():
+                self._collect_stats(timeout=self.restart_delay)
+                self._restart_dead_children()
+            self._stop_children()
+        finally:
+            self._restore_signal_handlers(previous_handlers)
+
+    def stop(self) -> None:
+        """
+        Ask all worker processes to stop. run() returns once they have stopped.
+        """
+        self._stop_event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Stats of all worker processes, as last reported by each process
+
+        Returns:
+            Dict[str, int]: alive processes, restarts, activated jobs (of all processes ever started) and in-flight jobs
+        """
+        alive_pids = {process.pid for process in self._children.values() if process.is_alive()}
+        with self._stats_lock:
+            child_stats = dict(self._child_stats)
+        return {
+            "processes": len(alive_pids),
+            "restarts": self.restarts,
+            "activated_jobs": sum(stats["activated_jobs"] for stats in child_stats.values()),
+            "in_flight_jobs": sum(stats["in_flight_jobs"] for pid, stats in child_stats.items() if pid in alive_pids)
+        }
+
+    def _start_child(self, index: int) -> None:
+        # Every process gets its own pipe, a killed process can't leave a lock held that other processes need
+        stats_connection, child_stats_connection = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=_run_worker, name=f"ZeebeWorker-{index}",
+                                        args=(self.worker_factory, child_stats_connection, self.stats_interval,
+                                              self.drain_timeout, self.zeebe_adapter_factory is not None))
+        process.start()
+        child_stats_connection.close()
+        logger.info(f"Started worker process {process.name} (pid={process.pid})")
+        self._children[index] = process
+        self._stats_connections[index] = stats_connection
+
+    def _restart_dead_children(self) -> None:
+        for index, process in list(self._children.items()):
+            if process.is_alive() or self._stop_event.is_set():
+                continue
+            logger.warning(f"Worker process {process.name} (pid={process.pid}) exited with code {process.exitcode}, "
+                           f"restarting it")
+            process.join()
+            self._receive_stats(index, timeout=0)
+            self._close_stats_connection(index)
+            self._release_jobs(process.pid)
+            self.restarts += 1
+            self._start_child(index)
+
+    def _collect_stats(self, timeout: float) -> None:
+        connections = {connection: index for index, connection in self._stats_connections.items()}
+        if not connections:
+            time.sleep(timeout)
+            return
+        for connection in wait(list(connections), timeout):
+            self._receive_stats(connections[connection])
+
+    def _receive_stats(self, index: int, timeout: float = None) -> None:
+        connection = self._stats_connections.get(index)
+        while connection and connection.poll(timeout):
+            try:
+                stats = connection.recv()
+            except EOFError:
+                self._close_stats_connection(index)
+                return
+            pid = stats.pop("pid")
+            running_jobs = stats.pop("running_jobs", None)
+            with self._stats_lock:
+                self._child_stats[pid] = stats
+                if running_jobs is not None:
+                    self._child_jobs[pid] = running_jobs
+            timeout = 0
+
+    def _release_jobs(self, pid: int) -> List[Future]:
+        # Fails the jobs the process reported in its last heartbeat, jobs it finished since then are already gone
+        running_jobs = self._child_jobs.pop(pid, [])
+        if not running_jobs or not self.zeebe_adapter_factory:
+            return []
+        # Zeebe may have handed out timed out jobs again, they are left to the other worker
+        release_before = (time.time() + RELEASE_DEADLINE_MARGIN) * 1000
+        active_jobs = [(job_key, retries) for job_key, retries, deadline in running_jobs if deadline > release_before]
+        if len(active_jobs) < len(running_jobs):
+            logger.info(f"Skipping {len(running_jobs) - len(active_jobs)} timed out jobs of dead worker process "
+                        f"(pid={pid})")
+        if not active_jobs:
+            return []
+        if self._zeebe_adapter is None:
+            self._zeebe_adapter = self.zeebe_adapter_factory()
+        logger.warning(f"Failing {len(active_jobs)} jobs of dead worker process (pid={pid})")
+        fail_futures = []
+        for job_key, retries in active_jobs:
+            future = self._zeebe_adapter.fail_job_future(
+                job_key=job_key, message=f"Worker process (pid={pid}) died before the job finished, the job can be "
+                                         f"retried", retries=max(retries - 1, 0))
+            future.add_done_callback(lambda done, job_key=job_key: self._on_job_released(done, job_key))
+            fail_futures.append(future)
+        return fail_futures
+
+    @staticmethod
+    def _on_job_released(future: Future, job_key: int) -> None:
+        exception = future.exception()
+        if isinstance(exception, (JobNotFound, JobAlreadyDeactivated)):
+            # The job was completed or cancelled (e.g. its workflow instance) after the last heartbeat
+            logger.debug(f"Job {job_key} of dead worker process is no longer active. Error: {exception!r}")
+        elif exception:
+            logger.warning(f"Failed to fail job {job_key} of dead worker process. Error: {exception!r}")
+
+    def _close_stats_connection(self, index: int) -> None:
+        connection = self._stats_connections.pop(index, None)
+        if connection:
+            connection.close()
+
+    def _stop_children(self) -> None:
+        for process in self._children.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = None if self.shutdown_timeout is None else time.monotonic() + self.shutdown_timeout
+        for process in self._children.values():
+            while process.is_alive() and (deadline is None or time.monotonic() < deadline):
+                self._collect_stats(timeout=0.1)
+            if process.is_alive():
+                logger.warning(f"Worker process {process.name} (pid={process.pid}) did not stop in time, killing it")
+                os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+        self._collect_stats(timeout=0)
+        for index in list(self._stats_connections):
+            self._close_stats_connection(index)
+
+    def _install_signal_handlers(self) -> Dict:
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        return {signum: signal.signal(signum, lambda *_: self.stop()) for signum in (signal.SIGTERM, signal.SIGINT)}
+
+    @staticmethod
+    def _restore_signal_handlers(previous_handlers: Dict) -> None:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+
+def _run_worker(worker_factory: Callable[[], ZeebeWorker], stats_connection: Connection,
+                stats_interval: float, drain_timeout: float = None, report_jobs: bool = False) -> None:
+    # Ctrl-C reaches the whole process group, the supervisor decides when its processes stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker = worker_factory()
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop_event.set())
+    worker.work(watch=True)
+
+    stats_connection.send(_worker_stats(worker, report_jobs))
+    while not worker.stop_event.wait(stats_interval):
+        stats_connection.send(_worker_stats(worker, report_jobs))
+
+    logger.info(f"Stopping worker process (pid={os.getpid()})")
+    if drain_timeout is None:
+        worker.stop(wait=True)
+    else:
+        worker.drain(drain_timeout)
+    stats_connection.send(_worker_stats(worker, report_jobs))
+    stats_connection.close()
+
+
+def _worker_stats(worker: ZeebeWorker, report_jobs: bool = False) -> Dict:
+    stats = {
+        "pid": os.getpid(),
+        "activated_jobs": sum(worker.get_activated_jobs(task.type) for task in worker.tasks),
+        "in_flight_jobs": sum(worker.get_in_flight_jobs(task.type) for task in worker.tasks)
+    }
+    if report_jobs:
+        stats["running_jobs"] = [(job.key, job.retries, job.deadline) for job in worker.get_running_jobs()]
+    return stats
@@ -0,0 +1,87 @@
+from threading import BoundedSemaphore, Condition
+
+
+class TaskCapacity(object):
+    """
+    Keeps track of the in-flight jobs of a task.
+
+    Before activating jobs the worker acquires credits (free job slots). Every activated job holds one credit until it
+    is done, credits that were not used by the activation are released right away. Shared capacities can also be
+    checked for free slots without taking them (see wait_until_free).
+    """
+
+    def __init__(self, max_jobs: int):
+        """
+        Args:
+            max_jobs (int): Maximum amount of in-flight jobs
+        """
+        self.max_jobs = max_jobs
+        self._semaphore = BoundedSemaphore(max_jobs)
+        self._in_flight = 0
+        self._released = Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Amount of jobs that are either being activated or running"""
+        return self._in_flight
+
+    def acquire(self, timeout: float = None, max_credits: int = None) -> int:
+        """
+        Block until at least one job slot is free and then take all free slots
+
+        Args:
+            timeout (float): Maximum seconds to wait for a free slot. Default: None (wait forever)
+            max_credits (int): Take at most this many slots. Default: None (all free slots)
+
+        Returns:
+            int: Amount of acquired credits. 0 if the timeout passed without a free slot
+        """
+        max_credits = min(self.max_jobs, max_credits or self.max_jobs)
+        if not self._semaphore.acquire(timeout=timeout):
+            return 0
+        credits = 1
+        while credits < max_credits and self._semaphore.acquire(blocking=False):
+            credits += 1
+        with self._released:
+            self._in_flight += credits
+        return credits
+
+    def release(self, credits: int = 1) -> None:
+        """
+        Give back credits
+
+        Args:
+            credits (int): Amount of credits to release. Default: 1
+        """
+        with self._released:
+            self._in_flight -= credits
+            self._released.notify_all()
+        for _ in range(credits):
+            self._semaphore.release()
+
+    def wait_until_free(self, timeout: float = None) -> int:
+        """
+        Block until at least one job slot is free, without taking it
+
+        Args:
+            timeout (float): Maximum seconds to wait. Default: None (wait forever)
+
+        Returns:
+            int: Amount of free slots. 0 if the timeout passed without a free slot
+        """
+        with self._released:
+            self._released.wait_for(lambda: self._in_flight < self.max_jobs, timeout)
+            return self.max_jobs - self._in_flight
+
+    def wait_until_idle(self, timeout: float = None) -> bool:
+        """
+        Block until no job is in flight
+
+        Args:
+            timeout (float): Maximum seconds to wait. Default: None (wait forever)
+
+        Returns:
+            bool: False if the timeout passed with jobs still in flight
+        """
+        with self._released:
+            return self._released.wait_for(lambda: self._in_flight == 0, timeout)
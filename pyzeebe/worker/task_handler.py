@@ -1,3 +1,5 @@
+import functools
+import inspect
 import logging
 from abc import abstractmethod
 from typing import Tuple, List, Callable, Dict
@@ -7,6 +9,7 @@ from pyzeebe.exceptions import NoVariableNameGiven, TaskNotFound, DuplicateTaskT
 from pyzeebe.job.job import Job
 from pyzeebe.task.exception_handler import ExceptionHandler
 from pyzeebe.task.task import Task
+from pyzeebe.task.task_registry import TaskRegistry
 from pyzeebe.task.task_decorator import TaskDecorator
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,10 @@ def default_exception_handler(e: Exception, job: Job) -> None:
     job.set_failure_status(f"Failed job. Error: {e}")
 
 
+def _single_value_to_dict(variable_name: str, fn: Callable, *args, **kwargs) -> Dict:
+    return {variable_name: fn(*args, **kwargs)}
+
+
 class ZeebeTaskHandler(ZeebeDecoratorBase):
     def __init__(self, before: List[TaskDecorator] = None, after: List[TaskDecorator] = None):
         """
@@ -25,12 +32,12 @@ class ZeebeTaskHandler(ZeebeDecoratorBase):
             after (List[TaskDecorator]): Decorators to be performed after each task
         """
         super().__init__(before, after)
-        self.tasks: List[Task] = []
+        self.tasks = TaskRegistry()
 
     def task(self, task_type: str, exception_handler: ExceptionHandler = default_exception_handler,
              variables_to_fetch: List[str] = None, timeout: int = 10000, max_jobs_to_activate: int = 32,
              before: List[TaskDecorator] = None, after: List[TaskDecorator] = None, single_value: bool = False,
-             variable_name: str = None):
+             variable_name: str = None, run_in_process_pool: bool = False):
         """
         Decorator to create a task
 
@@ -45,9 +52,13 @@ class ZeebeTaskHandler(ZeebeDecoratorBase):
             timeout (int): Maximum duration of the task in milliseconds. If the timeout is surpasses Zeebe will give up
                             on the job and retry it. Default: 10000
             max_jobs_to_activate (int):  Maximum jobs the worker will execute in parallel (of this task). Default: 32
+            run_in_process_pool (bool): Run the task function in the worker's process pool instead of a thread. Use
+                                        this for CPU bound tasks. The function must be importable (defined at module
+                                        level) and its arguments and return value must be picklable. Default: False
 
         Raises:
             DuplicateTaskType: If a task from the router already exists in the worker
+            ProcessPoolNotSupported: If run_in_process_pool is set on python 3.6
 
         """
         self._is_task_duplicate(task_type)
@@ -58,32 +69,39 @@ class ZeebeTaskHandler(ZeebeDecoratorBase):
         elif single_value and variable_name:
             return self._non_dict_task(task_type=task_type, variable_name=variable_name, timeout=timeout,
                                        max_jobs_to_activate=max_jobs_to_activate, exception_handler=exception_handler,
-                                       before=before, after=after, variables_to_fetch=variables_to_fetch)
+                                       before=before, after=after, variables_to_fetch=variables_to_fetch,
+                                       run_in_process_pool=run_in_process_pool)
 
         else:
             return self._dict_task(task_type=task_type, exception_handler=exception_handler, before=before, after=after,
                                    timeout=timeout, max_jobs_to_activate=max_jobs_to_activate,
-                                   variables_to_fetch=variables_to_fetch)
+                                   variables_to_fetch=variables_to_fetch, run_in_process_pool=run_in_process_pool)
 
     @abstractmethod
     def _dict_task(self, task_type: str, exception_handler: ExceptionHandler = default_exception_handler,
                    timeout: int = 10000, max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                   after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None):
+                   after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                   run_in_process_pool: bool = False):
         raise NotImplemented()
 
     @abstractmethod
     def _non_dict_task(self, task_type: str, variable_name: str,
                        exception_handler: ExceptionHandler = default_exception_handler, timeout: int = 10000,
                        max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                       after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None):
+                       after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                       run_in_process_pool: bool = False):
         raise NotImplemented()
 
     @staticmethod
     def _single_value_function_to_dict(variable_name: str, fn: Callable) -> Callable[..., Dict]:
-        def inner_fn(*args, **kwargs):
-            return {variable_name: fn(*args, **kwargs)}
+        if inspect.iscoroutinefunction(fn):
+            async def async_inner_fn(*args, **kwargs):
+                return {variable_name: await fn(*args, **kwargs)}
 
-        return inner_fn
+            return async_inner_fn
+
+        # A partial of a module level function (unlike a closure) can be pickled and sent to a process pool
+        return functools.partial(_single_value_to_dict, variable_name, fn)
 
     @staticmethod
     def _get_parameters_from_function(fn: Callable) -> List[str]:
@@ -96,11 +114,8 @@ class ZeebeTaskHandler(ZeebeDecoratorBase):
             return list(parameters)
 
     def _is_task_duplicate(self, task_type: str) -> None:
-        try:
-            self.get_task(task_type)
+        if task_type in self.tasks:
             raise DuplicateTaskType(task_type)
-        except TaskNotFound:
-            return
 
     def remove_task(self, task_type: str) -> Task:
         """
@@ -116,8 +131,7 @@ class ZeebeTaskHandler(ZeebeDecoratorBase):
              TaskNotFound: If no task with specified type exists
 
         """
-        task_index = self._get_task_index(task_type)
-        return self.tasks.pop(task_index)
+        return self.tasks.remove(task_type)
 
     def get_task(self, task_type: str) -> Task:
         """
@@ -133,13 +147,29 @@ class ZeebeTaskHandler(ZeebeDecoratorBase):
              TaskNotFound: If no task with specified type exists
 
         """
-        return self._get_task_and_index(task_type)[0]
+        task = self.tasks.get(task_type)
+        if task is None:
+            raise TaskNotFound(f"Could not find task {task_type}")
+        return task
+
+    def replace_task(self, task: Task) -> Task:
+        """
+        Replace the task of the same type, keeping its position
+
+        Args:
+            task (Task): The new task
+
+        Returns:
+            Task: The task that was replaced
+
+        Raises:
+             TaskNotFound: If no task with the task's type exists
+
+        """
+        return self.tasks.replace(task)
 
     def _get_task_index(self, task_type: str) -> int:
-        return self._get_task_and_index(task_type)[-1]
+        return self.tasks.index(task_type)
 
     def _get_task_and_index(self, task_type: str) -> Tuple[Task, int]:
-        for index, task in enumerate(self.tasks):
-            if task.type == task_type:
-                return task, index
-        raise TaskNotFound(f"Could not find task {task_type}")
+        return self.get_task(task_type), self._get_task_index(task_type)
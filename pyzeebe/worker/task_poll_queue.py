@@ -0,0 +1,59 @@
+import heapq
+import itertools
+import time
+from threading import Condition
+from typing import List, Optional, Tuple
+
+from pyzeebe.task.task import Task
+
+
+class TaskPollQueue(object):
+    """
+    Tasks waiting to be polled by the shared pollers of a worker, ordered by the time they are due.
+
+    Tasks that are due at the same time are handed out in the order they were put back, so a task that keeps getting
+    jobs goes to the back of the line and can't starve the other tasks.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Task]] = []
+        self._counter = itertools.count()
+        self._condition = Condition()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, task: Task, delay: float = 0) -> None:
+        """
+        Queue a task to be polled
+
+        Args:
+            task (Task): The task to poll
+            delay (float): Seconds until the task is due. Default: 0
+        """
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), task))
+            self._condition.notify()
+
+    def get(self, timeout: float = None) -> Optional[Task]:
+        """
+        Take the task that is due first, waiting until it is due
+
+        Args:
+            timeout (float): Maximum seconds to wait. Default: None (wait forever)
+
+        Returns:
+            Task: The task to poll. None if no task was due before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now:
+                    return heapq.heappop(self._heap)[2]
+                if deadline is not None and now >= deadline:
+                    return None
+                wait_until = self._heap[0][0] if self._heap else deadline
+                if deadline is not None and wait_until is not None:
+                    wait_until = min(wait_until, deadline)
+                self._condition.wait(None if wait_until is None else wait_until - now)
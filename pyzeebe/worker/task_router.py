@@ -9,7 +9,8 @@ from pyzeebe.worker.task_handler import ZeebeTaskHandler, default_exception_hand
 class ZeebeTaskRouter(ZeebeTaskHandler):
     def _dict_task(self, task_type: str, exception_handler: ExceptionHandler = default_exception_handler,
                    timeout: int = 10000, max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                   after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None):
+                   after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                   run_in_process_pool: bool = False):
         def wrapper(fn: Callable[..., Dict]):
             nonlocal variables_to_fetch
             if not variables_to_fetch:
@@ -17,7 +18,8 @@ class ZeebeTaskRouter(ZeebeTaskHandler):
 
             task = self._create_task(task_type=task_type, task_handler=fn, exception_handler=exception_handler,
                                      timeout=timeout, max_jobs_to_activate=max_jobs_to_activate, before=before,
-                                     after=after, variables_to_fetch=variables_to_fetch)
+                                     after=after, variables_to_fetch=variables_to_fetch,
+                                     run_in_process_pool=run_in_process_pool)
 
             self.tasks.append(task)
             return fn
@@ -27,7 +29,8 @@ class ZeebeTaskRouter(ZeebeTaskHandler):
     def _non_dict_task(self, task_type: str, variable_name: str,
                        exception_handler: ExceptionHandler = default_exception_handler, timeout: int = 10000,
                        max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                       after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None):
+                       after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                       run_in_process_pool: bool = False):
         def wrapper(fn: Callable[..., Dict]):
             nonlocal variables_to_fetch
             if not variables_to_fetch:
@@ -37,7 +40,8 @@ class ZeebeTaskRouter(ZeebeTaskHandler):
 
             task = self._create_task(task_type=task_type, task_handler=dict_fn, exception_handler=exception_handler,
                                      timeout=timeout, max_jobs_to_activate=max_jobs_to_activate, before=before,
-                                     after=after, variables_to_fetch=variables_to_fetch)
+                                     after=after, variables_to_fetch=variables_to_fetch,
+                                     run_in_process_pool=run_in_process_pool)
 
             self.tasks.append(task)
             return fn
@@ -46,9 +50,11 @@ class ZeebeTaskRouter(ZeebeTaskHandler):
 
     def _create_task(self, task_type: str, task_handler: Callable, exception_handler: ExceptionHandler,
                      timeout: int = 10000, max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                     after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None) -> Task:
+                     after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                     run_in_process_pool: bool = False) -> Task:
         task = Task(task_type=task_type, task_handler=task_handler, exception_handler=exception_handler,
-                    timeout=timeout, max_jobs_to_activate=max_jobs_to_activate, variables_to_fetch=variables_to_fetch)
+                    timeout=timeout, max_jobs_to_activate=max_jobs_to_activate, variables_to_fetch=variables_to_fetch,
+                    run_in_process_pool=run_in_process_pool)
         return self._add_decorators_to_task(task, before or [], after or [])
 
     def _add_decorators_to_task(self, task: Task, before: List[TaskDecorator],
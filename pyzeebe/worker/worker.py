@@ -1,29 +1,46 @@
 import logging
-import socket
 import time
-from threading import Thread, Event
-from typing import List, Callable, Generator, Tuple, Dict, Union
+from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
+from threading import Condition, Event, Lock, Thread
+from typing import List, Callable, Generator, Tuple, Dict, Optional
 
 from pyzeebe.credentials.base_credentials import BaseCredentials
-from pyzeebe.exceptions.pyzeebe_exceptions import MaxConsecutiveTaskThreadError
+from pyzeebe.exceptions import MaxConsecutiveTaskThreadError, ZeebeBackPressure
+from pyzeebe.grpc_internals.job_scheduler import JobScheduler, ScheduledCall
+from pyzeebe.grpc_internals.json_codec import JsonCodec
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.job.job import Job
-from pyzeebe.task.exception_handler import ExceptionHandler
+from pyzeebe.job.job_context import set_current_job
+from pyzeebe.job.job_status import JobStatus
+from pyzeebe.metrics.metrics import Metrics
+from pyzeebe.tracing.tracing import Tracing
 from pyzeebe.task.task import Task
 from pyzeebe.task.task_decorator import TaskDecorator
-from pyzeebe.worker.task_handler import ZeebeTaskHandler, default_exception_handler
-from pyzeebe.worker.task_router import ZeebeTaskRouter
+from pyzeebe.worker.job_executor import JobExecutor, ThreadPoolJobExecutor
+from pyzeebe.worker.job_logger import JobLogger
+from pyzeebe.worker.job_status_pipeline import JobStatusPipeline
+from pyzeebe.worker.task_capacity import TaskCapacity
+from pyzeebe.worker.task_poll_queue import TaskPollQueue
+from pyzeebe.worker.zeebe_worker_base import ZeebeWorkerBase
 
 logger = logging.getLogger(__name__)
 
 
-class ZeebeWorker(ZeebeTaskHandler):
+class ZeebeWorker(ZeebeWorkerBase):
     """A zeebe worker that can connect to a zeebe instance and perform tasks."""
 
     def __init__(self, name: str = None, request_timeout: int = 0, hostname: str = None, port: int = None,
                  credentials: BaseCredentials = None, secure_connection: bool = False,
                  before: List[TaskDecorator] = None, after: List[TaskDecorator] = None,
-                 max_connection_retries: int = 10, watcher_max_errors_factor: int = 3):
+                 max_connection_retries: int = 10, watcher_max_errors_factor: int = 3,
+                 max_concurrent_jobs: int = 100, job_executor: JobExecutor = None, max_processes: int = None,
+                 poller_threads: int = None, idle_poll_interval: float = 0.1, max_poll_interval: float = 5,
+                 retry_policy: RetryPolicy = None, rate_limits: Dict[str, float] = None,
+                 status_sender_threads: int = 0, status_queue_size: int = 1000, json_codec: JsonCodec = None,
+                 structured_logging: bool = False, enforce_job_deadlines: bool = False, metrics: Metrics = None,
+                 tracing: Tracing = None):
         """
         Args:
             hostname (str): Zeebe instance hostname
@@ -34,21 +51,61 @@ class ZeebeWorker(ZeebeTaskHandler):
             after (List[TaskDecorator]): Decorators to be performed after each task
             max_connection_retries (int): Amount of connection retries before worker gives up on connecting to zeebe. To setup with infinite retries use -1
             watcher_max_errors_factor (int): Number of consequtive errors for a task watcher will accept before raising MaxConsecutiveTaskThreadError
+            max_concurrent_jobs (int): Maximum amount of jobs the worker will activate and run at the same time across all tasks. If job_executor is given, its max_workers is used instead (if it has one). Default: 100
+            job_executor (JobExecutor): Executor that runs the jobs. Default: ThreadPoolJobExecutor with max_concurrent_jobs threads
+            max_processes (int): Size of the process pool used by run_in_process_pool tasks. Default: number of CPUs
+            poller_threads (int): Poll all tasks from this many shared threads instead of one thread per task. Default: None (one thread per task)
+            idle_poll_interval (float): Seconds to wait before polling a task again after it returned no jobs. Doubles with every empty poll. Default: 0.1
+            max_poll_interval (float): Maximum seconds to wait between polls of a task. Default: 5
+            retry_policy (RetryPolicy): Retry policy of calls to zeebe. Default: None (calls are not retried)
+            rate_limits (Dict[str, float]): Maximum calls per second by RPC name, e.g. {"CompleteJob": 100}. Default: None (no limits)
+            status_sender_threads (int): If set, job status updates are queued and sent in the background by this many threads, freeing job threads right away. Default: 0 (sent by the job's thread)
+            status_queue_size (int): Maximum amount of queued job status updates. Default: 1000
+            json_codec (JsonCodec): Codec of job variables and headers, e.g. get_json_codec() for the fastest installed one. Default: StdlibJsonCodec
+            structured_logging (bool): Log jobs with structured fields (job key, task type, timing) instead of their repr. See StructuredLogFormatter. Default: False
+            enforce_job_deadlines (bool): Skip jobs whose deadline passed before they started and cancel jobs that run past it (see Job.cancelled), so their threads are freed for jobs that can still succeed. Default: False
+            metrics (Metrics): Receives measurements of jobs (activations, durations, outcomes, queued and in-flight jobs) and calls to zeebe, e.g. PrometheusMetrics(). Default: None (not measured)
+            tracing (Tracing): Traces jobs and calls to zeebe, e.g. OpenTelemetryTracing(). Default: None (not traced)
         """
-        super().__init__(before, after)
+        super().__init__(name, request_timeout, before, after, max_processes, idle_poll_interval, max_poll_interval,
+                         enforce_job_deadlines, metrics, tracing)
         self.zeebe_adapter = ZeebeAdapter(hostname=hostname, port=port, credentials=credentials,
                                           secure_connection=secure_connection,
-                                          max_connection_retries=max_connection_retries)
-        self.name = name or socket.gethostname()
-        self.request_timeout = request_timeout
+                                          max_connection_retries=max_connection_retries,
+                                          retry_policy=retry_policy, rate_limits=rate_limits, json_codec=json_codec,
+                                          metrics=metrics, tracing=tracing)
         self.stop_event = Event()
+        self._job_logger = JobLogger(logger, structured_logging)
         self._task_threads: Dict[str, Thread] = {}
+        self._draining_threads: List[Thread] = []
+        self._polling_lock = Lock()
+        self._working = False
+        self._watch = False
+        self._in_flight_jobs: Dict[int, Job] = {}
+        self._in_flight_condition = Condition()
+        self._abandon_jobs = False
+        self._scheduler = JobScheduler(f"{self.__class__.__name__}-Scheduler")
+        self._task_capacities: Dict[str, TaskCapacity] = {}
+        # Capacities of removed or replaced tasks whose jobs are still running
+        self._retired_capacities: Dict[str, TaskCapacity] = {}
+        self._activated_jobs: Dict[str, int] = {}
         self.watcher_max_errors_factor = watcher_max_errors_factor
         self._watcher_thread  = None
+        self.poller_threads = poller_threads
+        self._poll_queue = TaskPollQueue()
+        self._poller_threads: List[Thread] = []
+        self.status_sender_threads = status_sender_threads
+        self.status_queue_size = status_queue_size
+        self.job_status_pipeline: JobStatusPipeline = None
+        self.job_executor = job_executor or ThreadPoolJobExecutor(max_workers=max_concurrent_jobs,
+                                                                  thread_name_prefix=f"{self.__class__.__name__}-Job")
+        # Slots shared by all tasks. Jobs beyond the executor's size would wait in its queue, where their timeout runs
+        self._job_capacity = TaskCapacity(getattr(self.job_executor, "max_workers", max_concurrent_jobs))
 
     def work(self, watch: bool = False) -> None:
         """
-        Start the worker. The worker will poll zeebe for jobs of each task in a different thread.
+        Start the worker. The worker will poll zeebe for jobs of each task in a different thread, or from
+        poller_threads shared threads if it is set.
 
         Args:
             watch (bool): Start a watcher thread that restarts task threads on error
@@ -60,13 +117,102 @@ class ZeebeWorker(ZeebeTaskHandler):
             ZeebeInternalError: If Zeebe experiences an internal error
 
         """
-        for task in self.tasks:
-            task_thread = self._start_task_thread(task)
-            self._task_threads[task.type] = task_thread
+        if self.status_sender_threads:
+            self.job_status_pipeline = JobStatusPipeline(self.zeebe_adapter, sender_threads=self.status_sender_threads,
+                                                         max_queue_size=self.status_queue_size)
+            self.job_status_pipeline.start()
+
+        with self._polling_lock:
+            self._working = True
+            self._watch = watch
+            if self.poller_threads:
+                self._start_poller_threads()
+                return
+
+            for task in self.tasks:
+                self._start_polling(task)
+
+    def remove_task(self, task_type: str, wait: bool = False, timeout: float = None) -> Task:
+        """
+        Remove a task. On a running worker the task is no longer polled, jobs of the task that are already running
+        finish as usual.
+
+        Args:
+            task_type (str): The type of the wanted task
+            wait (bool): Wait until the task's poller stopped and its running jobs are done
+            timeout (float): Maximum seconds to wait. Default: None (wait forever)
+
+        Returns:
+            Task: The task that was removed
+
+        Raises:
+             TaskNotFound: If no task with specified type exists
+
+        """
+        with self._polling_lock:
+            task = super().remove_task(task_type)
+            self._retire_task_capacity(task_type)
+            task_thread = self._task_threads.pop(task_type, None)
+            if task_thread:
+                self._draining_threads.append(task_thread)
+        if wait:
+            self._drain_task(task_type, task_thread, timeout)
+        return task
+
+    def replace_task(self, task: Task) -> Task:
+        """
+        Replace the task of the same type, keeping its position. On a running worker the new task is polled right away
+        and jobs of the replaced task that are already running finish as usual.
+
+        Args:
+            task (Task): The new task
+
+        Returns:
+            Task: The task that was replaced
+
+        Raises:
+             TaskNotFound: If no task with the task's type exists
+
+        """
+        with self._polling_lock:
+            replaced_task = super().replace_task(task)
+            self._retire_task_capacity(task.type)
+            task_thread = self._task_threads.pop(task.type, None)
+            if task_thread:
+                self._draining_threads.append(task_thread)
+            if self._working:
+                self._start_polling(task)
+        return replaced_task
+
+    def _add_task(self, task: Task) -> None:
+        with self._polling_lock:
+            super()._add_task(task)
+            if self._working:
+                self._start_polling(task)
 
-        if watch:
+    def _start_polling(self, task: Task) -> None:
+        if self.stop_event.is_set():
+            return
+        if self.poller_threads:
+            self._poll_queue.put(task)
+            return
+        self._task_threads[task.type] = self._start_task_thread(task)
+        if self._watch and not (self._watcher_thread and self._watcher_thread.is_alive()):
             self._start_watcher_thread()
 
+    def _drain_task(self, task_type: str, task_thread: Optional[Thread], timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if task_thread:
+            task_thread.join(timeout)
+        capacity = self._retired_capacities.get(task_type)
+        if capacity is None:
+            return True
+        return capacity.wait_until_idle(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def _is_task_polled(self, task: Task) -> bool:
+        # A task that was removed or replaced is not polled any more
+        return self.tasks.get(task.type) is task
+
     def _start_task_thread(self, task: Task) -> Thread:
         if self.stop_event.is_set():
             raise RuntimeError("Tried to start a task with stop_event set")
@@ -77,6 +223,17 @@ class ZeebeWorker(ZeebeTaskHandler):
         task_thread.start()
         return task_thread
 
+    def _start_poller_threads(self) -> None:
+        if self.stop_event.is_set():
+            raise RuntimeError("Tried to start pollers with stop_event set")
+        for task in self.tasks:
+            self._poll_queue.put(task)
+        for index in range(self.poller_threads):
+            logger.debug(f"Starting poller thread {index}")
+            poller_thread = Thread(target=self._poll_tasks, name=f"{self.__class__.__name__}-Poller-{index}")
+            poller_thread.start()
+            self._poller_threads.append(poller_thread)
+
     def _start_watcher_thread(self):
         self._watcher_thread = Thread(target=self._watch_task_threads,
                                       name=f"{self.__class__.__name__}-Watch")
@@ -92,12 +249,95 @@ class ZeebeWorker(ZeebeTaskHandler):
         self.stop_event.set()
         if wait:
             self._join_task_threads()
+            self.job_executor.shutdown(wait=True)
+            self._shutdown_process_pool(wait=True)
+            self._scheduler.stop()
+        if self.job_status_pipeline:
+            # Flushes the queued job status updates, updates of jobs that are still running are sent synchronously
+            self.job_status_pipeline.stop(wait=wait)
+
+    def drain(self, timeout: float = 30, fail_timeout: float = 5) -> bool:
+        """
+        Stop the worker within a deadline. The worker stops activating jobs, waits for its running jobs to finish and
+        sends their pending status updates. Jobs that a poll still returns while draining are failed right away instead
+        of being run. Jobs that are still running when the deadline passes are failed without
+        using up a retry, so Zeebe hands them out again right away instead of waiting for their timeout. Their
+        handlers are left to finish in the background, but their results are not sent to Zeebe.
+
+        Args:
+            timeout (float): Seconds to wait for running jobs and pending status updates. Default: 30
+            fail_timeout (float): Seconds to wait for the FailJob calls of unfinished jobs. Default: 5
+
+        Returns:
+            bool: True if all jobs finished and all status updates were sent before the deadline
+        """
+        deadline = time.monotonic() + timeout
+        logger.info(f"Draining worker {self.name} (timeout={timeout})")
+        self.stop_event.set()
+        self._join_task_threads(timeout=timeout)
+        with self._in_flight_condition:
+            # A poller that is still waiting for ActivateJobs may get jobs after this, they are released, not run
+            self._abandon_jobs = True
+        drained = self._wait_for_in_flight_jobs(self._remaining(deadline))
+        if not drained:
+            self._fail_unfinished_jobs(fail_timeout)
+        if self.job_status_pipeline:
+            drained = self.job_status_pipeline.stop(wait=True, timeout=self._remaining(deadline)) and drained
+        self.job_executor.shutdown(wait=False)
+        self._shutdown_process_pool(wait=False)
+        self._scheduler.stop()
+        return drained
+
+    def get_running_jobs(self) -> List[Job]:
+        """
+        Get the jobs that were handed to the job executor and are not done yet
+
+        Returns:
+            List[Job]: The running (or queued) jobs
+        """
+        with self._in_flight_condition:
+            return list(self._in_flight_jobs.values())
+
+    def _wait_for_in_flight_jobs(self, timeout: float = None) -> bool:
+        with self._in_flight_condition:
+            return self._in_flight_condition.wait_for(lambda: not self._in_flight_jobs, timeout)
+
+    def _fail_unfinished_jobs(self, timeout: float) -> None:
+        jobs = self.get_running_jobs()
+        logger.warning(f"{len(jobs)} jobs did not finish before the drain deadline, failing them")
+        fail_futures = [self._abandon_job(job, timeout) for job in jobs]
+        _, not_done = futures.wait(fail_futures, timeout)
+        if not_done:
+            logger.warning(f"{len(not_done)} FailJob calls did not finish within {timeout} seconds")
+
+    def _abandon_job(self, job: Job, timeout: float = None) -> futures.Future:
+        # The job's handler may still finish, the status keeps it from sending a result for a job Zeebe handed out again
+        job.status = JobStatus.Failed
+        job.cancel()
+        future = self.zeebe_adapter.fail_job_future(
+            job_key=job.key, message=f"Worker {self.name} stopped before the job finished, the job can be retried",
+            retries=max(job.retries, 1), timeout=timeout)
+        future.add_done_callback(lambda done: self._on_abandoned_job_failed(done, job))
+        return future
+
+    @staticmethod
+    def _on_abandoned_job_failed(future: futures.Future, job: Job) -> None:
+        if future.exception():
+            logger.warning(f"Failed to fail unfinished job {job.key}. Error: {future.exception()!r}")
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        return max(0.0, deadline - time.monotonic())
 
-    def _join_task_threads(self) -> None:
+    def _join_task_threads(self, timeout: float = None) -> None:
         logger.debug("Waiting for threads to join")
-        while self._task_threads:
-            _, thread = self._task_threads.popitem()
-            thread.join()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        threads = list(self._task_threads.values()) + self._poller_threads + self._draining_threads
+        self._task_threads.clear()
+        self._poller_threads = []
+        self._draining_threads = []
+        for thread in threads:
+            thread.join(None if deadline is None else self._remaining(deadline))
         logger.debug("All threads joined")
 
     def _watch_task_threads(self, frequency: int = 10) -> None:
@@ -126,6 +366,10 @@ class ZeebeWorker(ZeebeTaskHandler):
             logger.debug("Checking task thread status")
             # converting to list to avoid "RuntimeError: dictionary changed size during iteration"
             for task_type in list(self._task_threads.keys()):
+                if task_type not in self.tasks:
+                    # The task was removed while the worker is running
+                    consecutive_errors.pop(task_type, None)
+                    continue
                 consecutive_errors.setdefault(task_type, 0)
                 # thread might be none, if dict changed size, in that case we'll consider it
                 # an error, and check if we should handle it
@@ -152,13 +396,18 @@ class ZeebeWorker(ZeebeTaskHandler):
                                                 f" for task {task_type}", task_type)
 
     def _restart_task_thread(self, task_type: str) -> None:
-        task = self.get_task(task_type)
-        self._task_threads[task_type] = self._start_task_thread(task)
+        with self._polling_lock:
+            task = self.tasks.get(task_type)
+            task_thread = self._task_threads.get(task_type)
+            if task is None or (task_thread and task_thread.is_alive()):
+                # Removed or already replaced in the meantime
+                return
+            self._task_threads[task_type] = self._start_task_thread(task)
 
     def _handle_task(self, task: Task) -> None:
         logger.debug(f"Handling task {task}")
         retries = 0
-        while self._should_handle_task():
+        while self._should_handle_task() and self._is_task_polled(task):
             if self.zeebe_adapter.retrying_connection:
                 if retries % 10 == 0:
                     logger.debug(f"Waiting for connection to {self.zeebe_adapter.connection_uri or 'zeebe'}")
@@ -166,121 +415,254 @@ class ZeebeWorker(ZeebeTaskHandler):
                 time.sleep(0.5)
                 continue
 
-            self._handle_jobs(task)
+            delay = self._poll_task_once(task)
+            if delay:
+                self.stop_event.wait(delay)
         logger.info(f"Handle task thread for {task.type} ending")
 
-    def _handle_jobs(self, task: Task) -> None:
-        for job in self._get_jobs(task):
-            thread = Thread(target=task.handler,
-                            args=(job,),
-                            name=f"{self.__class__.__name__}-Job-{job.type}")
-            logger.debug(f"Running job: {job}")
-            thread.start()
-
-    def _get_jobs(self, task: Task) -> Generator[Job, None, None]:
-        logger.debug(f"Activating jobs for task: {task}")
-        return self.zeebe_adapter.activate_jobs(task_type=task.type, worker=self.name, timeout=task.timeout,
-                                                max_jobs_to_activate=task.max_jobs_to_activate,
-                                                variables_to_fetch=task.variables_to_fetch,
-                                                request_timeout=self.request_timeout)
+    def _poll_task_once(self, task: Task, capacity_timeout: float = 1,
+                        request_timeout: int = None) -> Optional[float]:
+        backoff = self._get_poll_backoff(task)
+        try:
+            activated_jobs = self._handle_jobs(task, capacity_timeout=capacity_timeout,
+                                               request_timeout=request_timeout)
+        except ZeebeBackPressure:
+            delay = backoff.backoff()
+            logger.warning(f"Zeebe is in back pressure, polling task {task.type} again in {delay:.2f} seconds")
+            return delay
+
+        if activated_jobs is None:
+            return None
+        elif activated_jobs:
+            backoff.reset()
+            return 0
+        return backoff.backoff()
+
+    def _poll_tasks(self) -> None:
+        logger.debug("Polling tasks")
+        while self._should_handle_task():
+            task = self._poll_queue.get(timeout=1)
+            if not task or not self._is_task_polled(task):
+                continue
 
-    def include_router(self, *routers: ZeebeTaskRouter) -> None:
+            delay = self.idle_poll_interval
+            try:
+                if self.zeebe_adapter.retrying_connection:
+                    delay = 0.5
+                else:
+                    delay = self._poll_task_once(task, capacity_timeout=0, request_timeout=-1)
+                    if delay is None:
+                        # The task is saturated, it gets another turn after idle_poll_interval
+                        delay = self.idle_poll_interval
+            except Exception as e:
+                # The thread is shared by all tasks, an error of one task must not stop the others from being polled
+                logger.warning(f"Failed to activate jobs for task {task.type}. Error: {e!r}")
+            finally:
+                self._poll_queue.put(task, delay)
+        logger.info("Poller thread ending")
+
+    def _handle_jobs(self, task: Task, capacity_timeout: float = 1, request_timeout: int = None) -> Optional[int]:
+        if not self._wait_for_retired_capacity(task.type, capacity_timeout):
+            return None
+        capacity = self._get_task_capacity(task)
+        credits = capacity.acquire(timeout=capacity_timeout)
+        if not credits:
+            return None
+        # The worker's free slots are not reserved, an idle task would hold them for the whole long poll and starve
+        # the other tasks. Each activated job takes its worker slot when it arrives
+        free_worker_slots = self._job_capacity.wait_until_free(timeout=capacity_timeout)
+        capacity.release(credits - min(credits, free_worker_slots))
+        credits = min(credits, free_worker_slots)
+        if not credits:
+            return None
+
+        activated_jobs = 0
+        activation_started_at = None
+        try:
+            if not self._should_handle_task():
+                return None
+            activation_started_at = time.monotonic()
+            for job in self._get_jobs(task, max_jobs_to_activate=credits, request_timeout=request_timeout):
+                activated_jobs += 1
+                # Other tasks may have used up the slots during the poll, the job then waits for one of their jobs
+                self._job_capacity.acquire(max_credits=1)
+                self._submit_job(task, job, capacity)
+        finally:
+            capacity.release(credits - activated_jobs)
+            self._activated_jobs[task.type] = self._activated_jobs.get(task.type, 0) + activated_jobs
+            if activation_started_at is not None:
+                self.metrics.jobs_activated(task.type, activated_jobs, time.monotonic() - activation_started_at)
+        return activated_jobs
+
+    def _submit_job(self, task: Task, job: Job, capacity: TaskCapacity) -> None:
+        with self._in_flight_condition:
+            abandon_job = self._abandon_jobs
+            if not abandon_job:
+                self._in_flight_jobs[job.key] = job
+        if abandon_job:
+            # Activated after the worker started draining
+            capacity.release()
+            self._job_capacity.release()
+            self._abandon_job(job)
+            return
+
+        self._job_logger.running(job)
+        self.metrics.job_queued(task.type)
+        try:
+            future = self.job_executor.submit(task, job)
+        except Exception as e:
+            # E.g. the job executor was shut down while the job was being activated
+            logger.warning(f"Failed to submit job {job.key}, releasing it. Error: {e!r}")
+            self.metrics.job_rejected(task.type)
+            self._job_done(job, capacity)
+            self._abandon_job(job)
+            return
+        future.add_done_callback(lambda _: self._job_done(job, capacity))
+
+    def _job_done(self, job: Job, capacity: TaskCapacity) -> None:
+        capacity.release()
+        self._job_capacity.release()
+        self.metrics.job_done(job.type)
+        with self._in_flight_condition:
+            self._in_flight_jobs.pop(job.key, None)
+            if not self._in_flight_jobs:
+                self._in_flight_condition.notify_all()
+
+    def _get_task_capacity(self, task: Task) -> TaskCapacity:
+        if task.type not in self._task_capacities:
+            self._task_capacities[task.type] = TaskCapacity(task.max_jobs_to_activate)
+        return self._task_capacities[task.type]
+
+    def _retire_task_capacity(self, task_type: str) -> None:
+        # The capacity was sized for the old task. Its running jobs keep releasing into it, the next task of the type
+        # gets a new capacity once they are done (see _wait_for_retired_capacity)
+        capacity = self._task_capacities.pop(task_type, None)
+        if capacity is not None:
+            self._retired_capacities[task_type] = capacity
+
+    def _wait_for_retired_capacity(self, task_type: str, timeout: float = None) -> bool:
+        # Activating jobs of a task while the jobs of the task it replaced still run would exceed max_jobs_to_activate
+        capacity = self._retired_capacities.get(task_type)
+        if capacity is None:
+            return True
+        if not capacity.wait_until_idle(timeout):
+            return False
+        if self._retired_capacities.get(task_type) is capacity:
+            del self._retired_capacities[task_type]
+        return True
+
+    def get_in_flight_jobs(self, task_type: str) -> int:
         """
-        Adds all router's tasks to the worker.
+        Get the amount of jobs of a task that are being activated or running
 
-        Raises:
-            DuplicateTaskType: If a task from the router already exists in the worker
+        Args:
+            task_type (str): The type of the wanted task
 
+        Returns:
+            int: Amount of in-flight jobs
         """
-        for router in routers:
-            for task in router.tasks:
-                self._add_task(task)
-
-    def _dict_task(self, task_type: str, exception_handler: ExceptionHandler = default_exception_handler,
-                   timeout: int = 10000, max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                   after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None):
-        def wrapper(fn: Callable[..., Dict]):
-            nonlocal variables_to_fetch
-            if not variables_to_fetch:
-                variables_to_fetch = self._get_parameters_from_function(fn)
-
-            task = Task(task_type=task_type, task_handler=fn, exception_handler=exception_handler, timeout=timeout,
-                        max_jobs_to_activate=max_jobs_to_activate, before=before, after=after,
-                        variables_to_fetch=variables_to_fetch)
-            self._add_task(task)
+        capacities = [self._task_capacities.get(task_type), self._retired_capacities.get(task_type)]
+        return sum(capacity.in_flight for capacity in capacities if capacity)
 
-            return fn
-
-        return wrapper
-
-    def _non_dict_task(self, task_type: str, variable_name: str,
-                       exception_handler: ExceptionHandler = default_exception_handler, timeout: int = 10000,
-                       max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
-                       after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None):
-        def wrapper(fn: Callable[..., Union[str, bool, int, List]]):
-            nonlocal variables_to_fetch
-            if not variables_to_fetch:
-                variables_to_fetch = self._get_parameters_from_function(fn)
-
-            dict_fn = self._single_value_function_to_dict(variable_name=variable_name, fn=fn)
-
-            task = Task(task_type=task_type, task_handler=dict_fn, exception_handler=exception_handler, timeout=timeout,
-                        max_jobs_to_activate=max_jobs_to_activate, before=before, after=after,
-                        variables_to_fetch=variables_to_fetch)
-            self._add_task(task)
+    def get_activated_jobs(self, task_type: str) -> int:
+        """
+        Get the amount of jobs of a task the worker has activated since it started
 
-            return fn
+        Args:
+            task_type (str): The type of the wanted task
 
-        return wrapper
+        Returns:
+            int: Amount of activated jobs
+        """
+        return self._activated_jobs.get(task_type, 0)
 
-    def _add_task(self, task: Task) -> None:
-        self._is_task_duplicate(task.type)
-        task.handler = self._create_task_handler(task)
-        self.tasks.append(task)
+    def _get_jobs(self, task: Task, max_jobs_to_activate: int = None,
+                  request_timeout: int = None) -> Generator[Job, None, None]:
+        logger.debug("Activating jobs for task: %s", task)
+        if request_timeout is None:
+            request_timeout = self.request_timeout
+        return self.zeebe_adapter.activate_jobs(task_type=task.type, worker=self.name, timeout=task.timeout,
+                                                max_jobs_to_activate=max_jobs_to_activate or task.max_jobs_to_activate,
+                                                variables_to_fetch=self.tracing.get_variables_to_fetch(
+                                                    task.variables_to_fetch),
+                                                request_timeout=request_timeout)
 
     def _create_task_handler(self, task: Task) -> Callable[[Job], Job]:
         before_decorator_runner = self._create_before_decorator_runner(task)
         after_decorator_runner = self._create_after_decorator_runner(task)
 
         def task_handler(job: Job) -> Job:
-            job = before_decorator_runner(job)
-            job, task_succeeded = self._run_task_inner_function(task, job)
-            job = after_decorator_runner(job)
-            if task_succeeded:
-                self._complete_job(job)
-            return job
+            started_at = time.monotonic()
+            self.metrics.job_started(job.type)
+            if self._should_skip_job(job):
+                return job
+            with self.tracing.job_span(job, task.timeout):
+                return self._handle_job(task, job, before_decorator_runner, after_decorator_runner, started_at)
 
         return task_handler
 
-    @staticmethod
-    def _run_task_inner_function(task: Task, job: Job) -> Tuple[Job, bool]:
+    def _handle_job(self, task: Task, job: Job, before_decorator_runner: Callable[[Job], Job],
+                    after_decorator_runner: Callable[[Job], Job], started_at: float) -> Job:
+        if self.job_status_pipeline:
+            job.zeebe_adapter = self.job_status_pipeline
+        deadline_call = self._schedule_deadline(job)
+        previous_job = set_current_job(job)
+        try:
+            with self.tracing.stage_span("before decorators"):
+                job = before_decorator_runner(job)
+            job, task_succeeded = self._run_task_inner_function(task, job)
+            with self.tracing.stage_span("after decorators"):
+                job = after_decorator_runner(job)
+        finally:
+            set_current_job(previous_job)
+            if deadline_call:
+                deadline_call.cancel()
+        duration = time.monotonic() - started_at
+        if job.cancelled:
+            if job.status == JobStatus.Running:
+                self._count_deadline_stats(job.type, overrun_jobs=1, wasted_seconds=duration)
+        elif task_succeeded and job.status == JobStatus.Running:
+            with self.tracing.stage_span("complete job"):
+                self._complete_job(job)
+        self._job_finished(job, task_succeeded, duration)
+        return job
+
+    def _run_task_inner_function(self, task: Task, job: Job) -> Tuple[Job, bool]:
         task_succeeded = False
         try:
-            job.variables = task.inner_function(**job.variables)
+            with self.tracing.stage_span("task function"):
+                job.variables = self._call_task_function(task, job.variables)
             task_succeeded = True
         except Exception as e:
-            logger.debug(f"Failed job: {job}. Error: {e}.")
-            task.exception_handler(e, job)
+            self._job_logger.failed(job, e)
+            if job.status == JobStatus.Running and not job.cancelled:
+                task.exception_handler(e, job)
         finally:
             return job, task_succeeded
 
+    def _schedule_deadline(self, job: Job) -> Optional[ScheduledCall]:
+        if not self.enforce_job_deadlines or job.deadline <= 0:
+            return None
+        return self._scheduler.call_later(job.seconds_until_deadline(), self._cancel_overrunning_job, job)
+
+    def _call_task_function(self, task: Task, variables: Dict) -> Dict:
+        if not task.run_in_process_pool:
+            return task.inner_function(**variables)
+
+        process_pool = self._get_process_pool()
+        try:
+            return process_pool.submit(task.inner_function, **variables).result()
+        except BrokenProcessPool:
+            self._replace_broken_process_pool(process_pool)
+            raise
+
     def _complete_job(self, job: Job) -> None:
         try:
-            logger.debug(f"Completing job: {job}")
-            self.zeebe_adapter.complete_job(job_key=job.key, variables=job.variables)
+            self._job_logger.completing(job)
+            (self.job_status_pipeline or self.zeebe_adapter).complete_job(job_key=job.key, variables=job.variables)
         except Exception as e:
             logger.warning(f"Failed to complete job: {job}. Error: {e}")
 
-    def _create_before_decorator_runner(self, task: Task) -> Callable[[Job], Job]:
-        decorators = task._before.copy()
-        decorators.extend(self._before)
-        return self._create_decorator_runner(decorators)
-
-    def _create_after_decorator_runner(self, task: Task) -> Callable[[Job], Job]:
-        decorators = self._after.copy()
-        decorators.extend(task._after)
-        return self._create_decorator_runner(decorators)
-
     @staticmethod
     def _create_decorator_runner(decorators: List[TaskDecorator]) -> Callable[[Job], Job]:
         def decorator_runner(job: Job):
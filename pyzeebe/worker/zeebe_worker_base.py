@@ -0,0 +1,277 @@
+import logging
+import multiprocessing
+import socket
+import sys
+from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import List, Callable, Dict, Union
+
+from pyzeebe.exceptions import ProcessPoolNotSupported
+from pyzeebe.job.job import Job
+from pyzeebe.job.job_status import JobStatus
+from pyzeebe.metrics.metrics import Metrics
+from pyzeebe.tracing.tracing import Tracing
+from pyzeebe.task.exception_handler import ExceptionHandler
+from pyzeebe.task.task import Task
+from pyzeebe.task.task_decorator import TaskDecorator
+from pyzeebe.worker.poll_backoff import PollBackoff
+from pyzeebe.worker.task_handler import ZeebeTaskHandler, default_exception_handler
+from pyzeebe.worker.task_router import ZeebeTaskRouter
+
+logger = logging.getLogger(__name__)
+
+# ProcessPoolExecutor takes an mp_context (needed to spawn instead of fork the pool's processes) since python 3.7
+PROCESS_POOL_SUPPORTED = sys.version_info >= (3, 7)
+
+
+class ZeebeWorkerBase(ZeebeTaskHandler):
+    """Task registration shared by :py:class:`ZeebeWorker` and :py:class:`AsyncZeebeWorker`"""
+
+    def __init__(self, name: str = None, request_timeout: int = 0, before: List[TaskDecorator] = None,
+                 after: List[TaskDecorator] = None, max_processes: int = None, idle_poll_interval: float = 0.1,
+                 max_poll_interval: float = 5, enforce_job_deadlines: bool = False, metrics: Metrics = None,
+                 tracing: Tracing = None):
+        """
+        Args:
+            name (str): Name of zeebe worker
+            request_timeout (int): Longpolling timeout for getting tasks from zeebe. If 0 default value is used
+            before (List[TaskDecorator]): Decorators to be performed before each task
+            after (List[TaskDecorator]): Decorators to be performed after each task
+            max_processes (int): Size of the process pool used by run_in_process_pool tasks. Default: number of CPUs
+            idle_poll_interval (float): Seconds to wait before polling a task again after it returned no jobs. Doubles with every empty poll. Default: 0.1
+            max_poll_interval (float): Maximum seconds to wait between polls of a task. Default: 5
+            enforce_job_deadlines (bool): Skip jobs whose deadline passed before they started and cancel jobs that run past it. Default: False
+            metrics (Metrics): Receives measurements of jobs and calls to zeebe. Default: None (not measured)
+            tracing (Tracing): Traces jobs and calls to zeebe. Default: None (not traced)
+        """
+        super().__init__(before, after)
+        self.name = name or socket.gethostname()
+        self.request_timeout = request_timeout
+        self.max_processes = max_processes
+        self._process_pool: ProcessPoolExecutor = None
+        self._process_pool_lock = Lock()
+        self.idle_poll_interval = idle_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._poll_backoffs: Dict[str, PollBackoff] = {}
+        self.enforce_job_deadlines = enforce_job_deadlines
+        self.metrics = metrics or Metrics()
+        self.tracing = tracing or Tracing()
+        self._deadline_stats: Dict[str, Dict[str, float]] = {}
+        self._deadline_stats_lock = Lock()
+
+    def include_router(self, *routers: ZeebeTaskRouter) -> None:
+        """
+        Adds all router's tasks to the worker.
+
+        Raises:
+            DuplicateTaskType: If a task from the router already exists in the worker
+            ProcessPoolNotSupported: If a task from the router has run_in_process_pool set on python 3.6
+
+        """
+        for router in routers:
+            for task in router.tasks:
+                self._add_task(task)
+
+    def _dict_task(self, task_type: str, exception_handler: ExceptionHandler = default_exception_handler,
+                   timeout: int = 10000, max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
+                   after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                   run_in_process_pool: bool = False):
+        def wrapper(fn: Callable[..., Dict]):
+            nonlocal variables_to_fetch
+            if not variables_to_fetch:
+                variables_to_fetch = self._get_parameters_from_function(fn)
+
+            task = Task(task_type=task_type, task_handler=fn, exception_handler=exception_handler, timeout=timeout,
+                        max_jobs_to_activate=max_jobs_to_activate, before=before, after=after,
+                        variables_to_fetch=variables_to_fetch, run_in_process_pool=run_in_process_pool)
+            self._add_task(task)
+
+            return fn
+
+        return wrapper
+
+    def _non_dict_task(self, task_type: str, variable_name: str,
+                       exception_handler: ExceptionHandler = default_exception_handler, timeout: int = 10000,
+                       max_jobs_to_activate: int = 32, before: List[TaskDecorator] = None,
+                       after: List[TaskDecorator] = None, variables_to_fetch: List[str] = None,
+                       run_in_process_pool: bool = False):
+        def wrapper(fn: Callable[..., Union[str, bool, int, List]]):
+            nonlocal variables_to_fetch
+            if not variables_to_fetch:
+                variables_to_fetch = self._get_parameters_from_function(fn)
+
+            dict_fn = self._single_value_function_to_dict(variable_name=variable_name, fn=fn)
+
+            task = Task(task_type=task_type, task_handler=dict_fn, exception_handler=exception_handler, timeout=timeout,
+                        max_jobs_to_activate=max_jobs_to_activate, before=before, after=after,
+                        variables_to_fetch=variables_to_fetch, run_in_process_pool=run_in_process_pool)
+            self._add_task(task)
+
+            return fn
+
+        return wrapper
+
+    def get_poll_interval(self, task_type: str) -> float:
+        """
+        Get the current seconds the worker waits between polls of a task
+
+        Args:
+            task_type (str): The type of the wanted task
+
+        Returns:
+            float: Seconds between polls. 0 while the task is getting jobs
+        """
+        backoff = self._poll_backoffs.get(task_type)
+        return backoff.interval if backoff else 0.0
+
+    def _get_poll_backoff(self, task: Task) -> PollBackoff:
+        if task.type not in self._poll_backoffs:
+            self._poll_backoffs[task.type] = PollBackoff(initial_interval=self.idle_poll_interval,
+                                                         max_interval=self.max_poll_interval)
+        return self._poll_backoffs[task.type]
+
+    def get_deadline_stats(self, task_type: str) -> Dict[str, float]:
+        """
+        Get how much work of a task was lost to job deadlines, counted if enforce_job_deadlines is set
+
+        Args:
+            task_type (str): The type of the wanted task
+
+        Returns:
+            Dict[str, float]: skipped_jobs (expired before they started), overrun_jobs (cancelled because they ran past
+                their deadline) and wasted_seconds (time spent on overrun jobs)
+        """
+        with self._deadline_stats_lock:
+            return dict(self._deadline_stats.get(task_type, _empty_deadline_stats()))
+
+    def _should_skip_job(self, job: Job) -> bool:
+        if not self.enforce_job_deadlines or not job.expired:
+            return False
+        self._job_logger.expired(job)
+        self._count_deadline_stats(job.type, skipped_jobs=1)
+        self.metrics.job_finished(job.type, "expired", 0)
+        return True
+
+    def _job_finished(self, job: Job, task_succeeded: bool, duration: float) -> None:
+        outcome = self._get_job_outcome(job, task_succeeded)
+        self.metrics.job_finished(job.type, outcome, duration)
+        self.tracing.job_finished(outcome)
+        self._job_logger.finished(job, duration, task_succeeded)
+
+    @staticmethod
+    def _get_job_outcome(job: Job, task_succeeded: bool) -> str:
+        if job.cancelled:
+            return "cancelled"
+        if task_succeeded:
+            return "completed"
+        if job.status == JobStatus.ErrorThrown:
+            return "error"
+        return "failed"
+
+    def _cancel_overrunning_job(self, job: Job) -> None:
+        logger.warning(f"Job {job.key} of task {job.type} ran past its deadline, cancelling it")
+        job.cancel()
+
+    def _count_deadline_stats(self, task_type: str, **counts: float) -> None:
+        with self._deadline_stats_lock:
+            stats = self._deadline_stats.setdefault(task_type, _empty_deadline_stats())
+            for name, count in counts.items():
+                stats[name] += count
+
+    def replace_task(self, task: Task) -> Task:
+        """
+        Replace the task of the same type, keeping its position
+
+        Args:
+            task (Task): The new task
+
+        Returns:
+            Task: The task that was replaced
+
+        Raises:
+             TaskNotFound: If no task with the task's type exists
+             ProcessPoolNotSupported: If the task has run_in_process_pool set on python 3.6
+
+        """
+        self._check_process_pool_supported(task)
+        task.handler = self._create_task_handler(task)
+        replaced_task = super().replace_task(task)
+        # The new task may poll at a different pace, it starts with a fresh backoff
+        self._poll_backoffs.pop(task.type, None)
+        return replaced_task
+
+    def remove_task(self, task_type: str) -> Task:
+        """
+        Remove a task
+
+        Args:
+            task_type (str): The type of the wanted task
+
+        Returns:
+            Task: The task that was removed
+
+        Raises:
+             TaskNotFound: If no task with specified type exists
+
+        """
+        task = super().remove_task(task_type)
+        self._poll_backoffs.pop(task_type, None)
+        return task
+
+    def _add_task(self, task: Task) -> None:
+        self._is_task_duplicate(task.type)
+        self._check_process_pool_supported(task)
+        task.handler = self._create_task_handler(task)
+        self.tasks.append(task)
+
+    @staticmethod
+    def _check_process_pool_supported(task: Task) -> None:
+        if task.run_in_process_pool and not PROCESS_POOL_SUPPORTED:
+            raise ProcessPoolNotSupported(task.type)
+
+    @abstractmethod
+    def _create_task_handler(self, task: Task) -> Callable[[Job], Job]:
+        raise NotImplementedError()
+
+    def _create_before_decorator_runner(self, task: Task) -> Callable[[Job], Job]:
+        decorators = task._before.copy()
+        decorators.extend(self._before)
+        return self._create_decorator_runner(decorators)
+
+    def _create_after_decorator_runner(self, task: Task) -> Callable[[Job], Job]:
+        decorators = self._after.copy()
+        decorators.extend(task._after)
+        return self._create_decorator_runner(decorators)
+
+    @staticmethod
+    @abstractmethod
+    def _create_decorator_runner(decorators: List[TaskDecorator]) -> Callable[[Job], Job]:
+        raise NotImplementedError()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                logger.debug(f"Starting process pool (max_processes={self.max_processes})")
+                # Forking a process with running grpc threads is not safe, so the pool's processes are spawned
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_processes,
+                                                         mp_context=multiprocessing.get_context("spawn"))
+            return self._process_pool
+
+    def _replace_broken_process_pool(self, broken_process_pool: ProcessPoolExecutor) -> None:
+        # A pool whose process died can't run anything anymore, the next job will start a new pool
+        with self._process_pool_lock:
+            if self._process_pool is broken_process_pool:
+                logger.warning("A process of the process pool terminated abruptly, replacing the process pool")
+                self._process_pool = None
+        broken_process_pool.shutdown(wait=False)
+
+    def _shutdown_process_pool(self, wait: bool = True) -> None:
+        with self._process_pool_lock:
+            process_pool, self._process_pool = self._process_pool, None
+        if process_pool:
+            process_pool.shutdown(wait=wait)
+
+
+def _empty_deadline_stats() -> Dict[str, float]:
+    return {"skipped_jobs": 0, "overrun_jobs": 0, "wasted_seconds": 0.0}
@@ -12,8 +12,10 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/JonatanMartens/pyzeebe",
-    packages=setuptools.find_packages(exclude=("tests",)),
+    packages=setuptools.find_packages(exclude=("tests", "tests.*", "benchmarks", "benchmarks.*")),
     install_requires=["oauthlib==3.1.0", "requests-oauthlib==1.3.0", "zeebe-grpc==0.26.0.0"],
+    extras_require={"orjson": ["orjson>=3.0"], "msgspec": ["msgspec>=0.9"], "ujson": ["ujson>=4.0"],
+                    "prometheus": ["prometheus_client>=0.8"], "opentelemetry": ["opentelemetry-api>=1.0"]},
     exclude=["*test.py", "tests", "*.bpmn"],
     keywords="zeebe workflow workflow-engine",
     license="MIT",
@@ -5,7 +5,8 @@ from uuid import uuid4
 
 import pytest
 
-from pyzeebe import ZeebeClient, ZeebeWorker, ZeebeTaskRouter, Job
+from pyzeebe import AsyncZeebeClient, ZeebeClient, ZeebeWorker, ZeebeTaskRouter, Job, AsyncZeebeWorker
+from pyzeebe.grpc_internals.async_zeebe_adapter import AsyncZeebeAdapter
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.task.task import Task
 from pyzeebe.worker.task_handler import ZeebeTaskHandler
@@ -47,6 +48,26 @@ def zeebe_worker(zeebe_adapter):
     return worker
 
 
+@pytest.fixture
+def async_zeebe_adapter(grpc_server, grpc_addr):
+    hostname, port = grpc_addr.split(":")
+    return AsyncZeebeAdapter(hostname=hostname, port=int(port))
+
+
+@pytest.fixture
+def async_zeebe_client(async_zeebe_adapter):
+    client = AsyncZeebeClient()
+    client.zeebe_adapter = async_zeebe_adapter
+    return client
+
+
+@pytest.fixture
+def async_zeebe_worker(async_zeebe_adapter):
+    worker = AsyncZeebeWorker()
+    worker.zeebe_adapter = async_zeebe_adapter
+    return worker
+
+
 @pytest.fixture
 def task(task_type):
     return Task(task_type, MagicMock(wraps=lambda x: dict(x=x)), MagicMock(wraps=lambda x, y, z: x))
@@ -0,0 +1,129 @@
+import asyncio
+from random import randint
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from pyzeebe import AsyncZeebeClient
+from pyzeebe.exceptions import MessageAlreadyExists, WorkflowNotFound
+
+
+@pytest.mark.asyncio
+async def test_run_workflow(async_zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    version = randint(0, 10)
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, version, [])
+
+    assert isinstance(await async_zeebe_client.run_workflow(bpmn_process_id=bpmn_process_id, variables={},
+                                                            version=version), int)
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_with_result(async_zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    version = randint(0, 10)
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, version, [])
+
+    assert isinstance(await async_zeebe_client.run_workflow_with_result(bpmn_process_id=bpmn_process_id,
+                                                                        version=version), dict)
+
+
+@pytest.mark.asyncio
+async def test_run_non_existent_workflow(async_zeebe_client):
+    with pytest.raises(WorkflowNotFound):
+        await async_zeebe_client.run_workflow(bpmn_process_id=str(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_run_workflows_concurrently(async_zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+
+    workflow_instance_keys = await asyncio.gather(
+        *(async_zeebe_client.run_workflow(bpmn_process_id=bpmn_process_id, version=1) for _ in range(50)))
+
+    assert len(workflow_instance_keys) == 50
+    assert all(key in grpc_servicer.active_workflows for key in workflow_instance_keys)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_bounded(async_zeebe_client):
+    async_zeebe_client.max_concurrent_requests = 2
+    running, max_running = 0, 0
+
+    async def create_workflow_instance(**kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 1
+
+    async_zeebe_client.zeebe_adapter.create_workflow_instance = create_workflow_instance
+
+    await asyncio.gather(*(async_zeebe_client.run_workflow(str(uuid4())) for _ in range(10)))
+
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_workflow_instance(async_zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+    workflow_instance_key = await async_zeebe_client.run_workflow(bpmn_process_id=bpmn_process_id, version=1)
+
+    assert await async_zeebe_client.cancel_workflow_instance(workflow_instance_key) == workflow_instance_key
+
+
+@pytest.mark.asyncio
+async def test_deploy_workflow(async_zeebe_client):
+    async def deploy_workflow(*workflow_file_path):
+        pass
+
+    async_zeebe_client.zeebe_adapter.deploy_workflow = MagicMock(side_effect=deploy_workflow)
+    file_path = str(uuid4())
+
+    await async_zeebe_client.deploy_workflow(file_path)
+
+    async_zeebe_client.zeebe_adapter.deploy_workflow.assert_called_with(file_path)
+
+
+@pytest.mark.asyncio
+async def test_publish_message(async_zeebe_client, grpc_servicer):
+    message_id = str(uuid4())
+
+    await async_zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()), message_id=message_id)
+
+    assert message_id in grpc_servicer.messages
+
+
+@pytest.mark.asyncio
+async def test_publish_duplicate_message(async_zeebe_client):
+    message_id = str(uuid4())
+    await async_zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()), message_id=message_id)
+
+    with pytest.raises(MessageAlreadyExists):
+        await async_zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()),
+                                                 message_id=message_id)
+
+
+@pytest.mark.asyncio
+async def test_close_channel(async_zeebe_client):
+    async_zeebe_client.zeebe_adapter = MagicMock()
+    closed = asyncio.Event()
+
+    async def close():
+        closed.set()
+
+    async_zeebe_client.zeebe_adapter.close = close
+
+    async with async_zeebe_client:
+        pass
+
+    assert closed.is_set()
+
+
+def test_invalid_max_concurrent_requests():
+    with pytest.raises(ValueError):
+        AsyncZeebeClient(max_concurrent_requests=0)
@@ -0,0 +1,242 @@
+import time
+from concurrent.futures import Future
+from threading import Timer
+from typing import Callable, List
+
+import pytest
+
+from pyzeebe.client.bulk import BulkWindow, MessageStatus, RecentKeys, run_bulk, to_message_status
+from pyzeebe.exceptions import MessageAlreadyExists, WorkflowNotFound, ZeebeBackPressure
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+
+
+def finished_future(result=None, exception: Exception = None) -> Future:
+    future = Future()
+    if exception:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+def delayed_future(delay: float, result=None) -> Future:
+    future = Future()
+    Timer(delay, future.set_result, [result]).start()
+    return future
+
+
+class CallCounter(object):
+    def __init__(self, start_call: Callable[[int], Future]):
+        self.start_call = start_call
+        self.running = 0
+        self.max_running = 0
+        self.running_at_start: List[int] = []
+
+    def __call__(self, item: int) -> Future:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.running_at_start.append(self.running)
+        future = self.start_call(item)
+        future.add_done_callback(lambda _: self._done())
+        return future
+
+    def _done(self) -> None:
+        self.running -= 1
+
+
+class TestBulkWindow:
+    def test_starts_at_max_size(self):
+        assert BulkWindow(10).size == 10
+
+    def test_shrinks_by_half(self):
+        window = BulkWindow(10)
+
+        window.shrink(time.monotonic())
+
+        assert window.size == 5
+
+    def test_burst_of_rejections_shrinks_once(self):
+        window = BulkWindow(10)
+        started_at = time.monotonic()
+
+        window.shrink(started_at)
+        window.shrink(started_at)
+
+        assert window.size == 5
+
+    def test_never_smaller_than_one(self):
+        window = BulkWindow(2)
+
+        for _ in range(5):
+            window.shrink(time.monotonic())
+
+        assert window.size == 1
+
+    def test_grows_by_one_per_window(self):
+        window = BulkWindow(10)
+        window.shrink(time.monotonic())
+
+        for _ in range(6):
+            window.grow()
+
+        assert window.size == 6
+
+    def test_never_larger_than_max_size(self):
+        window = BulkWindow(2)
+
+        for _ in range(10):
+            window.grow()
+
+        assert window.size == 2
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            BulkWindow(0)
+
+
+class TestRecentKeys:
+    def test_new_key_added(self):
+        assert RecentKeys(10).add("a")
+
+    def test_known_key_not_added(self):
+        keys = RecentKeys(10)
+        keys.add("a")
+
+        assert not keys.add("a")
+
+    def test_oldest_key_forgotten(self):
+        keys = RecentKeys(2)
+        for key in ("a", "b", "c"):
+            keys.add(key)
+
+        assert len(keys) == 2
+        assert keys.add("a")
+
+
+class TestRunBulk:
+    def test_results_in_order(self):
+        results = list(run_bulk(range(10), lambda item: delayed_future(0.001 * (10 - item), item * 2)))
+
+        assert [result.index for result in results] == list(range(10))
+        assert [result.result for result in results] == [item * 2 for item in range(10)]
+
+    def test_results_as_completed(self):
+        results = list(run_bulk(range(3), lambda item: delayed_future(0.05 * (3 - item), item), ordered=False))
+
+        assert [result.item for result in results] == [2, 1, 0]
+
+    def test_in_flight_calls_bounded(self):
+        start_call = CallCounter(lambda item: delayed_future(0.005, item))
+
+        results = list(run_bulk(range(20), start_call, max_in_flight=3))
+
+        assert len(results) == 20
+        assert start_call.max_running == 3
+
+    def test_generator_consumed_lazily(self):
+        taken = []
+
+        def items():
+            for item in range(10):
+                taken.append(item)
+                yield item
+
+        results = run_bulk(items(), lambda item: delayed_future(0.01, item), max_in_flight=2)
+
+        assert next(results).index == 0
+        assert len(taken) <= 3
+
+    def test_failure_does_not_abort_batch(self):
+        exception = WorkflowNotFound("process", 1)
+
+        results = list(run_bulk(range(3), lambda item: finished_future(exception=exception if item == 1 else None)))
+
+        assert [result.succeeded for result in results] == [True, False, True]
+        assert results[1].exception is exception
+        assert results[1].item == 1
+
+    def test_failure_to_start_reported(self):
+        def start_call(item):
+            raise TypeError()
+
+        results = list(run_bulk(range(2), start_call))
+
+        assert all(isinstance(result.exception, TypeError) for result in results)
+
+    def test_back_pressure_retried(self):
+        attempts = []
+
+        def start_call(item):
+            attempts.append(item)
+            return finished_future(exception=ZeebeBackPressure() if attempts.count(item) == 1 else None, result=item)
+
+        results = list(run_bulk(range(3), start_call, retry_policy=RetryPolicy(initial_backoff=0)))
+
+        assert all(result.succeeded for result in results)
+        assert sorted(attempts) == [0, 0, 1, 1, 2, 2]
+
+    def test_back_pressure_shrinks_window(self):
+        start_call = CallCounter(lambda item: delayed_future(0.02, item))
+
+        def reject_first_call(item):
+            if item == 0 and not start_call.running_at_start:
+                future = Future()
+                Timer(0.001, future.set_exception, [ZeebeBackPressure()]).start()
+                return future
+            return start_call(item)
+
+        list(run_bulk(range(20), reject_first_call, max_in_flight=8, retry_policy=RetryPolicy(initial_backoff=0)))
+
+        # The other 7 calls of the first window were started before the rejection, the window grows back afterwards
+        assert start_call.running_at_start[7] <= 4
+        assert start_call.max_running == 7
+
+    def test_back_pressure_reported_after_retries(self):
+        results = list(run_bulk(range(2), lambda item: finished_future(exception=ZeebeBackPressure()),
+                                retry_policy=RetryPolicy(max_attempts=2, initial_backoff=0)))
+
+        assert all(isinstance(result.exception, ZeebeBackPressure) for result in results)
+
+    def test_empty_input(self):
+        assert list(run_bulk([], finished_future)) == []
+
+    def test_duplicates_not_called(self):
+        calls = []
+
+        def start_call(item):
+            calls.append(item)
+            return finished_future(result="called")
+
+        results = list(run_bulk(["a", "b", "a", None, None], start_call, dedupe_key=lambda item: item,
+                                duplicate_result="duplicate"))
+
+        assert [result.result for result in results] == ["called", "called", "duplicate", "called", "called"]
+        assert calls == ["a", "b", None, None]
+
+    def test_retried_item_not_duplicate(self):
+        attempts = []
+
+        def start_call(item):
+            attempts.append(item)
+            return finished_future(exception=ZeebeBackPressure() if len(attempts) == 1 else None, result="called")
+
+        results = list(run_bulk(["a"], start_call, dedupe_key=lambda item: item, duplicate_result="duplicate",
+                                retry_policy=RetryPolicy(initial_backoff=0)))
+
+        assert results[0].result == "called"
+        assert attempts == ["a", "a"]
+
+
+class TestToMessageStatus:
+    def test_published(self):
+        assert to_message_status(finished_future()).result() == MessageStatus.Published
+
+    def test_already_exists_is_not_an_error(self):
+        future = to_message_status(finished_future(exception=MessageAlreadyExists()))
+
+        assert future.result() == MessageStatus.AlreadyExists
+
+    def test_other_errors_kept(self):
+        exception = ZeebeBackPressure()
+
+        assert to_message_status(finished_future(exception=exception)).exception() is exception
@@ -4,7 +4,8 @@ from uuid import uuid4
 
 import pytest
 
-from pyzeebe.exceptions import WorkflowNotFound
+from pyzeebe import MessageStatus
+from pyzeebe.exceptions import MessageAlreadyExists, WorkflowNotFound
 
 
 def test_run_workflow(zeebe_client, grpc_servicer):
@@ -48,3 +49,106 @@ def test_cancel_workflow_instance(zeebe_client, grpc_servicer):
 
 def test_publish_message(zeebe_client):
     zeebe_client.publish_message(name=str(uuid4()), correlation_key=str(uuid4()))
+
+
+def test_run_workflows_bulk(zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+
+    results = list(zeebe_client.run_workflows_bulk(bpmn_process_id, ({"x": x} for x in range(20)), version=1,
+                                                   max_in_flight=5))
+
+    assert [result.item for result in results] == [{"x": x} for x in range(20)]
+    assert all(result.result in grpc_servicer.active_workflows for result in results)
+
+
+def test_run_workflows_bulk_reports_failures(zeebe_client):
+    results = list(zeebe_client.run_workflows_bulk(str(uuid4()), [{}, {}]))
+
+    assert all(isinstance(result.exception, WorkflowNotFound) for result in results)
+
+
+def test_run_workflows_bulk_invalid_window(zeebe_client):
+    with pytest.raises(ValueError):
+        zeebe_client.run_workflows_bulk(str(uuid4()), [{}], max_in_flight=0)
+
+
+def test_publish_messages_bulk(zeebe_client, grpc_servicer):
+    existing_message_id = str(uuid4())
+    zeebe_client.publish_message(name="message", correlation_key="key", message_id=existing_message_id)
+    message_id = str(uuid4())
+    messages = [{"name": "message", "correlation_key": "key", "message_id": message_id},
+                {"name": "message", "correlation_key": "key", "message_id": existing_message_id},
+                {"name": "message", "correlation_key": "key", "message_id": message_id}]
+
+    results = list(zeebe_client.publish_messages_bulk(messages))
+
+    assert [result.result for result in results] == [MessageStatus.Published, MessageStatus.AlreadyExists,
+                                                     MessageStatus.Duplicate]
+    assert message_id in grpc_servicer.messages
+
+
+def test_publish_messages_bulk_reports_invalid_messages(zeebe_client):
+    results = list(zeebe_client.publish_messages_bulk([{"correlation_key": "key"}]))
+
+    assert isinstance(results[0].exception, KeyError)
+
+
+def test_run_workflow_future(zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+
+    future = zeebe_client.run_workflow_future(bpmn_process_id=bpmn_process_id, version=1)
+
+    assert future.result(timeout=5) in grpc_servicer.active_workflows
+
+
+def test_run_non_existent_workflow_future(zeebe_client):
+    future = zeebe_client.run_workflow_future(bpmn_process_id=str(uuid4()))
+
+    assert isinstance(future.exception(timeout=5), WorkflowNotFound)
+
+
+def test_run_workflow_with_result_future(zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+
+    future = zeebe_client.run_workflow_with_result_future(bpmn_process_id=bpmn_process_id, version=1)
+
+    assert isinstance(future.result(timeout=5), dict)
+
+
+def test_cancel_workflow_instance_future(zeebe_client, grpc_servicer):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+    workflow_instance_key = zeebe_client.run_workflow(bpmn_process_id=bpmn_process_id, version=1)
+
+    future = zeebe_client.cancel_workflow_instance_future(workflow_instance_key)
+
+    assert future.result(timeout=5) == workflow_instance_key
+    assert workflow_instance_key not in grpc_servicer.active_workflows
+
+
+def test_deploy_workflow_future(zeebe_client, tmp_path):
+    workflow_file = tmp_path / "workflow.bpmn"
+    workflow_file.write_bytes(b"<definitions/>")
+
+    assert zeebe_client.deploy_workflow_future(str(workflow_file)).result(timeout=5) is None
+
+
+def test_publish_message_future(zeebe_client, grpc_servicer):
+    message_id = str(uuid4())
+
+    future = zeebe_client.publish_message_future(name="message", correlation_key="key", message_id=message_id)
+
+    assert future.result(timeout=5) is None
+    assert message_id in grpc_servicer.messages
+
+
+def test_publish_duplicate_message_future(zeebe_client):
+    message_id = str(uuid4())
+    zeebe_client.publish_message(name="message", correlation_key="key", message_id=message_id)
+
+    future = zeebe_client.publish_message_future(name="message", correlation_key="key", message_id=message_id)
+
+    assert isinstance(future.exception(timeout=5), MessageAlreadyExists)
@@ -0,0 +1,174 @@
+from random import randint
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import grpc
+import pytest
+
+from pyzeebe.exceptions import ActivateJobsRequestInvalid, JobAlreadyDeactivated, JobNotFound, ZeebeInternalError
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+from pyzeebe.job.job import Job
+from pyzeebe.job.job_status import JobStatus
+from pyzeebe.task.task import Task
+from tests.unit.utils.random_utils import RANDOM_RANGE, random_job
+
+
+def create_random_task_and_activate(grpc_servicer, task_type: str = None) -> Job:
+    task = Task(task_type=task_type or str(uuid4()), task_handler=lambda x: x, exception_handler=lambda x: x)
+    job = random_job(task)
+    grpc_servicer.active_jobs[job.key] = job
+    return job
+
+
+async def get_first_active_job(task_type, async_zeebe_adapter) -> Job:
+    async for job in async_zeebe_adapter.activate_jobs(task_type=task_type, max_jobs_to_activate=1,
+                                                       request_timeout=10, timeout=100, variables_to_fetch=[],
+                                                       worker=str(uuid4())):
+        return job
+
+
+def create_rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata())
+
+
+@pytest.mark.asyncio
+async def test_activate_jobs(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+
+    active_job = await get_first_active_job(job.type, async_zeebe_adapter)
+
+    assert isinstance(active_job, Job)
+    assert active_job.key == job.key
+    assert active_job.zeebe_adapter == async_zeebe_adapter
+
+
+@pytest.mark.asyncio
+async def test_activate_jobs_invalid_job_timeout(async_zeebe_adapter):
+    with pytest.raises(ActivateJobsRequestInvalid):
+        async for _ in async_zeebe_adapter.activate_jobs(task_type=str(uuid4()), worker=str(uuid4()), timeout=0,
+                                                         request_timeout=100, max_jobs_to_activate=1,
+                                                         variables_to_fetch=[]):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_activate_jobs_common_errors_called(async_zeebe_adapter):
+    async_zeebe_adapter._gateway_stub = MagicMock()
+    async_zeebe_adapter._gateway_stub.ActivateJobs.side_effect = create_rpc_error(grpc.StatusCode.INTERNAL)
+
+    with pytest.raises(ZeebeInternalError):
+        async for _ in async_zeebe_adapter.activate_jobs(task_type=str(uuid4()), worker=str(uuid4()), timeout=100,
+                                                         request_timeout=100, max_jobs_to_activate=1,
+                                                         variables_to_fetch=[]):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_complete_job(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+
+    await async_zeebe_adapter.complete_job(job_key=job.key, variables={})
+
+    assert grpc_servicer.active_jobs[job.key].status == JobStatus.Completed
+
+
+@pytest.mark.asyncio
+async def test_complete_job_not_found(async_zeebe_adapter):
+    with pytest.raises(JobNotFound):
+        await async_zeebe_adapter.complete_job(job_key=randint(0, RANDOM_RANGE), variables={})
+
+
+@pytest.mark.asyncio
+async def test_complete_job_already_completed(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+    job.status = JobStatus.Completed
+
+    with pytest.raises(JobAlreadyDeactivated):
+        await async_zeebe_adapter.complete_job(job_key=job.key, variables={})
+
+
+@pytest.mark.asyncio
+async def test_complete_job_runs_without_await(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+
+    future = async_zeebe_adapter.complete_job(job_key=job.key, variables={})
+    await future
+
+    assert grpc_servicer.active_jobs[job.key].status == JobStatus.Completed
+
+
+@pytest.mark.asyncio
+async def test_fail_job(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+
+    await async_zeebe_adapter.fail_job(job_key=job.key, message=str(uuid4()))
+
+    assert grpc_servicer.active_jobs[job.key].status == JobStatus.Failed
+
+
+@pytest.mark.asyncio
+async def test_fail_job_not_found(async_zeebe_adapter):
+    with pytest.raises(JobNotFound):
+        await async_zeebe_adapter.fail_job(job_key=randint(0, RANDOM_RANGE), message=str(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_throw_error(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+
+    await async_zeebe_adapter.throw_error(job_key=job.key, message=str(uuid4()))
+
+    assert grpc_servicer.active_jobs[job.key].status == JobStatus.ErrorThrown
+
+
+@pytest.mark.asyncio
+async def test_throw_error_not_found(async_zeebe_adapter):
+    with pytest.raises(JobNotFound):
+        await async_zeebe_adapter.throw_error(job_key=randint(0, RANDOM_RANGE), message=str(uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_gateway_unavailable_closes_channel_after_retries(async_zeebe_adapter):
+    async_zeebe_adapter._max_connection_retries = 0
+    async_zeebe_adapter._gateway_stub = MagicMock()
+    async_zeebe_adapter._gateway_stub.CompleteJob.side_effect = create_rpc_error(grpc.StatusCode.UNAVAILABLE)
+
+    with pytest.raises(Exception):
+        await async_zeebe_adapter.complete_job(job_key=randint(0, RANDOM_RANGE), variables={})
+
+    assert not async_zeebe_adapter.connected
+
+
+@pytest.mark.asyncio
+async def test_complete_job_retried_on_back_pressure(async_zeebe_adapter):
+    async_zeebe_adapter.retry_policy = RetryPolicy(initial_backoff=0)
+    response = MagicMock()
+    complete_job_mock = MagicMock(side_effect=[create_rpc_error(grpc.StatusCode.RESOURCE_EXHAUSTED), response])
+
+    async def complete_job(request):
+        return complete_job_mock(request)
+
+    async_zeebe_adapter._gateway_stub.CompleteJob = complete_job
+
+    assert await async_zeebe_adapter.complete_job(job_key=randint(0, RANDOM_RANGE), variables={}) == response
+    assert complete_job_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_successful_call_resets_connection_retries(async_zeebe_adapter, grpc_servicer):
+    job = create_random_task_and_activate(grpc_servicer)
+    async_zeebe_adapter._current_connection_retries = 3
+
+    await async_zeebe_adapter.complete_job(job_key=job.key, variables={})
+
+    assert async_zeebe_adapter._current_connection_retries == 0
+
+
+@pytest.mark.parametrize("call_future", [
+    lambda adapter: adapter.complete_job_future(job_key=1, variables={}),
+    lambda adapter: adapter.fail_job_future(job_key=1, message="failed"),
+    lambda adapter: adapter.throw_error_future(job_key=1, message="error")
+])
+def test_job_status_futures_not_available(async_zeebe_adapter, call_future):
+    with pytest.raises(NotImplementedError):
+        call_future(async_zeebe_adapter)
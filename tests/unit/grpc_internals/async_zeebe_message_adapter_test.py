@@ -0,0 +1,47 @@
+from random import randint
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import grpc
+import pytest
+from zeebe_grpc.gateway_pb2 import PublishMessageResponse
+
+from pyzeebe.exceptions import MessageAlreadyExists, ZeebeInternalError
+from tests.unit.grpc_internals.async_zeebe_job_adapter_test import create_rpc_error
+from tests.unit.utils.random_utils import RANDOM_RANGE
+
+
+@pytest.mark.asyncio
+async def test_publish_message(async_zeebe_adapter):
+    response = await async_zeebe_adapter.publish_message(name=str(uuid4()), variables={},
+                                                         correlation_key=str(uuid4()),
+                                                         time_to_live_in_milliseconds=randint(0, RANDOM_RANGE))
+
+    assert isinstance(response, PublishMessageResponse)
+
+
+@pytest.mark.asyncio
+async def test_publish_message_already_exists(async_zeebe_adapter):
+    message_id = str(uuid4())
+    await async_zeebe_adapter.publish_message(message_id=message_id, name=str(uuid4()), variables={},
+                                              correlation_key=str(uuid4()), time_to_live_in_milliseconds=1000)
+
+    with pytest.raises(MessageAlreadyExists):
+        await async_zeebe_adapter.publish_message(message_id=message_id, name=str(uuid4()), variables={},
+                                                  correlation_key=str(uuid4()), time_to_live_in_milliseconds=1000)
+
+
+@pytest.mark.asyncio
+async def test_publish_message_internal_error(async_zeebe_adapter):
+    async_zeebe_adapter._gateway_stub.PublishMessage = MagicMock(
+        side_effect=create_rpc_error(grpc.StatusCode.INTERNAL))
+
+    with pytest.raises(ZeebeInternalError):
+        await async_zeebe_adapter.publish_message(name=str(uuid4()), variables={}, correlation_key=str(uuid4()),
+                                                  time_to_live_in_milliseconds=1000)
+
+
+def test_publish_message_future_not_available(async_zeebe_adapter):
+    with pytest.raises(NotImplementedError):
+        async_zeebe_adapter.publish_message_future(name="message", correlation_key="key",
+                                                   time_to_live_in_milliseconds=1000, variables={})
@@ -0,0 +1,87 @@
+from random import randint
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import grpc
+import pytest
+
+from pyzeebe.exceptions import InvalidJSON, WorkflowHasNoStartEvent, WorkflowInstanceNotFound, WorkflowInvalid, \
+    WorkflowNotFound, ZeebeBackPressure
+from tests.unit.grpc_internals.async_zeebe_job_adapter_test import create_rpc_error
+from tests.unit.utils.random_utils import RANDOM_RANGE
+
+
+@pytest.mark.asyncio
+async def test_create_workflow_instance(grpc_servicer, async_zeebe_adapter):
+    bpmn_process_id = str(uuid4())
+    version = randint(0, 10)
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, version, [])
+
+    response = await async_zeebe_adapter.create_workflow_instance(bpmn_process_id=bpmn_process_id, variables={},
+                                                                  version=version)
+
+    assert isinstance(response, int)
+
+
+@pytest.mark.asyncio
+async def test_create_workflow_instance_not_found(async_zeebe_adapter):
+    with pytest.raises(WorkflowNotFound):
+        await async_zeebe_adapter.create_workflow_instance(bpmn_process_id=str(uuid4()), variables={}, version=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code,exception", [(grpc.StatusCode.INVALID_ARGUMENT, InvalidJSON),
+                                                   (grpc.StatusCode.FAILED_PRECONDITION, WorkflowHasNoStartEvent),
+                                                   (grpc.StatusCode.RESOURCE_EXHAUSTED, ZeebeBackPressure)])
+async def test_create_workflow_instance_errors(async_zeebe_adapter, status_code, exception):
+    async_zeebe_adapter._gateway_stub.CreateWorkflowInstance = MagicMock(side_effect=create_rpc_error(status_code))
+
+    with pytest.raises(exception):
+        await async_zeebe_adapter.create_workflow_instance(bpmn_process_id=str(uuid4()), variables={}, version=1)
+
+
+@pytest.mark.asyncio
+async def test_create_workflow_instance_with_result(grpc_servicer, async_zeebe_adapter):
+    bpmn_process_id = str(uuid4())
+    version = randint(0, 10)
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, version, [])
+
+    response = await async_zeebe_adapter.create_workflow_instance_with_result(bpmn_process_id=bpmn_process_id,
+                                                                              variables={}, version=version,
+                                                                              timeout=0, variables_to_fetch=[])
+
+    assert isinstance(response, dict)
+
+
+@pytest.mark.asyncio
+async def test_cancel_workflow_instance(grpc_servicer, async_zeebe_adapter):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+    workflow_instance_key = await async_zeebe_adapter.create_workflow_instance(bpmn_process_id=bpmn_process_id,
+                                                                               variables={}, version=1)
+
+    await async_zeebe_adapter.cancel_workflow_instance(workflow_instance_key=workflow_instance_key)
+
+    assert workflow_instance_key not in grpc_servicer.active_workflows
+
+
+@pytest.mark.asyncio
+async def test_cancel_workflow_instance_not_found(async_zeebe_adapter):
+    with pytest.raises(WorkflowInstanceNotFound):
+        await async_zeebe_adapter.cancel_workflow_instance(workflow_instance_key=randint(0, RANDOM_RANGE))
+
+
+@pytest.mark.asyncio
+async def test_deploy_workflow_invalid(async_zeebe_adapter, tmp_path):
+    workflow_file = tmp_path / "workflow.bpmn"
+    workflow_file.write_bytes(b"invalid")
+    async_zeebe_adapter._gateway_stub.DeployWorkflow = MagicMock(
+        side_effect=create_rpc_error(grpc.StatusCode.INVALID_ARGUMENT))
+
+    with pytest.raises(WorkflowInvalid):
+        await async_zeebe_adapter.deploy_workflow(str(workflow_file))
+
+
+def test_create_workflow_instance_future_not_available(async_zeebe_adapter):
+    with pytest.raises(NotImplementedError):
+        async_zeebe_adapter.create_workflow_instance_future(bpmn_process_id="workflow", version=-1, variables={})
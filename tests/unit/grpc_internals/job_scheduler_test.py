@@ -0,0 +1,90 @@
+import time
+from threading import Event
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyzeebe.grpc_internals.job_scheduler import JobScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler()
+    yield scheduler
+    scheduler.stop()
+
+
+def test_call_runs_when_due(scheduler):
+    called = Event()
+
+    scheduler.call_later(0.01, called.set)
+
+    assert called.wait(5)
+
+
+def test_call_gets_arguments(scheduler):
+    called = Event()
+    callback = MagicMock(side_effect=lambda *_: called.set())
+
+    scheduler.call_later(0, callback, 1, "a")
+
+    assert called.wait(5)
+    callback.assert_called_once_with(1, "a")
+
+
+def test_calls_run_in_order(scheduler):
+    calls = []
+    done = Event()
+
+    scheduler.call_later(0.2, lambda: (calls.append("late"), done.set()))
+    scheduler.call_later(0.01, calls.append, "early")
+
+    assert done.wait(5)
+    assert calls == ["early", "late"]
+
+
+def test_cancelled_call_not_run(scheduler):
+    callback = MagicMock()
+    done = Event()
+
+    scheduler.call_later(0.05, callback).cancel()
+    scheduler.call_later(0.1, done.set)
+
+    assert done.wait(5)
+    callback.assert_not_called()
+
+
+def test_cancelled_calls_dropped_when_most_calls_are_cancelled(scheduler):
+    calls = [scheduler.call_later(60, MagicMock()) for _ in range(3000)]
+
+    for call in calls[:2000]:
+        call.cancel()
+
+    assert len(scheduler) < 3000
+
+
+def test_failing_call_does_not_stop_scheduler(scheduler):
+    called = Event()
+
+    scheduler.call_later(0, MagicMock(side_effect=Exception()))
+    scheduler.call_later(0.01, called.set)
+
+    assert called.wait(5)
+
+
+def test_calls_after_stop_not_run(scheduler):
+    callback = MagicMock()
+    scheduler.stop()
+
+    scheduler.call_later(0, callback)
+    time.sleep(0.05)
+
+    callback.assert_not_called()
+
+
+def test_one_thread_for_all_calls(scheduler):
+    for _ in range(10):
+        scheduler.call_later(60, MagicMock())
+
+    assert scheduler._thread.is_alive()
+    assert scheduler._thread.name == "JobScheduler"
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from pyzeebe.grpc_internals import json_codec
+from pyzeebe.grpc_internals.json_codec import MsgspecJsonCodec, OrjsonCodec, StdlibJsonCodec, UjsonCodec, \
+    get_json_codec
+
+VARIABLES = {"string": "abc", "unicode": "äö€", "int": 1, "float": 1.5, "bool": True, "none": None,
+             "list": [1, "2", {"nested": [3]}], "dict": {"a": {"b": "c"}}}
+
+
+@pytest.fixture(params=[
+    ("json", StdlibJsonCodec),
+    ("orjson", OrjsonCodec),
+    ("msgspec", MsgspecJsonCodec),
+    ("ujson", UjsonCodec)
+])
+def codec(request):
+    module_name, codec_class = request.param
+    if module_name != "json":
+        pytest.importorskip(module_name)
+    return codec_class()
+
+
+def test_dumps_is_valid_json(codec):
+    dumped = codec.dumps(VARIABLES)
+
+    assert isinstance(dumped, str)
+    assert json.loads(dumped) == VARIABLES
+
+
+def test_loads_str(codec):
+    assert codec.loads(json.dumps(VARIABLES)) == VARIABLES
+
+
+def test_loads_bytes(codec):
+    assert codec.loads(json.dumps(VARIABLES).encode()) == VARIABLES
+
+
+def test_get_json_codec_by_name():
+    assert isinstance(get_json_codec("json"), StdlibJsonCodec)
+
+
+def test_get_unknown_json_codec():
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+
+def test_get_json_codec_without_library(monkeypatch):
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    with pytest.raises(ImportError):
+        get_json_codec("orjson")
+
+
+def test_get_fastest_json_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+
+    assert isinstance(get_json_codec(), OrjsonCodec)
+
+
+def test_get_fastest_json_codec_falls_back_to_stdlib(monkeypatch):
+    for module_name in ("orjson", "msgspec", "ujson"):
+        monkeypatch.setattr(json_codec, module_name, None)
+
+    assert isinstance(get_json_codec(), StdlibJsonCodec)
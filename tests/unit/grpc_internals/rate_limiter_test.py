@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+import pytest
+
+from pyzeebe.grpc_internals.rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def clock():
+    with patch("pyzeebe.grpc_internals.rate_limiter.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        yield monotonic
+
+
+def test_burst_not_delayed(clock):
+    bucket = TokenBucket(rate=10)
+
+    assert [bucket.reserve() for _ in range(10)] == [0] * 10
+
+
+def test_delayed_when_empty(clock):
+    bucket = TokenBucket(rate=10)
+    for _ in range(10):
+        bucket.reserve()
+
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+
+def test_refills_over_time(clock):
+    bucket = TokenBucket(rate=10)
+    for _ in range(10):
+        bucket.reserve()
+
+    clock.return_value = 0.5
+
+    assert [bucket.reserve() for _ in range(5)] == [0] * 5
+    assert bucket.reserve() > 0
+
+
+def test_refill_capped_at_burst(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+
+    clock.return_value = 100
+
+    assert [bucket.reserve() for _ in range(2)] == [0, 0]
+    assert bucket.reserve() > 0
+
+
+def test_burst_at_least_one(clock):
+    bucket = TokenBucket(rate=0.5)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(2)
@@ -0,0 +1,52 @@
+import grpc
+import pytest
+
+from pyzeebe.exceptions import ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError, JobNotFound
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+
+
+@pytest.fixture
+def retry_policy():
+    return RetryPolicy(max_attempts=5, initial_backoff=1, max_backoff=4, multiplier=2, jitter=0)
+
+
+def test_back_pressure_retried(retry_policy):
+    assert retry_policy.get_retry_delay(ZeebeBackPressure(), attempt=1, elapsed=0) == 1
+
+
+@pytest.mark.parametrize("exception", [ZeebeGatewayUnavailable(), ZeebeInternalError()])
+def test_retryable_exceptions_configurable(exception):
+    retry_policy = RetryPolicy(initial_backoff=1, jitter=0,
+                               retryable_exceptions=(ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError))
+
+    assert retry_policy.get_retry_delay(exception, attempt=1, elapsed=0) == 1
+
+
+@pytest.mark.parametrize("exception", [ZeebeGatewayUnavailable(), ZeebeInternalError(), JobNotFound(1),
+                                       grpc.RpcError(), ValueError()])
+def test_other_exception_not_retried(retry_policy, exception):
+    assert retry_policy.get_retry_delay(exception, attempt=1, elapsed=0) is None
+
+
+def test_backoff_grows_exponentially(retry_policy):
+    delays = [retry_policy.get_retry_delay(ZeebeBackPressure(), attempt, elapsed=0) for attempt in range(1, 5)]
+
+    assert delays == [1, 2, 4, 4]
+
+
+def test_not_retried_after_max_attempts(retry_policy):
+    assert retry_policy.get_retry_delay(ZeebeBackPressure(), attempt=5, elapsed=0) is None
+
+
+def test_not_retried_past_deadline(retry_policy):
+    retry_policy.deadline = 10
+
+    assert retry_policy.get_retry_delay(ZeebeBackPressure(), attempt=2, elapsed=7) == 2
+    assert retry_policy.get_retry_delay(ZeebeBackPressure(), attempt=2, elapsed=9) is None
+
+
+def test_jitter_shortens_delay():
+    retry_policy = RetryPolicy(initial_backoff=1, jitter=0.5)
+
+    for _ in range(20):
+        assert 0.5 <= retry_policy.get_retry_delay(ZeebeBackPressure(), attempt=1, elapsed=0) <= 1
@@ -7,7 +7,10 @@ import pytest
 
 from pyzeebe.credentials.camunda_cloud_credentials import CamundaCloudCredentials
 from pyzeebe.credentials.oauth_credentials import OAuthCredentials
-from pyzeebe.exceptions import ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError
+from pyzeebe.exceptions import ZeebeBackPressure, ZeebeGatewayUnavailable, ZeebeInternalError, \
+    WorkflowInstanceNotFound
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
+from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
 from tests.unit.utils.grpc_utils import GRPCStatusCode
 from tests.unit.utils.random_utils import RANDOM_RANGE
@@ -181,3 +184,91 @@ def test_close_after_retried_internal(zeebe_adapter):
         zeebe_adapter._common_zeebe_grpc_errors(error)
 
     zeebe_adapter._close.assert_called_once()
+
+
+def create_rpc_error(code: grpc.StatusCode) -> grpc.RpcError:
+    error = grpc.RpcError()
+    error._state = GRPCStatusCode(code)
+    return error
+
+
+class TestZeebeRpc:
+    @pytest.fixture
+    def retrying_zeebe_adapter(self, zeebe_adapter):
+        zeebe_adapter.retry_policy = RetryPolicy(max_attempts=3, initial_backoff=0)
+        return zeebe_adapter
+
+    def test_not_retried_without_policy(self, zeebe_adapter):
+        zeebe_adapter._gateway_stub.CompleteJob = MagicMock(
+            side_effect=create_rpc_error(grpc.StatusCode.RESOURCE_EXHAUSTED))
+
+        with pytest.raises(ZeebeBackPressure):
+            zeebe_adapter.complete_job(job_key=1, variables={})
+
+        assert zeebe_adapter._gateway_stub.CompleteJob.call_count == 1
+
+    def test_back_pressure_retried(self, retrying_zeebe_adapter):
+        response = MagicMock()
+        retrying_zeebe_adapter._gateway_stub.CompleteJob = MagicMock(
+            side_effect=[create_rpc_error(grpc.StatusCode.RESOURCE_EXHAUSTED), response])
+
+        assert retrying_zeebe_adapter.complete_job(job_key=1, variables={}) == response
+        assert retrying_zeebe_adapter._gateway_stub.CompleteJob.call_count == 2
+
+    def test_gives_up_after_max_attempts(self, retrying_zeebe_adapter):
+        retrying_zeebe_adapter._gateway_stub.PublishMessage = MagicMock(
+            side_effect=create_rpc_error(grpc.StatusCode.RESOURCE_EXHAUSTED))
+
+        with pytest.raises(ZeebeBackPressure):
+            retrying_zeebe_adapter.publish_message(name="message", correlation_key="key",
+                                                   time_to_live_in_milliseconds=0, variables={})
+
+        assert retrying_zeebe_adapter._gateway_stub.PublishMessage.call_count == 3
+
+    def test_non_retryable_error_not_retried(self, retrying_zeebe_adapter):
+        retrying_zeebe_adapter._gateway_stub.CancelWorkflowInstance = MagicMock(
+            side_effect=create_rpc_error(grpc.StatusCode.NOT_FOUND))
+
+        with pytest.raises(WorkflowInstanceNotFound):
+            retrying_zeebe_adapter.cancel_workflow_instance(workflow_instance_key=1)
+
+        assert retrying_zeebe_adapter._gateway_stub.CancelWorkflowInstance.call_count == 1
+
+    def test_stream_retried_before_first_item(self, retrying_zeebe_adapter, task, job_from_task):
+        retrying_zeebe_adapter._gateway_stub.ActivateJobs = MagicMock(
+            side_effect=[create_rpc_error(grpc.StatusCode.RESOURCE_EXHAUSTED), []])
+
+        jobs = list(retrying_zeebe_adapter.activate_jobs(task_type=task.type, worker="worker", timeout=100,
+                                                         max_jobs_to_activate=1, variables_to_fetch=[],
+                                                         request_timeout=0))
+
+        assert jobs == []
+        assert retrying_zeebe_adapter._gateway_stub.ActivateJobs.call_count == 2
+
+    def test_rate_limit_waits(self, zeebe_adapter):
+        zeebe_adapter._rate_limiters["CompleteJob"] = MagicMock()
+        zeebe_adapter._rate_limiters["CompleteJob"].reserve.return_value = 0.5
+        zeebe_adapter._gateway_stub.CompleteJob = MagicMock()
+        zeebe_adapter._wait = MagicMock()
+
+        zeebe_adapter.complete_job(job_key=1, variables={})
+
+        zeebe_adapter._wait.assert_called_with(0.5)
+
+    def test_rate_limited_future_call_delayed_by_scheduler(self, zeebe_adapter):
+        zeebe_adapter._rate_limiters["CompleteJob"] = MagicMock()
+        zeebe_adapter._rate_limiters["CompleteJob"].reserve.return_value = 60
+        zeebe_adapter._gateway_stub.CompleteJob = MagicMock()
+
+        zeebe_adapter.complete_job_future(job_key=1, variables={})
+
+        zeebe_adapter._gateway_stub.CompleteJob.future.assert_not_called()
+        assert len(zeebe_adapter._scheduler) == 1
+        zeebe_adapter._scheduler.stop()
+
+    def test_rate_limits_created_per_rpc(self, grpc_create_channel):
+        zeebe_adapter = ZeebeAdapter(channel=grpc_create_channel(), rate_limits={"CompleteJob": 10})
+
+        assert zeebe_adapter._reserve_rate_limit("CompleteJob") == 0
+        assert zeebe_adapter._reserve_rate_limit("FailJob") == 0
+        assert list(zeebe_adapter._rate_limiters) == ["CompleteJob"]
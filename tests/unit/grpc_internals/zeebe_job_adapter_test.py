@@ -1,5 +1,7 @@
+import json
+from concurrent.futures import Future
 from random import randint
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 from uuid import uuid4
 
 import grpc
@@ -7,6 +9,7 @@ import pytest
 from zeebe_grpc.gateway_pb2 import *
 
 from pyzeebe.exceptions import ActivateJobsRequestInvalid, JobAlreadyDeactivated, JobNotFound
+from pyzeebe.grpc_internals.retry_policy import RetryPolicy
 from pyzeebe.job.job import Job
 from pyzeebe.task.task import Task
 from tests.unit.utils.grpc_utils import GRPCStatusCode
@@ -123,11 +126,42 @@ def test_fail_job(zeebe_adapter, grpc_servicer):
     assert isinstance(response, FailJobResponse)
 
 
+def test_fail_job_sends_retries(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+    zeebe_adapter._gateway_stub.FailJob = MagicMock(wraps=zeebe_adapter._gateway_stub.FailJob)
+
+    zeebe_adapter.fail_job(job_key=job.key, message=str(uuid4()), retries=3)
+
+    assert zeebe_adapter._gateway_stub.FailJob.call_args[0][0].retries == 3
+
+
 def test_fail_job_not_found(zeebe_adapter):
     with pytest.raises(JobNotFound):
         zeebe_adapter.fail_job(job_key=randint(0, RANDOM_RANGE), message=str(uuid4()))
 
 
+def test_calls_reported_to_metrics(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+    zeebe_adapter.metrics = MagicMock()
+
+    zeebe_adapter.fail_job(job_key=job.key, message=str(uuid4()))
+    with pytest.raises(JobAlreadyDeactivated):
+        zeebe_adapter.fail_job(job_key=job.key, message=str(uuid4()))
+
+    reported = [(call[0][0], call[0][1]) for call in zeebe_adapter.metrics.rpc_finished.call_args_list]
+    assert reported == [("FailJob", "OK"), ("FailJob", "FAILED_PRECONDITION")]
+
+
+def test_future_calls_reported_to_metrics(zeebe_adapter, grpc_servicer):
+    zeebe_adapter.metrics = MagicMock()
+
+    zeebe_adapter.fail_job_future(job_key=randint(0, RANDOM_RANGE), message=str(uuid4())).exception(timeout=5)
+
+    zeebe_adapter.metrics.rpc_finished.assert_called_once_with("FailJob", "NOT_FOUND", ANY)
+
+
 def test_fail_job_already_failed(zeebe_adapter, grpc_servicer):
     task_type = create_random_task_and_activate(grpc_servicer)
     job = get_first_active_job(task_type, zeebe_adapter)
@@ -182,3 +216,83 @@ def test_throw_error_common_errors_called(zeebe_adapter, grpc_servicer):
     zeebe_adapter.throw_error(job_key=job.key, message=str(uuid4()))
 
     zeebe_adapter._common_zeebe_grpc_errors.assert_called()
+
+
+def test_complete_job_future(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+
+    response = zeebe_adapter.complete_job_future(job_key=job.key, variables={}).result(timeout=5)
+
+    assert isinstance(response, CompleteJobResponse)
+
+
+def test_complete_job_future_not_found(zeebe_adapter):
+    future = zeebe_adapter.complete_job_future(job_key=randint(0, RANDOM_RANGE), variables={})
+
+    assert isinstance(future.exception(timeout=5), JobNotFound)
+
+
+def test_fail_job_future(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+
+    response = zeebe_adapter.fail_job_future(job_key=job.key, message=str(uuid4())).result(timeout=5)
+
+    assert isinstance(response, FailJobResponse)
+
+
+def test_fail_job_future_already_failed(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+    zeebe_adapter.fail_job(job_key=job.key, message=str(uuid4()))
+
+    future = zeebe_adapter.fail_job_future(job_key=job.key, message=str(uuid4()))
+
+    assert isinstance(future.exception(timeout=5), JobAlreadyDeactivated)
+
+
+def test_throw_error_future(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+
+    response = zeebe_adapter.throw_error_future(job_key=job.key, message=str(uuid4())).result(timeout=5)
+
+    assert isinstance(response, ThrowErrorResponse)
+
+
+def test_job_status_future_retried(zeebe_adapter):
+    zeebe_adapter.retry_policy = RetryPolicy(initial_backoff=0)
+    error = grpc.RpcError()
+    error._state = GRPCStatusCode(grpc.StatusCode.RESOURCE_EXHAUSTED)
+    failed_call, successful_call = Future(), Future()
+    failed_call.set_exception(error)
+    successful_call.set_result(CompleteJobResponse())
+    zeebe_adapter._gateway_stub.CompleteJob = MagicMock()
+    zeebe_adapter._gateway_stub.CompleteJob.future.side_effect = [failed_call, successful_call]
+
+    response = zeebe_adapter.complete_job_future(job_key=randint(0, RANDOM_RANGE), variables={}).result(timeout=5)
+
+    assert isinstance(response, CompleteJobResponse)
+    assert zeebe_adapter._gateway_stub.CompleteJob.future.call_count == 2
+
+
+def test_activate_jobs_uses_json_codec(zeebe_adapter, grpc_servicer):
+    zeebe_adapter.json_codec = MagicMock(wraps=zeebe_adapter.json_codec)
+    task_type = create_random_task_and_activate(grpc_servicer)
+
+    job = get_first_active_job(task_type, zeebe_adapter)
+    zeebe_adapter.json_codec.loads.assert_not_called()
+    variables = job.variables
+
+    zeebe_adapter.json_codec.loads.assert_called_once_with(json.dumps(variables))
+
+
+def test_complete_job_uses_json_codec(zeebe_adapter, grpc_servicer):
+    task_type = create_random_task_and_activate(grpc_servicer)
+    job = get_first_active_job(task_type, zeebe_adapter)
+    zeebe_adapter.json_codec = MagicMock(wraps=zeebe_adapter.json_codec)
+
+    zeebe_adapter.complete_job(job_key=job.key, variables={"x": 1})
+
+    zeebe_adapter.json_codec.dumps.assert_called_with({"x": 1})
@@ -56,3 +56,23 @@ def test_publish_message_common_errors_called(zeebe_adapter):
                                   time_to_live_in_milliseconds=randint(0, RANDOM_RANGE))
 
     zeebe_adapter._common_zeebe_grpc_errors.assert_called()
+
+
+def test_publish_message_future(zeebe_adapter):
+    future = zeebe_adapter.publish_message_future(message_id=str(uuid4()), name=str(uuid4()), variables={},
+                                                  correlation_key=str(uuid4()),
+                                                  time_to_live_in_milliseconds=randint(0, RANDOM_RANGE))
+
+    assert isinstance(future.result(timeout=5), PublishMessageResponse)
+
+
+def test_publish_message_future_already_exists(zeebe_adapter):
+    message_id = str(uuid4())
+    zeebe_adapter.publish_message(message_id=message_id, name=str(uuid4()), variables={},
+                                  correlation_key=str(uuid4()), time_to_live_in_milliseconds=1000)
+
+    future = zeebe_adapter.publish_message_future(message_id=message_id, name=str(uuid4()), variables={},
+                                                  correlation_key=str(uuid4()), time_to_live_in_milliseconds=1000)
+
+    with pytest.raises(MessageAlreadyExists):
+        future.result(timeout=5)
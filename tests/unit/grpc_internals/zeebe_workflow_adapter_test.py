@@ -1,3 +1,5 @@
+import json
+from concurrent.futures import Future
 from io import BytesIO
 from random import randint
 from unittest.mock import patch, MagicMock
@@ -21,6 +23,18 @@ def test_create_workflow_instance(grpc_servicer, zeebe_adapter):
     assert isinstance(response, int)
 
 
+def test_create_workflow_instance_injects_trace_context(zeebe_adapter):
+    zeebe_adapter.tracing = MagicMock()
+    zeebe_adapter.tracing.inject.return_value = {"x": 1, "trace": "context"}
+    zeebe_adapter._gateway_stub.CreateWorkflowInstance = MagicMock()
+
+    zeebe_adapter.create_workflow_instance(bpmn_process_id=str(uuid4()), variables={"x": 1}, version=1)
+
+    zeebe_adapter.tracing.inject.assert_called_once_with({"x": 1})
+    request = zeebe_adapter._gateway_stub.CreateWorkflowInstance.call_args[0][0]
+    assert json.loads(request.variables) == {"x": 1, "trace": "context"}
+
+
 def test_create_workflow_instance_common_errors_called(zeebe_adapter):
     zeebe_adapter._common_zeebe_grpc_errors = MagicMock()
     error = grpc.RpcError()
@@ -155,3 +169,50 @@ def test_create_workflow_errors_common_errors_called(zeebe_adapter):
     zeebe_adapter._create_workflow_errors(error, str(uuid4()), randint(0, 10, ), {})
 
     zeebe_adapter._common_zeebe_grpc_errors.assert_called()
+
+
+def test_create_workflow_instance_future(grpc_servicer, zeebe_adapter):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+
+    future = zeebe_adapter.create_workflow_instance_future(bpmn_process_id=bpmn_process_id, variables={}, version=1)
+
+    assert future.result(timeout=5) in grpc_servicer.active_workflows
+
+
+def test_create_workflow_instance_future_not_found(zeebe_adapter):
+    future = zeebe_adapter.create_workflow_instance_future(bpmn_process_id=str(uuid4()), variables={}, version=1)
+
+    with pytest.raises(WorkflowNotFound):
+        future.result(timeout=5)
+
+
+def test_create_workflow_instance_with_result_future(grpc_servicer, zeebe_adapter):
+    bpmn_process_id = str(uuid4())
+    grpc_servicer.mock_deploy_workflow(bpmn_process_id, 1, [])
+
+    future = zeebe_adapter.create_workflow_instance_with_result_future(bpmn_process_id=bpmn_process_id, variables={},
+                                                                       version=1, timeout=0, variables_to_fetch=[])
+
+    assert isinstance(future.result(timeout=5), dict)
+
+
+def test_cancel_workflow_instance_future_not_found(zeebe_adapter):
+    future = zeebe_adapter.cancel_workflow_instance_future(workflow_instance_key=randint(0, RANDOM_RANGE))
+
+    assert isinstance(future.exception(timeout=5), WorkflowInstanceNotFound)
+
+
+def test_deploy_workflow_future_invalid(zeebe_adapter, tmp_path):
+    workflow_file = tmp_path / "workflow.bpmn"
+    workflow_file.write_bytes(b"invalid")
+    error = grpc.RpcError()
+    error._state = GRPCStatusCode(grpc.StatusCode.INVALID_ARGUMENT)
+    failed_call = Future()
+    failed_call.set_exception(error)
+    zeebe_adapter._gateway_stub.DeployWorkflow = MagicMock()
+    zeebe_adapter._gateway_stub.DeployWorkflow.future.return_value = failed_call
+
+    future = zeebe_adapter.deploy_workflow_future(str(workflow_file))
+
+    assert isinstance(future.exception(timeout=5), WorkflowInvalid)
@@ -0,0 +1,27 @@
+from threading import Thread
+
+from pyzeebe.job.job_context import get_current_job, set_current_job
+
+
+def test_no_current_job():
+    assert get_current_job() is None
+
+
+def test_set_current_job(job_without_adapter):
+    previous_job = set_current_job(job_without_adapter)
+
+    assert get_current_job() is job_without_adapter
+    set_current_job(previous_job)
+    assert get_current_job() is None
+
+
+def test_current_job_is_per_thread(job_without_adapter):
+    thread_jobs = []
+    set_current_job(job_without_adapter)
+
+    thread = Thread(target=lambda: thread_jobs.append(get_current_job()))
+    thread.start()
+    thread.join()
+
+    assert thread_jobs == [None]
+    set_current_job(None)
@@ -1,9 +1,13 @@
-from unittest.mock import patch
+import time
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from pyzeebe.exceptions import NoZeebeAdapter
+from pyzeebe.grpc_internals.json_codec import StdlibJsonCodec
+from pyzeebe.job.job import Job
+from pyzeebe.job.job_status import JobStatus
 
 
 def test_success(job_with_adapter):
@@ -41,3 +45,98 @@ def test_failure_no_zeebe_adapter(job_without_adapter):
     with pytest.raises(NoZeebeAdapter):
         message = str(uuid4())
         job_without_adapter.set_failure_status(message)
+
+
+@pytest.fixture
+def json_codec():
+    return MagicMock(wraps=StdlibJsonCodec())
+
+
+@pytest.fixture
+def encoded_job(json_codec):
+    return Job(key=1, _type="test", workflow_instance_key=1, bpmn_process_id="process", workflow_definition_version=1,
+               workflow_key=1, element_id="element", element_instance_key=1, custom_headers='{"header": "value"}',
+               worker="worker", retries=3, deadline=0, variables='{"x": 1}', json_codec=json_codec)
+
+
+def test_variables_not_decoded_before_access(encoded_job, json_codec):
+    json_codec.loads.assert_not_called()
+
+
+def test_variables_decoded_once(encoded_job, json_codec):
+    assert encoded_job.variables == {"x": 1}
+    assert encoded_job.variables == {"x": 1}
+
+    json_codec.loads.assert_called_once_with('{"x": 1}')
+
+
+def test_custom_headers_decoded_on_access(encoded_job, json_codec):
+    assert encoded_job.custom_headers == {"header": "value"}
+
+    json_codec.loads.assert_called_once_with('{"header": "value"}')
+
+
+def test_set_variables_skips_decoding(encoded_job, json_codec):
+    encoded_job.variables = {"y": 2}
+
+    assert encoded_job.variables == {"y": 2}
+    json_codec.loads.assert_not_called()
+
+
+def test_decoded_variables_unpack_as_keyword_arguments(encoded_job):
+    def task_function(x):
+        return x
+
+    assert task_function(**encoded_job.variables) == 1
+
+
+def test_job_has_no_instance_dict(job_without_adapter):
+    assert not hasattr(job_without_adapter, "__dict__")
+
+
+def test_repr_does_not_decode_variables(encoded_job, json_codec):
+    representation = repr(encoded_job)
+
+    assert str(encoded_job.key) in representation
+    assert "variables" not in representation
+    json_codec.loads.assert_not_called()
+
+
+def test_expired(job_without_adapter):
+    job_without_adapter.deadline = int((time.time() - 1) * 1000)
+
+    assert job_without_adapter.expired
+
+
+def test_not_expired(job_without_adapter):
+    job_without_adapter.deadline = int((time.time() + 60) * 1000)
+
+    assert not job_without_adapter.expired
+    assert 0 < job_without_adapter.seconds_until_deadline() <= 60
+
+
+def test_without_deadline_not_expired(job_without_adapter):
+    job_without_adapter.deadline = 0
+
+    assert not job_without_adapter.expired
+
+
+def test_cancel(job_without_adapter):
+    assert not job_without_adapter.cancelled
+
+    job_without_adapter.cancel()
+
+    assert job_without_adapter.cancelled
+
+
+@pytest.mark.parametrize("set_status,status", [
+    (lambda job: job.set_success_status(), JobStatus.Completed),
+    (lambda job: job.set_failure_status("failure"), JobStatus.Failed),
+    (lambda job: job.set_error_status("error"), JobStatus.ErrorThrown)
+])
+def test_set_status_updates_status(job_without_adapter, set_status, status):
+    job_without_adapter.zeebe_adapter = MagicMock()
+
+    set_status(job_without_adapter)
+
+    assert job_without_adapter.status == status
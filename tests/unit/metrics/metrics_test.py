@@ -0,0 +1,104 @@
+import grpc
+import pytest
+
+from pyzeebe.exceptions import JobNotFound, ZeebeBackPressure
+from pyzeebe.metrics import metrics
+from pyzeebe.metrics.metrics import PrometheusMetrics, get_status_code
+from tests.unit.utils.grpc_utils import GRPCStatusCode
+
+
+@pytest.fixture
+def registry():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    return prometheus_client.CollectorRegistry()
+
+
+@pytest.fixture
+def prometheus_metrics(registry):
+    return PrometheusMetrics(registry=registry)
+
+
+def rpc_error(status_code: grpc.StatusCode) -> grpc.RpcError:
+    error = grpc.RpcError()
+    error._state = GRPCStatusCode(status_code)
+    return error
+
+
+def test_jobs_activated(prometheus_metrics, registry):
+    prometheus_metrics.jobs_activated("task", 3, 0.5)
+
+    assert registry.get_sample_value("pyzeebe_jobs_activated_total", {"task_type": "task"}) == 3
+    assert registry.get_sample_value("pyzeebe_job_activation_seconds_sum", {"task_type": "task"}) == 0.5
+
+
+def test_job_lifecycle(prometheus_metrics, registry):
+    prometheus_metrics.job_queued("task")
+    assert registry.get_sample_value("pyzeebe_jobs_queued", {"task_type": "task"}) == 1
+
+    prometheus_metrics.job_started("task")
+    prometheus_metrics.job_finished("task", "completed", 0.25)
+    assert registry.get_sample_value("pyzeebe_jobs_queued", {"task_type": "task"}) == 0
+    assert registry.get_sample_value("pyzeebe_jobs_in_flight", {"task_type": "task"}) == 1
+
+    prometheus_metrics.job_done("task")
+    assert registry.get_sample_value("pyzeebe_jobs_in_flight", {"task_type": "task"}) == 0
+    assert registry.get_sample_value("pyzeebe_jobs_finished_total", {"task_type": "task", "outcome": "completed"}) == 1
+    assert registry.get_sample_value("pyzeebe_job_duration_seconds_count", {"task_type": "task"}) == 1
+
+
+def test_rejected_job_not_queued(prometheus_metrics, registry):
+    prometheus_metrics.job_queued("task")
+
+    prometheus_metrics.job_rejected("task")
+    prometheus_metrics.job_done("task")
+
+    assert registry.get_sample_value("pyzeebe_jobs_queued", {"task_type": "task"}) == 0
+    assert registry.get_sample_value("pyzeebe_jobs_in_flight", {"task_type": "task"}) == 0
+
+
+def test_rpc_finished(prometheus_metrics, registry):
+    prometheus_metrics.rpc_finished("CompleteJob", "OK", 0.01)
+
+    assert registry.get_sample_value("pyzeebe_rpc_duration_seconds_count", {"rpc": "CompleteJob", "code": "OK"}) == 1
+    assert registry.get_sample_value("pyzeebe_backpressure_total", {"rpc": "CompleteJob"}) is None
+
+
+def test_backpressure_counted(prometheus_metrics, registry):
+    prometheus_metrics.rpc_finished("ActivateJobs", "RESOURCE_EXHAUSTED", 0.01)
+
+    assert registry.get_sample_value("pyzeebe_backpressure_total", {"rpc": "ActivateJobs"}) == 1
+
+
+def test_namespace(registry):
+    PrometheusMetrics(registry=registry, namespace="worker").job_done("task")
+
+    assert registry.get_sample_value("worker_jobs_in_flight", {"task_type": "task"}) == -1
+
+
+def test_prometheus_metrics_without_library(monkeypatch):
+    monkeypatch.setattr(metrics, "prometheus_client", None)
+
+    with pytest.raises(ImportError):
+        PrometheusMetrics()
+
+
+def test_status_code_of_success():
+    assert get_status_code(None) == "OK"
+
+
+def test_status_code_of_grpc_error():
+    assert get_status_code(rpc_error(grpc.StatusCode.NOT_FOUND)) == "NOT_FOUND"
+
+
+def test_status_code_of_mapped_error():
+    try:
+        try:
+            raise rpc_error(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        except grpc.RpcError:
+            raise ZeebeBackPressure()
+    except ZeebeBackPressure as e:
+        assert get_status_code(e) == "RESOURCE_EXHAUSTED"
+
+
+def test_status_code_of_other_error():
+    assert get_status_code(JobNotFound(1)) == "UNKNOWN"
@@ -0,0 +1,101 @@
+from uuid import uuid4
+
+import pytest
+
+from pyzeebe.exceptions import DuplicateTaskType, TaskNotFound
+from pyzeebe.task.task import Task
+from pyzeebe.task.task_registry import TaskRegistry
+
+
+def create_task(task_type: str = None) -> Task:
+    return Task(task_type=task_type or str(uuid4()), task_handler=lambda x: x, exception_handler=lambda x: x)
+
+
+@pytest.fixture
+def tasks():
+    return [create_task() for _ in range(5)]
+
+
+@pytest.fixture
+def registry(tasks):
+    return TaskRegistry(tasks)
+
+
+def test_keeps_order(registry, tasks):
+    assert list(registry) == tasks
+    assert len(registry) == len(tasks)
+
+
+def test_get(registry, tasks):
+    assert registry.get(tasks[2].type) is tasks[2]
+
+
+def test_get_missing(registry):
+    assert registry.get(str(uuid4())) is None
+
+
+def test_contains_task_and_task_type(registry, tasks):
+    assert tasks[0] in registry
+    assert tasks[0].type in registry
+    assert create_task() not in registry
+
+
+def test_append_duplicate(registry, tasks):
+    with pytest.raises(DuplicateTaskType):
+        registry.append(create_task(tasks[0].type))
+
+
+def test_indexing(registry, tasks):
+    assert registry[1] is tasks[1]
+    assert registry[-1] is tasks[-1]
+    assert registry.index(tasks[3].type) == 3
+
+
+def test_index_missing(registry):
+    with pytest.raises(TaskNotFound):
+        registry.index(str(uuid4()))
+
+
+def test_remove(registry, tasks):
+    assert registry.remove(tasks[1].type) is tasks[1]
+
+    assert tasks[1] not in registry
+    assert list(registry) == tasks[:1] + tasks[2:]
+    assert registry.index(tasks[2].type) == 1
+
+
+def test_remove_missing(registry):
+    with pytest.raises(TaskNotFound):
+        registry.remove(str(uuid4()))
+
+
+def test_append_after_indexing(registry, tasks):
+    assert registry[0] is tasks[0]
+    task = create_task()
+
+    registry.append(task)
+
+    assert registry[-1] is task
+    assert registry.index(task.type) == len(tasks)
+
+
+def test_replace_keeps_position(registry, tasks):
+    assert registry[2] is tasks[2]
+    new_task = create_task(tasks[2].type)
+
+    assert registry.replace(new_task) is tasks[2]
+
+    assert registry[2] is new_task
+    assert registry.get(new_task.type) is new_task
+
+
+def test_replace_missing(registry):
+    with pytest.raises(TaskNotFound):
+        registry.replace(create_task())
+
+
+def test_remove_while_iterating(registry, tasks):
+    for task in registry:
+        registry.remove(task.type)
+
+    assert len(registry) == 0
@@ -41,3 +41,9 @@ def test_add_after_plus_constructor():
     base_decorator.after(function_decorator)
     assert len(base_decorator._after) == 2
     assert base_decorator._after == [constructor_decorator, function_decorator]
+
+
+def test_task_has_no_instance_dict():
+    task = Task(task_type=str(uuid.uuid4()), task_handler=lambda x: x, exception_handler=lambda x: x)
+
+    assert not hasattr(task, "__dict__")
@@ -0,0 +1,143 @@
+import time
+
+import grpc
+import pytest
+
+from pyzeebe.exceptions import JobNotFound
+from pyzeebe.tracing.tracing import TRACE_CONTEXT_VARIABLE, OpenTelemetryTracing, Tracing
+from tests.unit.utils.grpc_utils import GRPCStatusCode
+
+
+@pytest.fixture
+def exporter():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer_provider(exporter):
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return tracer_provider
+
+
+@pytest.fixture
+def tracing(tracer_provider):
+    return OpenTelemetryTracing(tracer_provider=tracer_provider)
+
+
+def get_span(exporter, name: str):
+    return next(span for span in exporter.get_finished_spans() if span.name == name)
+
+
+class TestTracing:
+    def test_spans_do_nothing(self, job_from_task):
+        tracing = Tracing()
+
+        with tracing.job_span(job_from_task, 1000):
+            with tracing.stage_span("task function"), tracing.rpc_span("CompleteJob"):
+                tracing.job_finished("completed")
+
+    def test_inject_returns_variables(self):
+        variables = {"x": 1}
+
+        assert Tracing().inject(variables) is variables
+
+    def test_variables_to_fetch_unchanged(self):
+        assert Tracing().get_variables_to_fetch(["x"]) == ["x"]
+
+
+class TestOpenTelemetryTracing:
+    def test_rpc_span(self, tracing, exporter):
+        with tracing.rpc_span("CompleteJob"):
+            pass
+
+        span = get_span(exporter, "CompleteJob")
+        assert span.attributes["rpc.method"] == "CompleteJob"
+        assert span.attributes["rpc.grpc.status_code"] == "OK"
+
+    def test_failed_rpc_span(self, tracing, exporter):
+        error = grpc.RpcError()
+        error._state = GRPCStatusCode(grpc.StatusCode.NOT_FOUND)
+
+        with pytest.raises(JobNotFound):
+            with tracing.rpc_span("CompleteJob"):
+                try:
+                    raise error
+                except grpc.RpcError:
+                    raise JobNotFound(1)
+
+        span = get_span(exporter, "CompleteJob")
+        assert span.attributes["rpc.grpc.status_code"] == "NOT_FOUND"
+        assert not span.status.is_ok
+
+    def test_job_span_continues_injected_trace(self, tracing, exporter, job_from_task):
+        with tracing.tracer.start_as_current_span("create instance"):
+            job_from_task.variables = tracing.inject(job_from_task.variables)
+
+        with tracing.job_span(job_from_task):
+            pass
+
+        parent = get_span(exporter, "create instance")
+        span = get_span(exporter, job_from_task.type)
+        assert span.parent.span_id == parent.context.span_id
+        assert span.context.trace_id == parent.context.trace_id
+
+    def test_job_span_removes_trace_context(self, tracing, job_from_task):
+        with tracing.tracer.start_as_current_span("create instance"):
+            job_from_task.variables = tracing.inject(job_from_task.variables)
+
+        with tracing.job_span(job_from_task):
+            pass
+
+        assert TRACE_CONTEXT_VARIABLE not in job_from_task.variables
+
+    def test_job_span_without_trace_context_starts_trace(self, tracing, exporter, job_from_task):
+        with tracing.tracer.start_as_current_span("worker"):
+            with tracing.job_span(job_from_task):
+                pass
+
+        assert get_span(exporter, job_from_task.type).parent is None
+
+    def test_job_span_starts_at_activation(self, tracing, exporter, job_from_task):
+        job_from_task.deadline = int(time.time() * 1000) + 9000
+
+        with tracing.job_span(job_from_task, timeout=10000):
+            pass
+
+        span = get_span(exporter, job_from_task.type)
+        activation_wait = get_span(exporter, "activation wait")
+        assert span.start_time == activation_wait.start_time == (job_from_task.deadline - 10000) * 1000000
+        assert activation_wait.parent.span_id == span.context.span_id
+
+    def test_stage_spans_are_children_of_job_span(self, tracing, exporter, job_from_task):
+        with tracing.job_span(job_from_task):
+            with tracing.stage_span("task function"):
+                pass
+
+        span = get_span(exporter, job_from_task.type)
+        assert get_span(exporter, "task function").parent.span_id == span.context.span_id
+
+    def test_job_finished(self, tracing, exporter, job_from_task):
+        with tracing.job_span(job_from_task):
+            tracing.job_finished("failed")
+
+        span = get_span(exporter, job_from_task.type)
+        assert span.attributes["zeebe.job.outcome"] == "failed"
+        assert not span.status.is_ok
+
+    def test_inject_without_span(self, tracing):
+        assert tracing.inject({"x": 1}) == {"x": 1}
+
+    def test_inject_without_propagation(self, tracer_provider):
+        tracing = OpenTelemetryTracing(tracer_provider=tracer_provider, propagate_context=False)
+
+        with tracing.tracer.start_as_current_span("create instance"):
+            assert tracing.inject({"x": 1}) == {"x": 1}
+
+    def test_variables_to_fetch_include_trace_context(self, tracing):
+        assert tracing.get_variables_to_fetch(["x"]) == ["x", TRACE_CONTEXT_VARIABLE]
+        assert tracing.get_variables_to_fetch([]) == []
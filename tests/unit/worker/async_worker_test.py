@@ -0,0 +1,297 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyzeebe.exceptions import DuplicateTaskType, JobNotFound
+from pyzeebe.job.job import Job
+from pyzeebe.job.job_context import get_current_job
+from pyzeebe.job.job_status import JobStatus
+from pyzeebe.tracing.tracing import Tracing
+from tests.unit.utils.random_utils import random_job
+
+
+@pytest.fixture
+def complete_job_mock(async_zeebe_worker):
+    async def complete_job(job_key, variables):
+        pass
+
+    async_zeebe_worker.zeebe_adapter.complete_job = MagicMock(side_effect=complete_job)
+    return async_zeebe_worker.zeebe_adapter.complete_job
+
+
+class TestAddTask:
+    def test_async_task_added(self, async_zeebe_worker, task_type):
+        @async_zeebe_worker.task(task_type)
+        async def _(x):
+            return dict(x=x)
+
+        assert async_zeebe_worker.get_task(task_type).variables_to_fetch == ["x"]
+
+    def test_raises_on_duplicate(self, async_zeebe_worker, task):
+        async_zeebe_worker._add_task(task)
+        with pytest.raises(DuplicateTaskType):
+            async_zeebe_worker._add_task(task)
+
+    def test_include_router_with_async_task(self, async_zeebe_worker, router, task_type):
+        @router.task(task_type)
+        async def _(x):
+            return dict(x=x)
+
+        async_zeebe_worker.include_router(router)
+
+        assert async_zeebe_worker.get_task(task_type) is not None
+
+
+class TestTaskHandler:
+    @pytest.mark.asyncio
+    async def test_async_function_called(self, async_zeebe_worker, task_type, complete_job_mock):
+        @async_zeebe_worker.task(task_type)
+        async def _(x):
+            return dict(y=x + 1)
+
+        job = random_job(async_zeebe_worker.get_task(task_type))
+        job.variables = dict(x=1)
+
+        await async_zeebe_worker.get_task(task_type).handler(job)
+
+        complete_job_mock.assert_called_with(job_key=job.key, variables=dict(y=2))
+
+    @pytest.mark.asyncio
+    async def test_sync_function_called(self, async_zeebe_worker, task_type, complete_job_mock):
+        @async_zeebe_worker.task(task_type)
+        def _(x):
+            return dict(y=x + 1)
+
+        job = random_job(async_zeebe_worker.get_task(task_type))
+        job.variables = dict(x=1)
+
+        await async_zeebe_worker.get_task(task_type).handler(job)
+
+        complete_job_mock.assert_called_with(job_key=job.key, variables=dict(y=2))
+
+    @pytest.mark.asyncio
+    async def test_async_single_value_function(self, async_zeebe_worker, task_type, complete_job_mock):
+        @async_zeebe_worker.task(task_type, single_value=True, variable_name="y")
+        async def _(x):
+            return x + 1
+
+        job = random_job(async_zeebe_worker.get_task(task_type))
+        job.variables = dict(x=1)
+
+        await async_zeebe_worker.get_task(task_type).handler(job)
+
+        complete_job_mock.assert_called_with(job_key=job.key, variables=dict(y=2))
+
+    @pytest.mark.asyncio
+    async def test_async_exception_handler_awaited(self, async_zeebe_worker, task_type, complete_job_mock):
+        exception_handler_called = asyncio.Event()
+
+        async def exception_handler(exception: Exception, job: Job):
+            exception_handler_called.set()
+
+        @async_zeebe_worker.task(task_type, exception_handler=exception_handler)
+        async def _():
+            raise Exception()
+
+        await async_zeebe_worker.get_task(task_type).handler(random_job(async_zeebe_worker.get_task(task_type)))
+
+        assert exception_handler_called.is_set()
+        complete_job_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_exception_handler_called(self, async_zeebe_worker, task, job_from_task, complete_job_mock):
+        task.inner_function.side_effect = Exception()
+        task.exception_handler = MagicMock()
+        async_zeebe_worker._add_task(task)
+
+        await task.handler(job_from_task)
+
+        task.exception_handler.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_status_call_of_sync_exception_handler_awaited(self, async_zeebe_worker, task, job_from_task,
+                                                                 complete_job_mock):
+        fail_job_done = asyncio.Event()
+
+        async def fail_job(job_key, message, retries):
+            fail_job_done.set()
+
+        async_zeebe_worker.zeebe_adapter.fail_job = MagicMock(side_effect=fail_job)
+        job_from_task.zeebe_adapter = async_zeebe_worker.zeebe_adapter
+        task.inner_function.side_effect = Exception()
+        task.exception_handler = lambda exception, job: job.set_failure_status("failed")
+        async_zeebe_worker._add_task(task)
+
+        await task.handler(job_from_task)
+
+        assert fail_job_done.is_set()
+        assert job_from_task.status == JobStatus.Failed
+
+    @pytest.mark.asyncio
+    async def test_failed_status_call_logged(self, async_zeebe_worker, task, job_from_task, complete_job_mock,
+                                             caplog):
+        async def fail_job(job_key, message, retries):
+            raise JobNotFound(job_key)
+
+        async_zeebe_worker.zeebe_adapter.fail_job = MagicMock(side_effect=fail_job)
+        job_from_task.zeebe_adapter = async_zeebe_worker.zeebe_adapter
+        task.inner_function.side_effect = Exception()
+        task.exception_handler = lambda exception, job: job.set_failure_status("failed")
+        async_zeebe_worker._add_task(task)
+
+        await task.handler(job_from_task)
+
+        assert "Failed to update the status of job" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_job_with_status_set_not_completed(self, async_zeebe_worker, task, job_from_task,
+                                                     complete_job_mock):
+        async def throw_error(job_key, message):
+            pass
+
+        async_zeebe_worker.zeebe_adapter.throw_error = MagicMock(side_effect=throw_error)
+        job_from_task.zeebe_adapter = async_zeebe_worker.zeebe_adapter
+        task.before(lambda job: job.set_error_status("business error") or job)
+        async_zeebe_worker._add_task(task)
+
+        await task.handler(job_from_task)
+
+        async_zeebe_worker.zeebe_adapter.throw_error.assert_called_once()
+        complete_job_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_decorators_awaited(self, async_zeebe_worker, task, job_from_task, complete_job_mock):
+        decorator_calls = []
+
+        async def decorator(job: Job) -> Job:
+            decorator_calls.append(job)
+            return job
+
+        async_zeebe_worker.before(decorator)
+        task.after(decorator)
+        async_zeebe_worker._add_task(task)
+
+        assert await task.handler(job_from_task) == job_from_task
+        assert decorator_calls == [job_from_task, job_from_task]
+
+    @pytest.mark.asyncio
+    async def test_failing_decorator_ignored(self, async_zeebe_worker, task, decorator, job_from_task,
+                                             complete_job_mock):
+        decorator.side_effect = Exception()
+        async_zeebe_worker.before(decorator)
+        async_zeebe_worker._add_task(task)
+
+        assert isinstance(await task.handler(job_from_task), Job)
+        complete_job_mock.assert_called()
+
+
+class TestTracing:
+    @pytest.mark.asyncio
+    async def test_job_traced(self, async_zeebe_worker, task, job_from_task, complete_job_mock):
+        async_zeebe_worker.tracing = MagicMock(spec=Tracing)
+        async_zeebe_worker._add_task(task)
+
+        await task.handler(job_from_task)
+
+        async_zeebe_worker.tracing.job_span.assert_called_once_with(job_from_task, task.timeout)
+        stages = [args[0] for args, _ in async_zeebe_worker.tracing.stage_span.call_args_list]
+        assert stages == ["before decorators", "task function", "after decorators", "complete job"]
+        async_zeebe_worker.tracing.job_finished.assert_called_once_with("completed")
+
+
+class TestJobDeadlines:
+    @pytest.fixture(autouse=True)
+    def enforce_job_deadlines(self, async_zeebe_worker):
+        async_zeebe_worker.enforce_job_deadlines = True
+
+    @pytest.mark.asyncio
+    async def test_expired_job_skipped(self, async_zeebe_worker, task, job_from_task, complete_job_mock):
+        async_zeebe_worker._add_task(task)
+        job_from_task.deadline = int((time.time() - 1) * 1000)
+
+        await task.handler(job_from_task)
+
+        task.inner_function.assert_not_called()
+        complete_job_mock.assert_not_called()
+        assert async_zeebe_worker.get_deadline_stats(task.type)["skipped_jobs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_overrunning_async_function_cancelled(self, async_zeebe_worker, task_type, complete_job_mock):
+        function_cancelled = asyncio.Event()
+
+        @async_zeebe_worker.task(task_type)
+        async def _():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                function_cancelled.set()
+                raise
+            return {}
+
+        job = random_job(async_zeebe_worker.get_task(task_type))
+        job.deadline = int((time.time() + 0.05) * 1000)
+
+        await asyncio.wait_for(async_zeebe_worker.get_task(task_type).handler(job), 2)
+
+        assert function_cancelled.is_set()
+        assert job.cancelled
+        complete_job_mock.assert_not_called()
+        assert async_zeebe_worker.get_deadline_stats(task_type)["overrun_jobs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_function_sees_current_job(self, async_zeebe_worker, task, job_from_task, complete_job_mock):
+        current_jobs = []
+        task.inner_function.side_effect = lambda **variables: current_jobs.append(get_current_job()) or variables
+        async_zeebe_worker._add_task(task)
+        job_from_task.deadline = int((time.time() + 60) * 1000)
+
+        await task.handler(job_from_task)
+
+        assert current_jobs == [job_from_task]
+        complete_job_mock.assert_called_once()
+
+
+class TestWork:
+    @pytest.mark.asyncio
+    async def test_jobs_completed(self, async_zeebe_worker, task_type, grpc_servicer):
+        @async_zeebe_worker.task(task_type)
+        async def _():
+            await asyncio.sleep(0)
+            return {}
+
+        jobs = [random_job(async_zeebe_worker.get_task(task_type)) for _ in range(10)]
+        for job in jobs:
+            grpc_servicer.active_jobs[job.key] = job
+
+        work = asyncio.ensure_future(async_zeebe_worker.work())
+        await asyncio.wait_for(self.wait_for_jobs(jobs), timeout=5)
+        await async_zeebe_worker.stop(wait=True)
+        await work
+
+        assert all(job.status == JobStatus.Completed for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_stop_without_tasks(self, async_zeebe_worker):
+        await async_zeebe_worker.work()
+        await async_zeebe_worker.stop(wait=True)
+
+    @staticmethod
+    async def wait_for_jobs(jobs):
+        while any(job.status == JobStatus.Running for job in jobs):
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_grows_without_jobs(self, async_zeebe_worker, task_type):
+        async_zeebe_worker.idle_poll_interval = 0.01
+
+        @async_zeebe_worker.task(task_type)
+        async def _():
+            pass
+
+        work = asyncio.ensure_future(async_zeebe_worker.work())
+        while async_zeebe_worker.get_poll_interval(task_type) < 0.04:
+            await asyncio.sleep(0.01)
+        await async_zeebe_worker.stop(wait=True)
+        await work
@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyzeebe.worker.job_executor import ThreadPoolJobExecutor
+
+
+@pytest.fixture
+def job_executor():
+    executor = ThreadPoolJobExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_submit_runs_task_handler(job_executor, task, job_from_task):
+    task.handler = MagicMock(return_value=job_from_task)
+
+    future = job_executor.submit(task, job_from_task)
+
+    assert future.result(timeout=1) == job_from_task
+    task.handler.assert_called_with(job_from_task)
+
+
+def test_threads_are_reused(job_executor, task, job_from_task):
+    task.handler = MagicMock()
+
+    for _ in range(20):
+        job_executor.submit(task, job_from_task).result(timeout=1)
+
+    assert len(job_executor._executor._threads) <= job_executor.max_workers
+
+
+def test_handler_exception_set_on_future(job_executor, task, job_from_task):
+    exception = Exception()
+    task.handler = MagicMock(side_effect=exception)
+
+    assert job_executor.submit(task, job_from_task).exception(timeout=1) == exception
+
+
+def test_submit_after_shutdown_raises(task, job_from_task):
+    executor = ThreadPoolJobExecutor()
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(task, job_from_task)
@@ -0,0 +1,68 @@
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyzeebe.worker.job_logger import JobLogger, StructuredLogFormatter
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("pyzeebe.test.job_logger")
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+@pytest.fixture
+def job(job_without_adapter):
+    job_without_adapter.variables = {"secret": "x" * 100}
+    return job_without_adapter
+
+
+def test_nothing_logged_when_debug_disabled():
+    logger = MagicMock()
+    logger.isEnabledFor.return_value = False
+
+    JobLogger(logger).running(MagicMock())
+
+    logger.debug.assert_not_called()
+
+
+def test_logs_job_repr(logger, job, caplog):
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        JobLogger(logger).completing(job)
+
+    assert caplog.records[0].getMessage() == f"Completing job: {job!r}"
+
+
+def test_structured_log_has_job_fields(logger, job, caplog):
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        JobLogger(logger, structured=True).finished(job, duration=0.25, succeeded=True)
+
+    record = caplog.records[0]
+    assert record.event == "finished"
+    assert record.job_key == job.key
+    assert record.task_type == job.type
+    assert record.duration_ms == 250
+    assert record.succeeded is True
+
+
+def test_structured_log_does_not_format_variables(logger, job, caplog):
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        JobLogger(logger, structured=True).failed(job, Exception("error"))
+
+    assert "secret" not in caplog.records[0].getMessage()
+    assert caplog.records[0].error == "Exception('error')"
+
+
+def test_structured_log_formatter(logger, job, caplog):
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        JobLogger(logger, structured=True).running(job)
+
+    entry = json.loads(StructuredLogFormatter().format(caplog.records[0]))
+
+    assert entry["event"] == "running"
+    assert entry["job_key"] == job.key
+    assert entry["level"] == "DEBUG"
+    assert "duration_ms" not in entry
@@ -0,0 +1,141 @@
+from concurrent.futures import Future
+from threading import Event
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyzeebe.exceptions import JobNotFound
+from pyzeebe.worker.job_status_pipeline import JobStatusPipeline
+
+
+def done_future(result=None) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+@pytest.fixture
+def adapter_mock():
+    adapter = MagicMock()
+    adapter.complete_job_future.side_effect = lambda **kwargs: done_future()
+    adapter.fail_job_future.side_effect = lambda **kwargs: done_future()
+    adapter.throw_error_future.side_effect = lambda **kwargs: done_future()
+    return adapter
+
+
+@pytest.fixture
+def pipeline(adapter_mock):
+    pipeline = JobStatusPipeline(adapter_mock, sender_threads=2, max_queue_size=10, max_in_flight=5)
+    pipeline.start()
+    yield pipeline
+    pipeline.stop(wait=True, timeout=5)
+
+
+def test_complete_job_sent(pipeline, adapter_mock):
+    pipeline.complete_job(job_key=1, variables={"x": 1})
+    pipeline.stop(wait=True, timeout=5)
+
+    adapter_mock.complete_job_future.assert_called_with(job_key=1, variables={"x": 1}, timeout=30)
+
+
+def test_fail_job_sent(pipeline, adapter_mock):
+    pipeline.fail_job(job_key=1, message="message")
+    pipeline.stop(wait=True, timeout=5)
+
+    adapter_mock.fail_job_future.assert_called_with(job_key=1, message="message", retries=0, timeout=30)
+
+
+def test_throw_error_sent(pipeline, adapter_mock):
+    pipeline.throw_error(job_key=1, message="message")
+    pipeline.stop(wait=True, timeout=5)
+
+    adapter_mock.throw_error_future.assert_called_with(job_key=1, message="message", timeout=30)
+
+
+def test_stop_flushes_queue(pipeline, adapter_mock):
+    for job_key in range(50):
+        pipeline.complete_job(job_key=job_key, variables={})
+
+    assert pipeline.stop(wait=True, timeout=5)
+
+    assert adapter_mock.complete_job_future.call_count == 50
+    assert pipeline.pending == 0
+
+
+def test_stop_waits_for_in_flight_calls(pipeline, adapter_mock):
+    call = Future()
+    adapter_mock.complete_job_future.side_effect = lambda **kwargs: call
+    pipeline.complete_job(job_key=1, variables={})
+
+    assert not pipeline.stop(wait=True, timeout=0.1)
+    call.set_result(None)
+    assert pipeline.pending == 0
+
+
+def test_stop_timeout_with_sender_waiting_for_slot(adapter_mock):
+    pipeline = JobStatusPipeline(adapter_mock, sender_threads=1, max_in_flight=1)
+    call = Future()
+    adapter_mock.complete_job_future.side_effect = lambda **kwargs: call
+    pipeline.start()
+    pipeline.complete_job(job_key=1, variables={})
+    pipeline.complete_job(job_key=2, variables={})
+
+    assert not pipeline.stop(wait=True, timeout=0.1)
+    call.set_result(None)
+    assert pipeline.stop(wait=True, timeout=5)
+
+
+def test_sender_threads_are_daemons(pipeline):
+    assert all(thread.daemon for thread in pipeline._threads)
+
+
+def test_request_timeout_passed_to_calls(adapter_mock):
+    pipeline = JobStatusPipeline(adapter_mock, request_timeout=5)
+    pipeline.start()
+    pipeline.complete_job(job_key=1, variables={})
+    pipeline.stop(wait=True, timeout=5)
+
+    adapter_mock.complete_job_future.assert_called_with(job_key=1, variables={}, timeout=5)
+
+
+def test_in_flight_calls_bounded(pipeline, adapter_mock):
+    calls = []
+    all_started = Event()
+
+    def complete_job_future(**kwargs):
+        calls.append(Future() if len(calls) < 5 else done_future())
+        if len(calls) == 5:
+            all_started.set()
+        return calls[-1]
+
+    adapter_mock.complete_job_future.side_effect = complete_job_future
+    for job_key in range(8):
+        pipeline.complete_job(job_key=job_key, variables={})
+
+    assert all_started.wait(timeout=5)
+    assert len(calls) == 5
+    for call in calls[:5]:
+        call.set_result(None)
+    assert pipeline.stop(wait=True, timeout=5)
+    assert len(calls) == 8
+
+
+def test_failed_update_does_not_stop_pipeline(pipeline, adapter_mock):
+    failed_call = Future()
+    failed_call.set_exception(JobNotFound(1))
+    adapter_mock.complete_job_future.side_effect = [failed_call, done_future()]
+
+    pipeline.complete_job(job_key=1, variables={})
+    pipeline.complete_job(job_key=2, variables={})
+
+    assert pipeline.stop(wait=True, timeout=5)
+    assert adapter_mock.complete_job_future.call_count == 2
+
+
+def test_update_after_stop_sent_synchronously(pipeline, adapter_mock):
+    pipeline.stop(wait=True, timeout=5)
+
+    pipeline.complete_job(job_key=1, variables={})
+
+    adapter_mock.complete_job_future.assert_called_with(job_key=1, variables={}, timeout=30)
+    assert pipeline.pending == 0
@@ -0,0 +1,45 @@
+import pytest
+
+from pyzeebe.worker.poll_backoff import PollBackoff
+
+
+@pytest.fixture
+def backoff():
+    return PollBackoff(initial_interval=1, max_interval=10, multiplier=2, jitter=0)
+
+
+def test_starts_without_interval(backoff):
+    assert backoff.interval == 0
+
+
+def test_first_backoff_uses_initial_interval(backoff):
+    assert backoff.backoff() == 1
+
+
+def test_backoff_grows_exponentially(backoff):
+    assert [backoff.backoff() for _ in range(4)] == [1, 2, 4, 8]
+
+
+def test_backoff_capped_at_max_interval(backoff):
+    for _ in range(10):
+        backoff.backoff()
+
+    assert backoff.interval == 10
+
+
+def test_reset(backoff):
+    backoff.backoff()
+    backoff.backoff()
+
+    backoff.reset()
+
+    assert backoff.interval == 0
+    assert backoff.backoff() == 1
+
+
+def test_jitter_shortens_wait():
+    backoff = PollBackoff(initial_interval=1, jitter=0.5)
+
+    for _ in range(20):
+        backoff.reset()
+        assert 0.5 <= backoff.backoff() <= 1
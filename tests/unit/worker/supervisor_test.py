@@ -0,0 +1,168 @@
+import logging
+import os
+import signal
+import time
+from concurrent.futures import Future
+from threading import Thread
+from unittest.mock import ANY, MagicMock, call
+
+import pytest
+
+from pyzeebe.exceptions import JobNotFound
+from pyzeebe.worker.supervisor import RELEASE_DEADLINE_MARGIN, ZeebeWorkerSupervisor, _worker_stats
+from pyzeebe.worker.worker import ZeebeWorker
+
+
+def create_worker() -> ZeebeWorker:
+    return ZeebeWorker(hostname="localhost", port=1, max_connection_retries=-1)
+
+
+def wait_for(condition, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError()
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def supervisor():
+    supervisor = ZeebeWorkerSupervisor(create_worker, processes=2, restart_delay=0.1, stats_interval=0.1,
+                                       shutdown_timeout=10)
+    supervisor_thread = Thread(target=supervisor.run)
+    supervisor_thread.start()
+    yield supervisor
+    supervisor.stop()
+    supervisor_thread.join(timeout=30)
+    assert not supervisor_thread.is_alive()
+
+
+def reporting_processes(supervisor: ZeebeWorkerSupervisor) -> int:
+    alive_pids = {process.pid for process in supervisor._children.values() if process.is_alive()}
+    return len(alive_pids.intersection(supervisor._child_stats))
+
+
+def test_starts_processes(supervisor):
+    wait_for(lambda: reporting_processes(supervisor) == 2)
+
+    assert supervisor.stats() == {"processes": 2, "restarts": 0, "activated_jobs": 0, "in_flight_jobs": 0}
+
+
+def test_restarts_dead_process(supervisor):
+    wait_for(lambda: reporting_processes(supervisor) == 2)
+    killed_process = supervisor._children[0]
+
+    os.kill(killed_process.pid, signal.SIGKILL)
+
+    wait_for(lambda: supervisor.restarts == 1 and reporting_processes(supervisor) == 2)
+    assert supervisor._children[0].pid != killed_process.pid
+
+
+def test_stop_stops_processes(supervisor):
+    wait_for(lambda: reporting_processes(supervisor) == 2)
+    processes = list(supervisor._children.values())
+
+    supervisor.stop()
+
+    wait_for(lambda: not any(process.is_alive() for process in processes))
+    assert all(process.exitcode == 0 for process in processes)
+
+
+def test_terminated_process_stops_gracefully(supervisor):
+    wait_for(lambda: reporting_processes(supervisor) == 2)
+    terminated_process = supervisor._children[1]
+
+    os.kill(terminated_process.pid, signal.SIGTERM)
+
+    wait_for(lambda: supervisor.restarts == 1)
+    assert terminated_process.exitcode == 0
+
+
+def test_processes_default_to_cpu_count():
+    assert ZeebeWorkerSupervisor(create_worker).processes == os.cpu_count()
+
+
+def deadline_in(seconds: float) -> int:
+    return int((time.time() + seconds) * 1000)
+
+
+def test_releases_jobs_of_dead_process():
+    zeebe_adapter = MagicMock()
+    supervisor = ZeebeWorkerSupervisor(create_worker, zeebe_adapter_factory=MagicMock(return_value=zeebe_adapter))
+    supervisor._child_jobs[1234] = [(1, 1, deadline_in(60)), (2, 3, deadline_in(60))]
+
+    supervisor._release_jobs(1234)
+
+    assert zeebe_adapter.fail_job_future.call_args_list == [call(job_key=1, message=ANY, retries=0),
+                                                            call(job_key=2, message=ANY, retries=2)]
+    assert 1234 not in supervisor._child_jobs
+
+
+def test_timed_out_jobs_of_dead_process_not_released():
+    zeebe_adapter = MagicMock()
+    supervisor = ZeebeWorkerSupervisor(create_worker, zeebe_adapter_factory=MagicMock(return_value=zeebe_adapter))
+    # The heartbeat is stale, the first job timed out since and may have been activated by another worker
+    supervisor._child_jobs[1234] = [(1, 1, deadline_in(-5)), (2, 3, deadline_in(60))]
+
+    supervisor._release_jobs(1234)
+
+    zeebe_adapter.fail_job_future.assert_called_once_with(job_key=2, message=ANY, retries=2)
+
+
+def test_jobs_about_to_time_out_not_released():
+    zeebe_adapter = MagicMock()
+    supervisor = ZeebeWorkerSupervisor(create_worker, zeebe_adapter_factory=MagicMock(return_value=zeebe_adapter))
+    supervisor._child_jobs[1234] = [(1, 1, deadline_in(RELEASE_DEADLINE_MARGIN / 2))]
+
+    assert supervisor._release_jobs(1234) == []
+    zeebe_adapter.fail_job_future.assert_not_called()
+
+
+def test_released_job_no_longer_active_ignored(caplog):
+    future = Future()
+    future.set_exception(JobNotFound(1))
+
+    ZeebeWorkerSupervisor._on_job_released(future, 1)
+
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+
+def test_jobs_not_released_without_zeebe_adapter_factory():
+    supervisor = ZeebeWorkerSupervisor(create_worker)
+    supervisor._child_jobs[1234] = [(1, 0, deadline_in(60))]
+
+    assert supervisor._release_jobs(1234) == []
+
+
+def test_zeebe_adapter_factory_not_allowed_with_fork():
+    with pytest.raises(ValueError):
+        ZeebeWorkerSupervisor(create_worker, start_method="fork", zeebe_adapter_factory=MagicMock())
+
+
+def test_worker_stats_report_running_jobs(zeebe_worker, job_from_task):
+    zeebe_worker._in_flight_jobs[job_from_task.key] = job_from_task
+
+    stats = _worker_stats(zeebe_worker, report_jobs=True)
+
+    assert stats["running_jobs"] == [(job_from_task.key, job_from_task.retries, job_from_task.deadline)]
+    assert "running_jobs" not in _worker_stats(zeebe_worker)
+
+
+def test_heartbeat_of_dead_process_received():
+    supervisor = ZeebeWorkerSupervisor(create_worker, processes=1, restart_delay=0.1, stats_interval=0.1,
+                                       shutdown_timeout=10, zeebe_adapter_factory=MagicMock())
+    supervisor._release_jobs = MagicMock(return_value=[])
+    supervisor_thread = Thread(target=supervisor.run)
+    supervisor_thread.start()
+    try:
+        wait_for(lambda: reporting_processes(supervisor) == 1)
+        killed_process = supervisor._children[0]
+        assert supervisor._child_jobs[killed_process.pid] == []
+
+        os.kill(killed_process.pid, signal.SIGKILL)
+
+        wait_for(lambda: supervisor.restarts == 1)
+        supervisor._release_jobs.assert_called_once_with(killed_process.pid)
+    finally:
+        supervisor.stop()
+        supervisor_thread.join(timeout=30)
@@ -0,0 +1,99 @@
+from threading import Thread
+
+import pytest
+
+from pyzeebe.worker.task_capacity import TaskCapacity
+
+
+@pytest.fixture
+def capacity():
+    return TaskCapacity(max_jobs=10)
+
+
+def test_acquire_takes_all_free_credits(capacity):
+    assert capacity.acquire() == 10
+    assert capacity.in_flight == 10
+
+
+def test_acquire_takes_only_free_credits(capacity):
+    capacity.acquire()
+    capacity.release(3)
+
+    assert capacity.acquire() == 3
+    assert capacity.in_flight == 10
+
+
+def test_acquire_takes_at_most_max_credits(capacity):
+    assert capacity.acquire(max_credits=4) == 4
+    assert capacity.in_flight == 4
+
+
+def test_acquire_times_out_when_saturated(capacity):
+    capacity.acquire()
+
+    assert capacity.acquire(timeout=0.01) == 0
+    assert capacity.in_flight == 10
+
+
+def test_acquire_blocks_until_release(capacity):
+    capacity.acquire()
+    acquired_credits = []
+    thread = Thread(target=lambda: acquired_credits.append(capacity.acquire(timeout=5)))
+    thread.start()
+
+    capacity.release()
+    thread.join()
+
+    assert acquired_credits == [1]
+
+
+def test_release(capacity):
+    capacity.acquire()
+
+    capacity.release(10)
+
+    assert capacity.in_flight == 0
+
+
+def test_release_more_than_acquired_raises(capacity):
+    with pytest.raises(ValueError):
+        capacity.release()
+
+
+def test_wait_until_free_returns_free_credits(capacity):
+    capacity.acquire(max_credits=4)
+
+    assert capacity.wait_until_free(timeout=0) == 6
+    assert capacity.in_flight == 4
+
+
+def test_wait_until_free_times_out_when_saturated(capacity):
+    capacity.acquire()
+
+    assert capacity.wait_until_free(timeout=0.01) == 0
+
+
+def test_wait_until_free_blocks_until_release(capacity):
+    capacity.acquire()
+    releaser = Thread(target=capacity.release, args=(2,))
+
+    releaser.start()
+
+    assert capacity.wait_until_free(timeout=5) == 2
+    releaser.join()
+
+
+def test_wait_until_idle(capacity):
+    capacity.acquire()
+    releaser = Thread(target=capacity.release, args=(10,))
+
+    releaser.start()
+
+    assert capacity.wait_until_idle(timeout=5)
+    releaser.join()
+
+
+def test_wait_until_idle_times_out(capacity):
+    capacity.acquire()
+
+    assert not capacity.wait_until_idle(timeout=0.01)
@@ -1,3 +1,4 @@
+import pickle
 from unittest.mock import patch, MagicMock
 from uuid import uuid4
 
@@ -57,6 +58,14 @@ def test_remove_fake_task(task_handler):
         task_handler.remove_task(str(uuid4()))
 
 
+def test_replace_task(task_handler, task):
+    task_handler.tasks.append(task)
+    new_task = Task(task.type, lambda x: x, lambda x: x)
+
+    assert task_handler.replace_task(new_task) == task
+    assert task_handler.get_task(task.type) == new_task
+
+
 def test_add_dict_task(task_handler):
     task_handler._dict_task = MagicMock()
 
@@ -96,6 +105,28 @@ def test_fn_to_dict(task_handler):
     assert dict_fn(variable) == {variable_name: variable + 1}
 
 
+def module_level_fn(x):
+    return x + 1
+
+
+def test_fn_to_dict_is_picklable(task_handler):
+    dict_fn = task_handler._single_value_function_to_dict(fn=module_level_fn, variable_name="y")
+
+    assert pickle.loads(pickle.dumps(dict_fn))(1) == {"y": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_fn_to_dict(task_handler):
+    variable_name = str(uuid4())
+
+    async def no_dict_fn(x):
+        return x + 1
+
+    dict_fn = task_handler._single_value_function_to_dict(fn=no_dict_fn, variable_name=variable_name)
+
+    assert await dict_fn(1) == {variable_name: 2}
+
+
 def test_default_exception_handler(job_without_adapter):
     with patch("pyzeebe.worker.task_handler.logger.warning") as logging_mock:
         with patch("pyzeebe.job.job.Job.set_failure_status") as failure_mock:
@@ -0,0 +1,65 @@
+import time
+from threading import Thread
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from pyzeebe.task.task import Task
+from pyzeebe.worker.task_poll_queue import TaskPollQueue
+
+
+@pytest.fixture
+def poll_queue():
+    return TaskPollQueue()
+
+
+def create_task() -> Task:
+    return Task(str(uuid4()), MagicMock(), MagicMock())
+
+
+def test_get_returns_put_task(poll_queue, task):
+    poll_queue.put(task)
+
+    assert poll_queue.get(timeout=0) == task
+    assert len(poll_queue) == 0
+
+
+def test_get_empty_queue_times_out(poll_queue):
+    assert poll_queue.get(timeout=0.01) is None
+
+
+def test_tasks_due_at_once_returned_in_order(poll_queue):
+    tasks = [create_task() for _ in range(5)]
+    for task in tasks:
+        poll_queue.put(task)
+
+    assert [poll_queue.get(timeout=0) for _ in tasks] == tasks
+
+
+def test_delayed_task_not_returned_before_due(poll_queue, task):
+    poll_queue.put(task, delay=10)
+
+    assert poll_queue.get(timeout=0.01) is None
+
+
+def test_delayed_task_returned_when_due(poll_queue, task):
+    poll_queue.put(task, delay=0.05)
+
+    start = time.monotonic()
+    assert poll_queue.get(timeout=1) == task
+    assert time.monotonic() - start >= 0.04
+
+
+def test_due_task_returned_before_delayed(poll_queue):
+    delayed_task, due_task = create_task(), create_task()
+    poll_queue.put(delayed_task, delay=10)
+    poll_queue.put(due_task)
+
+    assert poll_queue.get(timeout=0) == due_task
+
+
+def test_get_wakes_up_on_put(poll_queue, task):
+    Thread(target=lambda: (time.sleep(0.05), poll_queue.put(task))).start()
+
+    assert poll_queue.get(timeout=5) == task
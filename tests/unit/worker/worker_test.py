@@ -1,13 +1,26 @@
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
 from random import randint
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 from uuid import uuid4
 import time
+from concurrent.futures import Future
+from threading import Barrier, Event, Thread, Timer
 
 import pytest
 
-from pyzeebe.exceptions import DuplicateTaskType, MaxConsecutiveTaskThreadError
+from pyzeebe.exceptions import (DuplicateTaskType, MaxConsecutiveTaskThreadError, ProcessPoolNotSupported,
+                                ZeebeBackPressure)
 from pyzeebe.job.job import Job
+from pyzeebe.job.job_context import get_current_job
+from pyzeebe.metrics.metrics import Metrics, PrometheusMetrics
+from pyzeebe.task.task import Task
+from pyzeebe.tracing.tracing import Tracing
+from pyzeebe.worker.job_executor import ThreadPoolJobExecutor
+from pyzeebe.worker.task_capacity import TaskCapacity
 from pyzeebe.worker.worker import ZeebeWorker
+from tests.unit.utils.random_utils import random_job
 
 
 class TestAddTask:
@@ -84,6 +97,112 @@ class TestAddTask:
 
         task.exception_handler.assert_called()
 
+    def test_replaced_task_gets_handler(self, zeebe_worker, task):
+        zeebe_worker._add_task(task)
+        new_task = Task(task.type, MagicMock(), MagicMock())
+
+        zeebe_worker.replace_task(new_task)
+
+        assert callable(new_task.handler)
+        assert zeebe_worker.get_task(task.type) is new_task
+
+    def test_task_handler_logs_finished_job(self, zeebe_worker, task, job_from_task):
+        zeebe_worker._job_logger = MagicMock()
+        zeebe_worker._add_task(task)
+
+        with patch("pyzeebe.grpc_internals.zeebe_adapter.ZeebeAdapter.complete_job"):
+            task.handler(job_from_task)
+
+        zeebe_worker._job_logger.finished.assert_called_once_with(job_from_task, ANY, True)
+
+
+def get_pid():
+    return {"pid": os.getpid()}
+
+
+def add_one(x):
+    return x + 1
+
+
+def crash():
+    os._exit(1)
+
+
+class TestProcessPool:
+    @pytest.fixture(autouse=True)
+    def complete_job_mock(self, zeebe_worker):
+        zeebe_worker._complete_job = MagicMock()
+        yield zeebe_worker._complete_job
+        zeebe_worker._shutdown_process_pool()
+
+    def test_task_function_runs_in_other_process(self, zeebe_worker, task_type, complete_job_mock):
+        zeebe_worker.task(task_type, run_in_process_pool=True)(get_pid)
+        task = zeebe_worker.get_task(task_type)
+
+        job = task.handler(random_job(task))
+
+        complete_job_mock.assert_called_with(job)
+        assert job.variables["pid"] != os.getpid()
+
+    def test_process_pool_task_without_process_pool_support(self, zeebe_worker, task_type):
+        with patch("pyzeebe.worker.zeebe_worker_base.PROCESS_POOL_SUPPORTED", False):
+            with pytest.raises(ProcessPoolNotSupported):
+                zeebe_worker.task(task_type, run_in_process_pool=True)(get_pid)
+
+        assert len(zeebe_worker.tasks) == 0
+
+    def test_process_pool_task_replaced_without_process_pool_support(self, zeebe_worker, task):
+        zeebe_worker._add_task(task)
+        new_task = Task(task.type, task.inner_function, task.exception_handler, run_in_process_pool=True)
+
+        with patch("pyzeebe.worker.zeebe_worker_base.PROCESS_POOL_SUPPORTED", False):
+            with pytest.raises(ProcessPoolNotSupported):
+                zeebe_worker.replace_task(new_task)
+
+        assert zeebe_worker.get_task(task.type) is task
+
+    @pytest.mark.skipif(sys.version_info >= (3, 7), reason="process pools are supported since python 3.7")
+    def test_process_pool_task_on_python_36(self, zeebe_worker, task_type):
+        with pytest.raises(ProcessPoolNotSupported):
+            zeebe_worker.task(task_type, run_in_process_pool=True)(get_pid)
+
+    def test_single_value_task_in_process_pool(self, zeebe_worker, task_type, complete_job_mock):
+        zeebe_worker.task(task_type, single_value=True, variable_name="y", run_in_process_pool=True)(add_one)
+        task = zeebe_worker.get_task(task_type)
+        job = random_job(task)
+        job.variables = {"x": 1}
+
+        task.handler(job)
+
+        assert job.variables == {"y": 2}
+
+    def test_process_crash_reported_to_exception_handler(self, zeebe_worker, task_type, complete_job_mock):
+        exception_handler = MagicMock()
+        zeebe_worker.task(task_type, exception_handler=exception_handler, run_in_process_pool=True)(crash)
+        task = zeebe_worker.get_task(task_type)
+
+        task.handler(random_job(task))
+
+        assert isinstance(exception_handler.call_args[0][0], BrokenProcessPool)
+        complete_job_mock.assert_not_called()
+
+    def test_process_pool_replaced_after_crash(self, zeebe_worker, task_type):
+        zeebe_worker.task(task_type, exception_handler=MagicMock(), run_in_process_pool=True)(crash)
+        task = zeebe_worker.get_task(task_type)
+        task.handler(random_job(task))
+
+        assert zeebe_worker._process_pool is None
+
+    def test_stop_shuts_down_process_pool(self, zeebe_worker):
+        process_pool = zeebe_worker._get_process_pool()
+        zeebe_worker.work()
+
+        zeebe_worker.stop(wait=True)
+
+        assert zeebe_worker._process_pool is None
+        with pytest.raises(RuntimeError):
+            process_pool.submit(get_pid)
+
 
 class TestDecorator:
     def test_add_before_decorator(self, zeebe_worker, decorator):
@@ -153,6 +272,7 @@ class TestHandleJobs:
         get_jobs_mock.return_value = []
 
         zeebe_worker._handle_jobs(task)
+        zeebe_worker.job_executor.shutdown(wait=True)
 
         task.handler.assert_not_called()
 
@@ -160,6 +280,7 @@ class TestHandleJobs:
         get_jobs_mock.return_value = [job_from_task]
 
         zeebe_worker._handle_jobs(task)
+        zeebe_worker.job_executor.shutdown(wait=True)
 
         task.handler.assert_called_with(job_from_task)
 
@@ -167,9 +288,747 @@ class TestHandleJobs:
         get_jobs_mock.return_value = [job_from_task] * 10
 
         zeebe_worker._handle_jobs(task)
+        zeebe_worker.job_executor.shutdown(wait=True)
 
         assert task.handler.call_count == 10
 
+    def test_jobs_submitted_to_job_executor(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        get_jobs_mock.return_value = [job_from_task]
+
+        zeebe_worker._handle_jobs(task)
+
+        zeebe_worker.job_executor.submit.assert_called_with(task, job_from_task)
+
+    def test_only_free_capacity_activated(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        get_jobs_mock.return_value = [job_from_task]
+        zeebe_worker._handle_jobs(task)
+
+        zeebe_worker._handle_jobs(task)
+
+        get_jobs_mock.assert_called_with(task, max_jobs_to_activate=task.max_jobs_to_activate - 1,
+                                         request_timeout=None)
+
+    def test_activated_jobs_limited_by_worker_capacity(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker._job_capacity = TaskCapacity(max_jobs=5)
+        get_jobs_mock.return_value = [job_from_task] * 3
+        other_task = Task(str(uuid4()), MagicMock(), MagicMock())
+        zeebe_worker._handle_jobs(other_task)
+        get_jobs_mock.return_value = [job_from_task] * 2
+
+        zeebe_worker._handle_jobs(task)
+
+        get_jobs_mock.assert_called_with(task, max_jobs_to_activate=2, request_timeout=None)
+        assert zeebe_worker._get_task_capacity(task).in_flight == 2
+
+    def test_saturated_worker_capacity_skips_activation(self, zeebe_worker, task, get_jobs_mock):
+        zeebe_worker._job_capacity.acquire()
+
+        assert zeebe_worker._handle_jobs(task, capacity_timeout=0) is None
+
+        get_jobs_mock.assert_not_called()
+        assert zeebe_worker._get_task_capacity(task).in_flight == 0
+
+    def test_long_polling_tasks_dont_reserve_worker_capacity(self, zeebe_worker, task, job_from_task,
+                                                             get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker._job_capacity = TaskCapacity(max_jobs=100)
+        idle_tasks = [Task(str(uuid4()), MagicMock(), MagicMock(), max_jobs_to_activate=32) for _ in range(4)]
+        all_polling = Barrier(len(idle_tasks) + 1)
+        long_poll_done = Event()
+
+        def get_jobs(polled_task, **kwargs):
+            if polled_task is task:
+                return [job_from_task] * 5
+            all_polling.wait(timeout=5)
+            long_poll_done.wait(timeout=5)
+            return []
+
+        get_jobs_mock.side_effect = get_jobs
+        idle_threads = [Thread(target=zeebe_worker._handle_jobs, args=(idle_task,)) for idle_task in idle_tasks]
+        for thread in idle_threads:
+            thread.start()
+        all_polling.wait(timeout=5)
+
+        try:
+            assert zeebe_worker._handle_jobs(task, capacity_timeout=0) == 5
+            get_jobs_mock.assert_called_with(task, max_jobs_to_activate=task.max_jobs_to_activate,
+                                             request_timeout=None)
+            assert zeebe_worker._job_capacity.in_flight == 5
+        finally:
+            long_poll_done.set()
+            for thread in idle_threads:
+                thread.join()
+
+    def test_job_waits_for_worker_capacity_taken_during_poll(self, zeebe_worker, task, job_from_task,
+                                                             get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker._job_capacity = TaskCapacity(max_jobs=1)
+
+        def get_jobs(polled_task, **kwargs):
+            # Another task's job takes the only slot while this task is polling
+            zeebe_worker._job_capacity.acquire()
+            Timer(0.05, zeebe_worker._job_capacity.release).start()
+            return [job_from_task]
+
+        get_jobs_mock.side_effect = get_jobs
+
+        assert zeebe_worker._handle_jobs(task) == 1
+
+        zeebe_worker.job_executor.submit.assert_called_once_with(task, job_from_task)
+        assert zeebe_worker._job_capacity.in_flight == 1
+
+    def test_worker_capacity_sized_by_job_executor(self):
+        assert ZeebeWorker(max_concurrent_jobs=7)._job_capacity.max_jobs == 7
+        assert ZeebeWorker(job_executor=ThreadPoolJobExecutor(max_workers=3))._job_capacity.max_jobs == 3
+
+    def test_returns_activated_jobs(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        get_jobs_mock.return_value = [job_from_task] * 3
+
+        assert zeebe_worker._handle_jobs(task) == 3
+
+    def test_in_flight_jobs_tracked(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        get_jobs_mock.return_value = [job_from_task] * 3
+
+        zeebe_worker._handle_jobs(task)
+
+        assert zeebe_worker.get_in_flight_jobs(task.type) == 3
+
+    def test_activated_jobs_counted(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        get_jobs_mock.return_value = [job_from_task] * 3
+
+        zeebe_worker._handle_jobs(task)
+        zeebe_worker._handle_jobs(task)
+
+        assert zeebe_worker.get_activated_jobs(task.type) == 6
+
+    def test_capacity_released_when_job_done(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        get_jobs_mock.return_value = [job_from_task] * 3
+
+        zeebe_worker._handle_jobs(task)
+        zeebe_worker.job_executor.shutdown(wait=True)
+
+        assert zeebe_worker.get_in_flight_jobs(task.type) == 0
+
+    def test_no_activation_when_saturated(self, zeebe_worker, task, job_from_task, get_jobs_mock):
+        zeebe_worker.job_executor = MagicMock()
+        task.max_jobs_to_activate = 1
+        get_jobs_mock.return_value = [job_from_task]
+        zeebe_worker._handle_jobs(task)
+        zeebe_worker._get_task_capacity(task).acquire = MagicMock(return_value=0)
+
+        zeebe_worker._handle_jobs(task)
+
+        assert get_jobs_mock.call_count == 1
+
+    def test_capacity_released_when_activation_fails(self, zeebe_worker, task, get_jobs_mock):
+        get_jobs_mock.side_effect = ZeebeBackPressure()
+
+        with pytest.raises(ZeebeBackPressure):
+            zeebe_worker._handle_jobs(task)
+
+        assert zeebe_worker.get_in_flight_jobs(task.type) == 0
+
+
+class TestJobStatusPipeline:
+    @pytest.fixture
+    def pipelined_zeebe_worker(self, zeebe_worker):
+        zeebe_worker.status_sender_threads = 1
+        zeebe_worker.work()
+        yield zeebe_worker
+        zeebe_worker.stop(wait=True)
+
+    def test_pipeline_started_by_work(self, pipelined_zeebe_worker):
+        assert pipelined_zeebe_worker.job_status_pipeline is not None
+
+    def test_no_pipeline_by_default(self, zeebe_worker):
+        zeebe_worker.work()
+        zeebe_worker.stop(wait=True)
+
+        assert zeebe_worker.job_status_pipeline is None
+
+    def test_job_completed_through_pipeline(self, pipelined_zeebe_worker, task, job_from_task):
+        pipelined_zeebe_worker.job_status_pipeline.complete_job = MagicMock()
+        pipelined_zeebe_worker._add_task(task)
+
+        task.handler(job_from_task)
+
+        pipelined_zeebe_worker.job_status_pipeline.complete_job.assert_called_with(job_key=job_from_task.key,
+                                                                                   variables=job_from_task.variables)
+
+    def test_job_failed_through_pipeline(self, pipelined_zeebe_worker, task, job_from_task):
+        pipelined_zeebe_worker.job_status_pipeline.fail_job = MagicMock()
+        task.inner_function.side_effect = Exception()
+        task.exception_handler = lambda e, job: job.set_failure_status("failed")
+        pipelined_zeebe_worker._add_task(task)
+
+        task.handler(job_from_task)
+
+        pipelined_zeebe_worker.job_status_pipeline.fail_job.assert_called_with(job_key=job_from_task.key,
+                                                                               message="failed")
+
+    def test_stop_flushes_pipeline(self, zeebe_worker):
+        zeebe_worker.status_sender_threads = 1
+        zeebe_worker.work()
+        pipeline = zeebe_worker.job_status_pipeline
+        pipeline.stop = MagicMock(wraps=pipeline.stop)
+
+        zeebe_worker.stop(wait=True)
+
+        pipeline.stop.assert_called_with(wait=True)
+
+
+class TestPollBackoff:
+    @pytest.fixture(autouse=True)
+    def handle_jobs_mock(self, zeebe_worker):
+        zeebe_worker._handle_jobs = MagicMock()
+        return zeebe_worker._handle_jobs
+
+    def test_backs_off_when_no_jobs(self, zeebe_worker, task, handle_jobs_mock):
+        handle_jobs_mock.return_value = 0
+
+        delays = [zeebe_worker._poll_task_once(task) for _ in range(3)]
+
+        assert 0 < delays[0] < delays[2]
+        assert zeebe_worker.get_poll_interval(task.type) == zeebe_worker.idle_poll_interval * 4
+
+    def test_backs_off_on_back_pressure(self, zeebe_worker, task, handle_jobs_mock):
+        handle_jobs_mock.side_effect = ZeebeBackPressure()
+
+        assert zeebe_worker._poll_task_once(task) > 0
+        assert zeebe_worker.get_poll_interval(task.type) == zeebe_worker.idle_poll_interval
+
+    def test_reset_when_jobs_activated(self, zeebe_worker, task, handle_jobs_mock):
+        handle_jobs_mock.return_value = 0
+        zeebe_worker._poll_task_once(task)
+        handle_jobs_mock.return_value = 1
+
+        assert zeebe_worker._poll_task_once(task) == 0
+        assert zeebe_worker.get_poll_interval(task.type) == 0
+
+    def test_interval_capped(self, zeebe_worker, task, handle_jobs_mock):
+        handle_jobs_mock.return_value = 0
+
+        for _ in range(20):
+            zeebe_worker._poll_task_once(task)
+
+        assert zeebe_worker.get_poll_interval(task.type) == zeebe_worker.max_poll_interval
+
+    def test_no_backoff_when_saturated(self, zeebe_worker, task, handle_jobs_mock):
+        handle_jobs_mock.return_value = None
+
+        assert zeebe_worker._poll_task_once(task) is None
+        assert zeebe_worker.get_poll_interval(task.type) == 0
+
+    def test_unknown_task_has_no_interval(self, zeebe_worker):
+        assert zeebe_worker.get_poll_interval(str(uuid4())) == 0
+
+    def test_handle_task_waits_for_backoff(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker.idle_poll_interval = 10
+        zeebe_worker._add_task(task)
+
+        def handle_jobs(task, **kwargs):
+            Thread(target=lambda: (time.sleep(0.1), zeebe_worker.stop())).start()
+            return 0
+
+        handle_jobs_mock.side_effect = handle_jobs
+
+        start = time.monotonic()
+        zeebe_worker._handle_task(task)
+
+        assert handle_jobs_mock.call_count == 1
+        assert time.monotonic() - start < 5
+
+
+class TestPollerThreads:
+    @pytest.fixture
+    def shared_zeebe_worker(self, zeebe_worker):
+        zeebe_worker.poller_threads = 2
+        zeebe_worker.idle_poll_interval = 0.01
+        return zeebe_worker
+
+    @pytest.fixture
+    def handle_jobs_mock(self, shared_zeebe_worker):
+        shared_zeebe_worker._handle_jobs = MagicMock(return_value=0)
+        return shared_zeebe_worker._handle_jobs
+
+    @staticmethod
+    def stop_after_calls(zeebe_worker, handle_jobs_mock, calls: int):
+        def handle_jobs(task, **kwargs):
+            if handle_jobs_mock.call_count >= calls:
+                zeebe_worker.stop()
+            return 0
+
+        handle_jobs_mock.side_effect = handle_jobs
+
+    def test_poller_threads_started_instead_of_task_threads(self, shared_zeebe_worker, handle_jobs_mock):
+        for _ in range(5):
+            shared_zeebe_worker._add_task(Task(str(uuid4()), MagicMock(), MagicMock()))
+
+        shared_zeebe_worker.work()
+
+        assert len(shared_zeebe_worker._poller_threads) == 2
+        assert shared_zeebe_worker._task_threads == {}
+        shared_zeebe_worker.stop(wait=True)
+
+    def test_all_tasks_polled(self, shared_zeebe_worker, handle_jobs_mock):
+        tasks = [Task(str(uuid4()), MagicMock(), MagicMock()) for _ in range(5)]
+        for task in tasks:
+            shared_zeebe_worker._add_task(task)
+        self.stop_after_calls(shared_zeebe_worker, handle_jobs_mock, 20)
+
+        shared_zeebe_worker.work()
+        shared_zeebe_worker._join_task_threads()
+
+        polled_tasks = {call[0][0] for call in handle_jobs_mock.call_args_list}
+        assert polled_tasks == set(tasks)
+
+    def test_busy_task_does_not_starve_others(self, shared_zeebe_worker, handle_jobs_mock):
+        shared_zeebe_worker.poller_threads = 1
+        busy_task, rare_task = Task("busy", MagicMock(), MagicMock()), Task("rare", MagicMock(), MagicMock())
+        shared_zeebe_worker._add_task(busy_task)
+        shared_zeebe_worker._add_task(rare_task)
+        shared_zeebe_worker.idle_poll_interval = 0
+
+        def handle_jobs(task, **kwargs):
+            if handle_jobs_mock.call_count >= 10:
+                shared_zeebe_worker.stop()
+            return 32 if task is busy_task else 0
+
+        handle_jobs_mock.side_effect = handle_jobs
+
+        shared_zeebe_worker.work()
+        shared_zeebe_worker._join_task_threads()
+
+        polled_tasks = [call[0][0] for call in handle_jobs_mock.call_args_list]
+        assert polled_tasks.count(rare_task) == 5
+
+    def test_poller_survives_task_error(self, shared_zeebe_worker, handle_jobs_mock, task):
+        shared_zeebe_worker.poller_threads = 1
+        shared_zeebe_worker._add_task(task)
+
+        def handle_jobs(task, **kwargs):
+            if handle_jobs_mock.call_count >= 3:
+                shared_zeebe_worker.stop()
+            raise ZeebeBackPressure()
+
+        handle_jobs_mock.side_effect = handle_jobs
+
+        shared_zeebe_worker.work()
+        shared_zeebe_worker._join_task_threads()
+
+        assert handle_jobs_mock.call_count == 3
+
+    def test_pollers_do_not_long_poll(self, shared_zeebe_worker, handle_jobs_mock, task):
+        shared_zeebe_worker._add_task(task)
+        self.stop_after_calls(shared_zeebe_worker, handle_jobs_mock, 1)
+
+        shared_zeebe_worker.work()
+        shared_zeebe_worker._join_task_threads()
+
+        handle_jobs_mock.assert_called_with(task, capacity_timeout=0, request_timeout=-1)
+
+
+class TestHotTasks:
+    @pytest.fixture
+    def handle_jobs_mock(self, zeebe_worker):
+        zeebe_worker.idle_poll_interval = 0.01
+        zeebe_worker.max_poll_interval = 0.01
+        zeebe_worker._handle_jobs = MagicMock(return_value=0)
+        return zeebe_worker._handle_jobs
+
+    @staticmethod
+    def wait_for_poll(handle_jobs_mock, task: Task, timeout: float = 5) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if any(call[0][0] is task for call in handle_jobs_mock.call_args_list):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_task_added_to_running_worker_is_polled(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker.work()
+
+        zeebe_worker._add_task(task)
+
+        assert self.wait_for_poll(handle_jobs_mock, task)
+        assert zeebe_worker._task_threads[task.type].is_alive()
+        zeebe_worker.stop(wait=True)
+
+    def test_task_added_to_running_shared_pollers_is_polled(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker.poller_threads = 1
+        zeebe_worker.work()
+
+        zeebe_worker._add_task(task)
+
+        assert self.wait_for_poll(handle_jobs_mock, task)
+        zeebe_worker.stop(wait=True)
+
+    def test_removed_task_stops_polling(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker._add_task(task)
+        zeebe_worker.work()
+        task_thread = zeebe_worker._task_threads[task.type]
+
+        zeebe_worker.remove_task(task.type, wait=True, timeout=5)
+
+        assert not task_thread.is_alive()
+        assert task.type not in zeebe_worker._task_threads
+        zeebe_worker.stop(wait=True)
+
+    def test_remove_task_waits_for_running_jobs(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker._add_task(task)
+        capacity = zeebe_worker._get_task_capacity(task)
+        capacity.acquire()
+        zeebe_worker.work()
+
+        assert zeebe_worker.get_task(task.type)
+        zeebe_worker.remove_task(task.type, wait=True, timeout=0.1)
+        assert capacity.in_flight == task.max_jobs_to_activate
+
+        capacity.release(task.max_jobs_to_activate)
+        zeebe_worker.stop(wait=True)
+
+    def test_removed_task_dropped_by_shared_pollers(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker.poller_threads = 1
+        zeebe_worker._add_task(task)
+        zeebe_worker.work()
+        assert self.wait_for_poll(handle_jobs_mock, task)
+
+        zeebe_worker.remove_task(task.type)
+        time.sleep(0.1)
+        calls = handle_jobs_mock.call_count
+        time.sleep(0.1)
+
+        assert handle_jobs_mock.call_count == calls
+        zeebe_worker.stop(wait=True)
+
+    def test_replaced_task_polled_instead_of_old_task(self, zeebe_worker, task, handle_jobs_mock):
+        zeebe_worker._add_task(task)
+        zeebe_worker.work()
+        new_task = Task(task.type, MagicMock(), MagicMock())
+
+        zeebe_worker.replace_task(new_task)
+
+        assert self.wait_for_poll(handle_jobs_mock, new_task)
+        assert zeebe_worker._task_threads[task.type].is_alive()
+        zeebe_worker.stop(wait=True)
+
+    def test_replaced_task_max_jobs_to_activate_used(self, zeebe_worker, task, job_from_task):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker._get_jobs = MagicMock(return_value=[])
+        task.max_jobs_to_activate = 2
+        zeebe_worker._add_task(task)
+        zeebe_worker._handle_jobs(task)
+        new_task = Task(task.type, MagicMock(), MagicMock(), max_jobs_to_activate=50)
+
+        zeebe_worker.replace_task(new_task)
+        zeebe_worker._handle_jobs(new_task)
+
+        zeebe_worker._get_jobs.assert_called_with(new_task, max_jobs_to_activate=50, request_timeout=None)
+
+    def test_replaced_task_waits_for_jobs_of_old_task(self, zeebe_worker, task):
+        zeebe_worker._get_jobs = MagicMock(return_value=[])
+        zeebe_worker._add_task(task)
+        capacity = zeebe_worker._get_task_capacity(task)
+        capacity.release(capacity.acquire() - 1)
+        new_task = Task(task.type, MagicMock(), MagicMock())
+        zeebe_worker.replace_task(new_task)
+
+        assert zeebe_worker._handle_jobs(new_task, capacity_timeout=0) is None
+        assert zeebe_worker.get_in_flight_jobs(task.type) == 1
+        capacity.release()
+        assert zeebe_worker._handle_jobs(new_task, capacity_timeout=0) == 0
+
+    def test_replaced_task_poll_backoff_reset(self, zeebe_worker, task):
+        zeebe_worker._handle_jobs = MagicMock(return_value=0)
+        zeebe_worker._add_task(task)
+        zeebe_worker._poll_task_once(task)
+
+        zeebe_worker.replace_task(Task(task.type, MagicMock(), MagicMock()))
+
+        assert zeebe_worker.get_poll_interval(task.type) == 0
+
+    def test_watcher_does_not_restart_removed_task(self, zeebe_worker, task, handle_task_mock):
+        zeebe_worker._add_task(task)
+        zeebe_worker.work()
+        zeebe_worker.remove_task(task.type)
+        zeebe_worker._task_threads[task.type] = MagicMock(is_alive=MagicMock(return_value=False))
+
+        zeebe_worker._restart_task_thread(task.type)
+
+        assert not zeebe_worker._task_threads[task.type].start.called
+        zeebe_worker.stop(wait=True)
+
+
+class TestDrain:
+    @pytest.fixture(autouse=True)
+    def fail_job_future_mock(self, zeebe_worker):
+        future = Future()
+        future.set_result(None)
+        zeebe_worker.zeebe_adapter.fail_job_future = MagicMock(return_value=future)
+        return zeebe_worker.zeebe_adapter.fail_job_future
+
+    @staticmethod
+    def acquire_credit(zeebe_worker, task) -> TaskCapacity:
+        capacity = zeebe_worker._get_task_capacity(task)
+        capacity.acquire(max_credits=1)
+        zeebe_worker._job_capacity.acquire(max_credits=1)
+        return capacity
+
+    @pytest.fixture
+    def release_event(self, task):
+        release_event = Event()
+        task.inner_function = MagicMock(side_effect=lambda **variables: release_event.wait(5) and variables)
+        return release_event
+
+    @pytest.fixture
+    def running_job(self, zeebe_worker, task, job_from_task, release_event):
+        zeebe_worker._add_task(task)
+        zeebe_worker._complete_job = MagicMock()
+        capacity = self.acquire_credit(zeebe_worker, task)
+        zeebe_worker._submit_job(task, job_from_task, capacity)
+        return job_from_task
+
+    def test_waits_for_running_jobs(self, zeebe_worker, running_job, release_event, fail_job_future_mock):
+        Timer(0.1, release_event.set).start()
+
+        assert zeebe_worker.drain(timeout=5)
+
+        zeebe_worker._complete_job.assert_called_once()
+        fail_job_future_mock.assert_not_called()
+
+    def test_fails_unfinished_jobs(self, zeebe_worker, running_job, release_event, fail_job_future_mock):
+        assert not zeebe_worker.drain(timeout=0.1)
+
+        fail_job_future_mock.assert_called_once_with(job_key=running_job.key, message=ANY,
+                                                     retries=max(running_job.retries, 1), timeout=5)
+        release_event.set()
+
+    def test_unfinished_job_not_completed(self, zeebe_worker, task, running_job, release_event):
+        zeebe_worker.drain(timeout=0.1)
+        release_event.set()
+        zeebe_worker.job_executor.shutdown(wait=True)
+
+        zeebe_worker._complete_job.assert_not_called()
+        task.exception_handler.assert_not_called()
+
+    def test_failed_jobs_keep_a_retry(self, zeebe_worker, running_job, release_event, fail_job_future_mock):
+        running_job.retries = 0
+
+        zeebe_worker.drain(timeout=0.1)
+        release_event.set()
+
+        assert fail_job_future_mock.call_args[1]["retries"] == 1
+
+    def test_job_activated_after_deadline_failed(self, zeebe_worker, task, job_from_task, fail_job_future_mock):
+        zeebe_worker._abandon_jobs = True
+        zeebe_worker.job_executor = MagicMock()
+        capacity = self.acquire_credit(zeebe_worker, task)
+
+        zeebe_worker._submit_job(task, job_from_task, capacity)
+
+        zeebe_worker.job_executor.submit.assert_not_called()
+        fail_job_future_mock.assert_called_once()
+        assert capacity.in_flight == 0
+        assert zeebe_worker._job_capacity.in_flight == 0
+
+    def test_job_activated_during_drain_released(self, zeebe_worker, task, job_from_task, fail_job_future_mock):
+        zeebe_worker.job_executor = MagicMock()
+        capacity = self.acquire_credit(zeebe_worker, task)
+
+        assert zeebe_worker.drain(timeout=5)
+        zeebe_worker._submit_job(task, job_from_task, capacity)
+
+        zeebe_worker.job_executor.submit.assert_not_called()
+        fail_job_future_mock.assert_called_once()
+        assert capacity.in_flight == 0
+        assert zeebe_worker._job_capacity.in_flight == 0
+
+    def test_job_rejected_by_executor_released(self, zeebe_worker, task, job_from_task, fail_job_future_mock):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker.job_executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        capacity = self.acquire_credit(zeebe_worker, task)
+
+        zeebe_worker._submit_job(task, job_from_task, capacity)
+
+        fail_job_future_mock.assert_called_once()
+        assert capacity.in_flight == 0
+        assert zeebe_worker._job_capacity.in_flight == 0
+        assert zeebe_worker.get_running_jobs() == []
+
+    def test_running_jobs_listed(self, zeebe_worker, running_job, release_event):
+        assert zeebe_worker.get_running_jobs() == [running_job]
+
+        release_event.set()
+        zeebe_worker.drain(timeout=5)
+
+        assert zeebe_worker.get_running_jobs() == []
+
+
+class TestJobDeadlines:
+    @pytest.fixture(autouse=True)
+    def enforce_job_deadlines(self, zeebe_worker, task):
+        zeebe_worker.enforce_job_deadlines = True
+        zeebe_worker._complete_job = MagicMock()
+        zeebe_worker._add_task(task)
+        yield
+        zeebe_worker._scheduler.stop()
+
+    def test_expired_job_skipped(self, zeebe_worker, task, job_from_task):
+        job_from_task.deadline = int((time.time() - 1) * 1000)
+
+        task.handler(job_from_task)
+
+        task.inner_function.assert_not_called()
+        zeebe_worker._complete_job.assert_not_called()
+        assert zeebe_worker.get_deadline_stats(task.type)["skipped_jobs"] == 1
+
+    def test_expired_job_run_if_deadlines_not_enforced(self, zeebe_worker, task, job_from_task):
+        zeebe_worker.enforce_job_deadlines = False
+        job_from_task.deadline = int((time.time() - 1) * 1000)
+
+        task.handler(job_from_task)
+
+        zeebe_worker._complete_job.assert_called_once()
+
+    def test_job_within_deadline_completed(self, zeebe_worker, task, job_from_task):
+        job_from_task.deadline = int((time.time() + 60) * 1000)
+
+        task.handler(job_from_task)
+
+        zeebe_worker._complete_job.assert_called_once()
+        assert all(call.cancelled for _, _, call in zeebe_worker._scheduler._calls)
+
+    def test_overrunning_job_cancelled(self, zeebe_worker, task, job_from_task):
+        job_from_task.deadline = int((time.time() + 0.05) * 1000)
+
+        def wait_for_cancel(**variables):
+            deadline = time.monotonic() + 5
+            while not get_current_job().cancelled and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return variables
+
+        task.inner_function.side_effect = wait_for_cancel
+
+        task.handler(job_from_task)
+
+        assert job_from_task.cancelled
+        zeebe_worker._complete_job.assert_not_called()
+        stats = zeebe_worker.get_deadline_stats(task.type)
+        assert stats["overrun_jobs"] == 1
+        assert stats["wasted_seconds"] > 0
+
+    def test_exception_handler_not_called_for_cancelled_job(self, zeebe_worker, task, job_from_task):
+        job_from_task.deadline = int((time.time() + 60) * 1000)
+        task.inner_function.side_effect = lambda **_: job_from_task.cancel() or 1 / 0
+
+        task.handler(job_from_task)
+
+        task.exception_handler.assert_not_called()
+
+    def test_no_stats_without_expired_jobs(self, zeebe_worker, task):
+        assert zeebe_worker.get_deadline_stats(task.type) == {"skipped_jobs": 0, "overrun_jobs": 0,
+                                                              "wasted_seconds": 0.0}
+
+
+class TestMetrics:
+    @pytest.fixture(autouse=True)
+    def metrics(self, zeebe_worker, task):
+        zeebe_worker.metrics = MagicMock(spec=Metrics)
+        zeebe_worker._complete_job = MagicMock()
+        zeebe_worker._add_task(task)
+        return zeebe_worker.metrics
+
+    def test_completed_job_measured(self, zeebe_worker, task, job_from_task, metrics):
+        task.handler(job_from_task)
+
+        metrics.job_started.assert_called_once_with(task.type)
+        metrics.job_finished.assert_called_once_with(task.type, "completed", ANY)
+
+    def test_failed_job_measured(self, zeebe_worker, task, job_from_task, metrics):
+        task.inner_function.side_effect = Exception()
+        task.exception_handler.side_effect = lambda e, job: job.set_failure_status("failed")
+        job_from_task.zeebe_adapter = MagicMock()
+
+        task.handler(job_from_task)
+
+        metrics.job_finished.assert_called_once_with(task.type, "failed", ANY)
+
+    def test_errored_job_measured(self, zeebe_worker, task, job_from_task, metrics):
+        task.inner_function.side_effect = Exception()
+        task.exception_handler.side_effect = lambda e, job: job.set_error_status("error")
+        job_from_task.zeebe_adapter = MagicMock()
+
+        task.handler(job_from_task)
+
+        metrics.job_finished.assert_called_once_with(task.type, "error", ANY)
+
+    def test_activation_measured(self, zeebe_worker, task, job_from_task, metrics):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker._get_jobs = MagicMock(return_value=[job_from_task] * 2)
+
+        zeebe_worker._handle_jobs(task)
+
+        metrics.jobs_activated.assert_called_once_with(task.type, 2, ANY)
+        assert metrics.job_queued.call_count == 2
+
+    def test_done_job_measured(self, zeebe_worker, task, job_from_task, metrics):
+        zeebe_worker._get_jobs = MagicMock(return_value=[job_from_task])
+
+        zeebe_worker._handle_jobs(task)
+        zeebe_worker.job_executor.shutdown(wait=True)
+
+        metrics.job_done.assert_called_once_with(task.type)
+
+    def test_job_rejected_by_executor_not_left_queued(self, zeebe_worker, task, job_from_task):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+        zeebe_worker.metrics = PrometheusMetrics(registry=registry)
+        zeebe_worker.zeebe_adapter.fail_job_future = MagicMock()
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker.job_executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        zeebe_worker._get_jobs = MagicMock(return_value=[job_from_task])
+
+        zeebe_worker._handle_jobs(task)
+
+        assert registry.get_sample_value("pyzeebe_jobs_queued", {"task_type": task.type}) == 0
+        assert registry.get_sample_value("pyzeebe_jobs_in_flight", {"task_type": task.type}) == 0
+
+
+class TestTracing:
+    @pytest.fixture(autouse=True)
+    def tracing(self, zeebe_worker, task):
+        zeebe_worker.tracing = MagicMock(spec=Tracing)
+        zeebe_worker._complete_job = MagicMock()
+        zeebe_worker._add_task(task)
+        return zeebe_worker.tracing
+
+    def test_job_traced(self, zeebe_worker, task, job_from_task, tracing):
+        task.handler(job_from_task)
+
+        tracing.job_span.assert_called_once_with(job_from_task, task.timeout)
+        tracing.job_finished.assert_called_once_with("completed")
+
+    def test_stages_traced(self, zeebe_worker, task, job_from_task, tracing):
+        task.handler(job_from_task)
+
+        stages = [args[0] for args, _ in tracing.stage_span.call_args_list]
+        assert stages == ["before decorators", "task function", "after decorators", "complete job"]
+
+    def test_failed_job_traced(self, zeebe_worker, task, job_from_task, tracing):
+        task.inner_function.side_effect = Exception()
+        task.exception_handler.side_effect = lambda e, job: job.set_failure_status("failed")
+        job_from_task.zeebe_adapter = MagicMock()
+
+        task.handler(job_from_task)
+
+        tracing.job_finished.assert_called_once_with("failed")
+
 
 class TestWorkerThreads:
     def test_work_thread_start_called(self, zeebe_worker, task):
@@ -185,6 +1044,13 @@ class TestWorkerThreads:
         zeebe_worker.work()
         zeebe_worker.stop()
 
+    def test_stop_worker_with_wait_shuts_down_job_executor(self, zeebe_worker):
+        zeebe_worker.job_executor = MagicMock()
+        zeebe_worker.work()
+        zeebe_worker.stop(wait=True)
+
+        zeebe_worker.job_executor.shutdown.assert_called_with(wait=True)
+
     def test_watch_task_threads_dont_restart_running_threads(
             self, zeebe_worker, task, handle_task_mock, stop_event_mock, handle_not_alive_thread_spy, stop_after_test):
         def fake_task_handler_never_return(*_args):
@@ -229,6 +1095,17 @@ class TestGetJobs:
                                                                     variables_to_fetch=task.variables_to_fetch,
                                                                     request_timeout=zeebe_worker.request_timeout)
 
+    def test_trace_context_fetched(self, zeebe_worker, task):
+        zeebe_worker.zeebe_adapter.activate_jobs = MagicMock()
+        zeebe_worker.tracing = MagicMock(spec=Tracing)
+        task.variables_to_fetch = ["x"]
+
+        zeebe_worker._get_jobs(task)
+
+        zeebe_worker.tracing.get_variables_to_fetch.assert_called_once_with(["x"])
+        _, kwargs = zeebe_worker.zeebe_adapter.activate_jobs.call_args
+        assert kwargs["variables_to_fetch"] == zeebe_worker.tracing.get_variables_to_fetch.return_value
+
 
 class TestIncludeRouter:
     def test_include_router_adds_task(self, zeebe_worker, router, task_type):